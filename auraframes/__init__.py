@@ -19,6 +19,7 @@ from auraframes.exceptions import (
     AuraError,
     AuthenticationError,
     APIError,
+    TransientAPIError,
     ConfigurationError,
     ValidationError,
     NetworkError,
@@ -45,6 +46,7 @@ __all__ = [
     "AuraError",
     "AuthenticationError",
     "APIError",
+    "TransientAPIError",
     "ConfigurationError",
     "ValidationError",
     "NetworkError",
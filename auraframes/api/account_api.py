@@ -1,7 +1,8 @@
 from auraframes.api.base_api import BaseApi
 from auraframes.exceptions import AuthenticationError, APIError, ValidationError
+from auraframes.models.parse import parse_response
 from auraframes.models.user import User
-from auraframes.utils import settings
+from auraframes.utils.settings import get_settings
 from auraframes.utils.validation import validate_email, validate_password, validate_non_empty
 
 
@@ -20,24 +21,22 @@ class AccountApi(BaseApi):
         validate_email(email)
         validate_password(password)
 
+        settings = get_settings()
         login_payload = {
             'user': {
                 'email': email,
                 'password': password
             },
-            'locale': settings.LOCALE,
-            'app_identifier': settings.AURA_APP_IDENTIFIER,
-            'identifier_for_vendor': settings.DEVICE_IDENTIFIER,
-            'client_device_id': settings.DEVICE_IDENTIFIER
+            'app_identifier': settings.app_identifier,
+            **settings.device_payload
         }
 
         json_response = await self._client.post('/login.json', login_payload)
-        if json_response.get('error') or not json_response.get('result'):
-            error_msg = json_response.get('error', 'Login failed')
-            raise AuthenticationError(f"Login failed: {error_msg}")
+        error = json_response.get('error')
+        if error or not (result := json_response.get('result')):
+            raise AuthenticationError(f"Login failed: {error or 'Login failed'}")
 
-        result = json_response.get('result', {})
-        return User(**result.get('current_user', {}))
+        return parse_response(User, result.get('current_user', {}))
 
     async def register(self, email: str, password: str, name: str) -> User:
         """
@@ -58,21 +57,18 @@ class AccountApi(BaseApi):
             'email': email,
             'name': name,
             'password': password,
-            'identifier_for_vendor': settings.DEVICE_IDENTIFIER,
             'smart_suggestions_off': True,
             'auto_upload_off': True,
-            'locale': settings.LOCALE,
-            'client_device_id': settings.DEVICE_IDENTIFIER
+            **get_settings().device_payload
         }
 
         json_response = await self._client.post('/account/register.json', data=register_payload)
 
-        if json_response.get('error') or not json_response.get('result'):
-            error_msg = json_response.get('error', 'Registration failed')
-            raise APIError(f"Registration failed: {error_msg}")
+        error = json_response.get('error')
+        if error or not (result := json_response.get('result')):
+            raise APIError(f"Registration failed: {error or 'Registration failed'}")
 
-        result = json_response.get('result', {})
-        return User(**result.get('current_user', {}))
+        return parse_response(User, result.get('current_user', {}))
 
     async def delete(self) -> bool:
         """
@@ -2,6 +2,7 @@ from auraframes.api.base_api import BaseApi
 
 from auraframes.models.activity import Activity, Comment
 from auraframes.models.asset import Asset, AssetSetting
+from auraframes.models.parse import parse_response, parse_response_list
 from auraframes.models.user import User
 
 
@@ -17,9 +18,9 @@ class ActivityApi(BaseApi):
         """
         json_response = await self._client.get(f'/activities/{activity_id}/comments.json')
         return (
-            [Comment(**json_comment) for json_comment in json_response.get('comments', [])],
+            parse_response_list(Comment, json_response.get('comments', [])),
             json_response.get('new_count', 0),
-            [User(**json_user) for json_user in json_response.get('users', [])]
+            parse_response_list(User, json_response.get('users', []))
         )
 
     async def create_comment(self, activity_id: str, content: str) -> tuple[Activity, Comment]:
@@ -31,7 +32,7 @@ class ActivityApi(BaseApi):
         """
         json_response = await self._client.post(f'/activities/{activity_id}/create_comment.json', data={'content': content})
 
-        return Activity(**json_response.get('activity', {})), Comment(**json_response.get('comment', {}))
+        return parse_response(Activity, json_response.get('activity', {})), parse_response(Comment, json_response.get('comment', {}))
 
     async def remove_comment(self, activity_id: str, comment_id: str):
         """
@@ -43,7 +44,7 @@ class ActivityApi(BaseApi):
         json_response = await self._client.post(f'/activities/{activity_id}/remove_comment.json',
                                           data={'comment_id': comment_id})
 
-        return Activity(**json_response.get('activity', {}))
+        return parse_response(Activity, json_response.get('activity', {}))
 
     async def get_activity_assets(self, activity_id: str, limit: int = 1000, cursor: str | None = None) -> tuple[list[Asset], list[AssetSetting]]:
         """
@@ -59,8 +60,8 @@ class ActivityApi(BaseApi):
         json_response = await self._client.get(f'/activities/{activity_id}/assets.json',
                                          query_params={'limit': limit, 'cursor': cursor})
         return (
-            [Asset(**json_asset) for json_asset in json_response.get('assets', [])],
-            [AssetSetting(**json_asset_setting) for json_asset_setting in json_response.get('asset_settings', [])]
+            parse_response_list(Asset, json_response.get('assets', [])),
+            parse_response_list(AssetSetting, json_response.get('asset_settings', []))
         )
 
     async def post_activity(self, activity_id: str, frame_id: str, data: dict) -> dict:
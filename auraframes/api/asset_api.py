@@ -1,5 +1,6 @@
 from auraframes.api.base_api import BaseApi
 from auraframes.models.asset import Asset, AssetPartialId
+from auraframes.models.parse import parse_response, parse_response_list
 
 
 class AssetApi(BaseApi):
@@ -35,8 +36,7 @@ class AssetApi(BaseApi):
             ]
         })
 
-        return json_response.get('ids', []), [AssetPartialId(**partial_asset_id) for partial_asset_id in
-                                          json_response.get('successes', [])]
+        return json_response.get('ids', []), parse_response_list(AssetPartialId, json_response.get('successes', []))
 
     async def get_asset_by_local_identifier(self, local_id: str):
         """
@@ -47,7 +47,7 @@ class AssetApi(BaseApi):
         json_response = await self._client.get('/assets/asset_for_local_identifier.json',
                                          query_params={'local_identifier': local_id})
 
-        return Asset(**json_response.get('asset', {})), json_response.get('child_albums', []), json_response.get('smart_adds', [])
+        return parse_response(Asset, json_response.get('asset', {})), json_response.get('child_albums', []), json_response.get('smart_adds', [])
 
     async def update_taken_at_date(self, asset: Asset) -> Asset:
         """
@@ -67,7 +67,7 @@ class AssetApi(BaseApi):
             request.update({'id': asset.id})
 
         json_response = await self._client.post('/assets/update_taken_at_date.json', data=request)
-        return Asset(**json_response)
+        return parse_response(Asset, json_response)
 
     async def delete_asset(self, asset: Asset) -> dict:
         """
@@ -106,4 +106,4 @@ class AssetApi(BaseApi):
                 'user_portrait_rect': True
             }))
 
-        return Asset(**json_response.get('asset', {}))
+        return parse_response(Asset, json_response.get('asset', {}))
@@ -1,5 +1,6 @@
 from auraframes.api.base_api import BaseApi
 from auraframes.models.attachment import Attachment
+from auraframes.models.parse import parse_response
 from auraframes.utils.validation import validate_id, validate_caption
 
 
@@ -41,7 +42,7 @@ class AttachmentApi(BaseApi):
             '/attachments.json',
             data=data
         )
-        return Attachment(**json_response.get('attachment', {}))
+        return parse_response(Attachment, json_response.get('attachment', {}))
 
     async def update_caption(self, attachment_id: str, content: str) -> Attachment:
         """
@@ -55,7 +56,7 @@ class AttachmentApi(BaseApi):
             f'/attachments/{attachment_id}.json',
             data={'attachment': {'content': content}}
         )
-        return Attachment(**json_response.get('attachment', json_response))
+        return parse_response(Attachment, json_response.get('attachment', json_response))
 
     async def delete_caption(self, attachment_id: str) -> dict:
         """
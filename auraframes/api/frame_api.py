@@ -1,14 +1,20 @@
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
 
 from auraframes.api.base_api import BaseApi
 from auraframes.exceptions import APIError
 from auraframes.models.activity import Activity
-from auraframes.models.asset import Asset, AssetPartialId
+from auraframes.models.asset import Asset, AssetPage, AssetPartialId
 from pydantic import BaseModel
 
 from auraframes.models.frame import Frame
+from auraframes.models.parse import parse_response, parse_response_json, parse_response_list
 
-from auraframes.utils.dt import get_utc_now, format_dt_to_aura
+from auraframes.utils.dt import format_dt_to_aura, get_utc_now
+
+# Maximum number of assets sent per select/exclude/remove request
+ASSET_BATCH_SIZE = 100
 
 
 class FrameApi(BaseApi):
@@ -19,7 +25,7 @@ class FrameApi(BaseApi):
         :return: List of all frames the active user owns or is collaborating on.
         """
         json_response = await self._client.get('/frames.json')
-        return [Frame(**frame_data) for frame_data in json_response.get('frames', [])]
+        return parse_response_list(Frame, json_response.get('frames', []))
 
     async def get_frame(self, frame_id: str) -> tuple[Frame, int]:
         """
@@ -28,7 +34,7 @@ class FrameApi(BaseApi):
         :return: The hydrated frame and the frame's total asset count.
         """
         json_response = await self._client.get(f'/frames/{frame_id}.json')
-        return Frame(**json_response.get('frame', {})), json_response.get('total_asset_count', 0)
+        return parse_response(Frame, json_response.get('frame', {})), json_response.get('total_asset_count', 0)
 
     async def get_assets(self, frame_id: str, limit: int = 1000, cursor: str | None = None) -> tuple[list[Asset], str | None]:
         """
@@ -40,12 +46,12 @@ class FrameApi(BaseApi):
         :param cursor: The cursor from the previous page.
         :return: List of all the assets, and the next page's cursor (will be `None` if there are no more pages)
         """
-        json_response = await self._client.get(f'/frames/{frame_id}/assets.json',
-                                         query_params={'limit': limit, 'cursor': cursor})
-        if json_response.get('error'):
-            raise APIError(json_response.get('message', 'Unknown error retrieving assets'))
-        assets = [Asset(**asset_data) for asset_data in json_response.get('assets', [])]
-        return assets, json_response.get('next_page_cursor')
+        body = await self._client.get_bytes(f'/frames/{frame_id}/assets.json',
+                                            query_params={'limit': limit, 'cursor': cursor})
+        page = parse_response_json(AssetPage, body)
+        if page.error:
+            raise APIError(page.message or 'Unknown error retrieving assets')
+        return page.assets, page.next_page_cursor
 
     async def get_activities(self, frame_id: str, cursor: str | None = None) -> tuple[list[Activity], str | None]:
         """
@@ -56,22 +62,23 @@ class FrameApi(BaseApi):
         :return: A list of activities and the next page cursor
         """
         json_response = await self._client.get(f'/frames/{frame_id}/activities.json', query_params={'cursor': cursor})
-        return [Activity(**json_activity) for json_activity in
-                json_response.get('activities', [])], json_response.get('next_page_cursor')
+        return parse_response_list(Activity, json_response.get('activities', [])), json_response.get('next_page_cursor')
 
-    async def show_asset(self, frame_id: str, asset_id: str, goto_time: str | None = None) -> bool:
+    async def show_asset(self, frame_id: str, asset_id: str, goto_time: str | datetime | None = None) -> bool:
         """
         Forces the frame to display the asset.
 
         :param frame_id: Frame id to control
         :param asset_id: Asset id to display on the frame
-        :param goto_time: Timestamp for display (defaults to current UTC time)
+        :param goto_time: Timestamp or datetime for display (defaults to current UTC time)
         :return: Boolean describing if the frame was able to process the request
         """
+        goto_time = goto_time or get_utc_now()
         json_response = await self._client.post(f'/frames/{frame_id}/goto.json', data={
             'asset_id': asset_id,
             'frame_id': frame_id,
-            'goto_time': goto_time if goto_time else format_dt_to_aura(get_utc_now()),
+            # Formatted here so the timestamp always has the Aura wire format, including a zero microsecond
+            'goto_time': format_dt_to_aura(goto_time) if isinstance(goto_time, datetime) else goto_time,
             'swipe_direction': 0,
             'impression_id': uuid.uuid4(),
             'select_asset': True
@@ -89,7 +96,7 @@ class FrameApi(BaseApi):
         """
         json_response = await self._client.put(f'/frames/{frame_id}.json',
                                          data={'frame': frame_partial.model_dump(exclude_unset=True)})
-        return Frame(**json_response.get('frame', {}))
+        return parse_response(Frame, json_response.get('frame', {}))
 
     async def select_asset(self, frame_id: str, asset_partial_id: AssetPartialId) -> int:
         """
@@ -99,12 +106,17 @@ class FrameApi(BaseApi):
         :param asset_partial_id: The asset identifier to associate to the frame.
         :return: The number of assets that failed to be associated to the frame.
         """
+        return await self.select_assets(frame_id, [asset_partial_id])
 
-        # Typical use of this endpoint results in a single AssetPartialId being sent per call.
-        json_response = await self._client.post(f'/frames/{frame_id}/select_asset.json',
-                                          data={'assets': [asset_partial_id.to_request_format()]})
+    async def select_assets(self, frame_id: str, asset_partial_ids: Sequence[AssetPartialId]) -> int:
+        """
+        Associates multiple assets to a frame, sending up to `ASSET_BATCH_SIZE` assets per request.
 
-        return json_response.get('number_failed', 0)
+        :param frame_id: Frame id
+        :param asset_partial_ids: The asset identifiers to associate to the frame.
+        :return: The number of assets that failed to be associated to the frame.
+        """
+        return await self._post_asset_batches(f'/frames/{frame_id}/select_asset.json', asset_partial_ids)
 
     async def exclude_asset(self, frame_id: str, asset_partial_id: AssetPartialId) -> int:
         """
@@ -114,12 +126,17 @@ class FrameApi(BaseApi):
         :param asset_partial_id: The asset identifier to remove from the slideshow.
         :return: The number of assets that failed to be excluded from the frame.
         """
+        return await self.exclude_assets(frame_id, [asset_partial_id])
 
-        # Typical use of this endpoint results in a single AssetPartialId being sent per call.
-        json_response = await self._client.post(f'/frames/{frame_id}/exclude_asset',
-                                          data={'assets': [asset_partial_id.to_request_format()]})
+    async def exclude_assets(self, frame_id: str, asset_partial_ids: Sequence[AssetPartialId]) -> int:
+        """
+        Excludes multiple assets from the frame's slideshow, sending up to `ASSET_BATCH_SIZE` assets per request.
 
-        return json_response.get('number_failed', 0)
+        :param frame_id: Frame id
+        :param asset_partial_ids: The asset identifiers to remove from the slideshow.
+        :return: The number of assets that failed to be excluded from the frame.
+        """
+        return await self._post_asset_batches(f'/frames/{frame_id}/exclude_asset', asset_partial_ids)
 
     async def remove_asset(self, frame_id: str, asset_partial_id: AssetPartialId) -> int:
         """
@@ -129,12 +146,34 @@ class FrameApi(BaseApi):
         :param asset_partial_id: The asset identifier to remove from the frame.
         :return: The number of assets that failed to be removed from the frame.
         """
+        return await self.remove_assets(frame_id, [asset_partial_id])
+
+    async def remove_assets(self, frame_id: str, asset_partial_ids: Sequence[AssetPartialId]) -> int:
+        """
+        Disassociates multiple assets from a frame, sending up to `ASSET_BATCH_SIZE` assets per request.
+
+        :param frame_id: Frame id containing the assets.
+        :param asset_partial_ids: The asset identifiers to remove from the frame.
+        :return: The number of assets that failed to be removed from the frame.
+        """
+        return await self._post_asset_batches(f'/frames/{frame_id}/remove_asset.json', asset_partial_ids)
 
-        # Typical use of this endpoint results in a single AssetPartialId being sent per call.
-        json_response = await self._client.post(f'/frames/{frame_id}/remove_asset.json',
-                                          data={'assets': [asset_partial_id.to_request_format()]})
+    async def _post_asset_batches(self, url: str, asset_partial_ids: Sequence[AssetPartialId]) -> int:
+        """
+        Posts asset identifiers to an `{'assets': [...]}` endpoint in chunks of `ASSET_BATCH_SIZE`.
 
-        return json_response.get('number_failed', 0)
+        :param url: Endpoint accepting a list of asset identifiers
+        :param asset_partial_ids: The asset identifiers to send
+        :return: The total number of assets the API reported as failed.
+        """
+        number_failed = 0
+        for start in range(0, len(asset_partial_ids), ASSET_BATCH_SIZE):
+            batch = asset_partial_ids[start:start + ASSET_BATCH_SIZE]
+            json_response = await self._client.post(url, data={
+                'assets': [asset_partial_id.to_request_format() for asset_partial_id in batch]
+            })
+            number_failed += json_response.get('number_failed', 0)
+        return number_failed
 
     async def reconfigure(self, frame_id: str) -> dict:
         """
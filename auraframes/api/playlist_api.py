@@ -1,4 +1,6 @@
 from auraframes.api.base_api import BaseApi
+from auraframes.models.asset import AssetSettingIdsPage
+from auraframes.models.parse import parse_response_json
 
 
 class PlaylistApi(BaseApi):
@@ -14,9 +16,10 @@ class PlaylistApi(BaseApi):
         :param limit: Maximum assets per page (default 1000)
         :param cursor: Pagination cursor
         :return: List of asset IDs and next page cursor
+        :raises APIError: If the response is not valid JSON or has an unexpected shape
         """
-        json_response = await self._client.get(f'/playlists/{playlist_id}/assets.json',
+        body = await self._client.get_bytes(f'/playlists/{playlist_id}/assets.json',
                          query_params={'frame_id': frame_id, 'filter': _filter, 'limit': limit, 'cursor': cursor})
-        # The endpoint returns asset_settings, not full assets
-        asset_ids = [setting['asset_id'] for setting in json_response.get('asset_settings', [])]
-        return asset_ids, json_response.get('next_page_cursor')
+        # The endpoint returns asset_settings, not full assets; only their asset ids are decoded
+        page = parse_response_json(AssetSettingIdsPage, body)
+        return [setting.asset_id for setting in page.asset_settings], page.next_page_cursor
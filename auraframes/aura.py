@@ -1,7 +1,10 @@
+import asyncio
 import os
 import sys
 from collections.abc import Callable
+from functools import lru_cache
 
+import httpx
 from loguru import logger
 
 from auraframes.api.account_api import AccountApi
@@ -12,6 +15,7 @@ from auraframes.api.frame_api import FrameApi
 from auraframes.api.playlist_api import PlaylistApi
 from auraframes.client import Client
 from auraframes.exif import ExifWriter
+from auraframes.export import create_export_client
 from auraframes.models.asset import Asset
 from auraframes.services.caption_service import CaptionService
 from auraframes.services.image_service import ImageService
@@ -19,6 +23,28 @@ from auraframes.utils.io import build_path, write_model
 from auraframes.utils.pagination import paginate
 from auraframes.utils.settings import get_settings
 
+DEBUG_LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+DEFAULT_LOG_FORMAT = "<level>{message}</level>"
+
+
+@lru_cache(maxsize=1)
+def _init_logger(debug: bool) -> None:
+    """Configure logging based on the AURA_DEBUG setting.
+
+    If debug is enabled, DEBUG level logging is shown; otherwise only WARNING and above.
+    Cached so creating further Aura instances doesn't reconfigure loguru unless the setting changes.
+    """
+    logger.remove()
+    if debug:
+        logger.add(sys.stderr, level="DEBUG", format=DEBUG_LOG_FORMAT)
+    else:
+        logger.add(sys.stderr, level="WARNING", format=DEFAULT_LOG_FORMAT)
+
 
 class Aura:
     """
@@ -29,7 +55,7 @@ class Aura:
     """
 
     def __init__(self) -> None:
-        self._init_logger()
+        _init_logger(get_settings().debug)
         self._client = Client()
 
         # Initialize API clients
@@ -41,7 +67,9 @@ class Aura:
         self.playlist_api = PlaylistApi(self._client)
 
         # Initialize services
-        self.exif_writer = ExifWriter()
+        self.exif_writer = ExifWriter(cache_path=get_settings().geocode_cache_path)
+        # Created on first download; see _get_export_client
+        self._export_client: httpx.AsyncClient | None = None
         self.image_service = ImageService(self.exif_writer)
         self.caption_service = CaptionService(
             self._client,
@@ -51,8 +79,22 @@ class Aura:
         )
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP clients and the geocode cache."""
         await self._client.close()
+        if self._export_client is not None:
+            await self._export_client.aclose()
+            self._export_client = None
+        self.exif_writer.close()
+
+    def _get_export_client(self) -> httpx.AsyncClient:
+        """
+        Get this instance's image download client, creating it on first use.
+
+        Each Aura owns its download client, so closing one instance never breaks another instance's export.
+        """
+        if self._export_client is None or self._export_client.is_closed:
+            self._export_client = create_export_client()
+        return self._export_client
 
     async def __aenter__(self) -> "Aura":
         return self
@@ -88,8 +130,13 @@ class Aura:
         return self
 
     async def get_all_assets(self, frame_id: str) -> list[Asset]:
-        """Get all assets from a frame, handling pagination."""
-        return await paginate(self.frame_api.get_assets, frame_id, delay=1.0)
+        """
+        Get all assets from a frame, handling pagination.
+
+        Pages are requested back-to-back; backoff only applies when the API
+        rate limits (429) or fails temporarily (5xx).
+        """
+        return await paginate(self.frame_api.get_assets, frame_id, delay=0)
 
     async def dump_frame(
         self,
@@ -106,20 +153,28 @@ class Aura:
         :param download_images: Whether to download images (default True)
         :param download_activities: Whether to download activities (default True)
         """
-        frame, _ = await self.frame_api.get_frame(frame_id)
+        # Frame, activities and assets are independent, so fetch them concurrently
+        async with asyncio.TaskGroup() as task_group:
+            frame_task = task_group.create_task(self.frame_api.get_frame(frame_id))
+            assets_task = task_group.create_task(self.get_all_assets(frame_id))
+            activities_task = task_group.create_task(
+                self.frame_api.get_activities(frame_id)
+            ) if download_activities else None
+
+        frame, _ = frame_task.result()
+        assets = assets_task.result()
         frame_dir = build_path(path, f'{frame.name}-{frame.id}/')
 
-        write_model(frame, build_path(frame_dir, 'frame.json'))
-
-        if download_activities:
-            activities, _ = await self.frame_api.get_activities(frame.id)
-            write_model(activities, build_path(frame_dir, 'activities.json'))
-
-        assets = await self.get_all_assets(frame_id)
-        write_model(assets, build_path(frame_dir, 'assets.json'))
+        await asyncio.to_thread(write_model, frame, build_path(frame_dir, 'frame.json'))
+        if activities_task:
+            activities, _ = activities_task.result()
+            await asyncio.to_thread(write_model, activities, build_path(frame_dir, 'activities.json'))
+        await asyncio.to_thread(write_model, assets, build_path(frame_dir, 'assets.json'))
 
         if download_images:
-            await self.image_service.download_images(assets, build_path(frame_dir, 'asset_images/'))
+            await self.image_service.download_images(
+                assets, build_path(frame_dir, 'asset_images/'), client=self._get_export_client()
+            )
 
     async def download_images_from_assets(
         self,
@@ -138,7 +193,7 @@ class Aura:
         :return: List of assets that failed to download
         """
         return await self.image_service.download_images(
-            assets, base_path, max_workers, progress_callback
+            assets, base_path, max_workers, progress_callback, client=self._get_export_client()
         )
 
     async def caption_album(
@@ -148,7 +203,7 @@ class Aura:
         caption: str,
         include_date: bool = False,
         progress_callback: Callable[[str, int, int], None] | None = None,
-        max_workers: int = 10
+        max_workers: int = 20
     ) -> int:
         """
         Add the same caption to all photos in an album/playlist.
@@ -159,8 +214,8 @@ class Aura:
         :param caption: Caption text to apply to all photos
         :param include_date: If True, append photo date to caption, e.g. "(March 2025)"
         :param progress_callback: Optional callback(phase, current, total) for progress updates
-            phase: "fetching", "deleting", "captioning"
-        :param max_workers: Number of concurrent workers (default 10, used as semaphore limit)
+            phase: "fetching", "captioning"
+        :param max_workers: Number of concurrent workers (default 20, used as semaphore limit)
         :return: Number of photos captioned
         """
         return await self.caption_service.caption_album(
@@ -172,20 +227,3 @@ class Aura:
             max_workers=max_workers,
             get_all_assets=self.get_all_assets
         )
-
-    def _init_logger(self) -> None:
-        """Configure logging based on AURA_DEBUG environment variable.
-
-        If AURA_DEBUG is set to a truthy value, enables DEBUG level logging.
-        Otherwise, only WARNING and above are shown.
-        """
-        logger.remove()
-        settings = get_settings()
-        level = "DEBUG" if settings.debug else "WARNING"
-        log_format = (
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-            "<level>{message}</level>"
-        ) if settings.debug else "<level>{message}</level>"
-        logger.add(sys.stderr, level=level, format=log_format)
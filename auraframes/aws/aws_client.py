@@ -1,8 +1,11 @@
 """AWS Cognito client for unauthenticated identity pool access."""
+import asyncio
+import time
 from datetime import datetime, timezone
 
 import boto3
 import botocore
+from botocore.client import BaseClient
 
 from loguru import logger
 
@@ -21,40 +24,56 @@ class AWSClient:
         """
         Initialize AWS client with optional Cognito identity pool.
 
-        :param pool_id: Cognito Identity Pool ID (if provided, authenticates immediately)
+        :param pool_id: Cognito Identity Pool ID (if provided, authenticates on first credentials access)
         :param region_name: AWS region (default us-east-1)
         """
         self.region_name = region_name
-        self.cognito = boto3.client('cognito-identity', region_name=self.region_name)
-        self._pool_id: str | None = None
+        self._cognito: BaseClient | None = None
+        self._pool_id: str | None = pool_id
         self._identity_id: str | None = None
         self._credentials: dict | None = None
         self._credentials_expiration: datetime | None = None
+        # Monotonic deadline after which credentials should be refreshed (expiration minus buffer)
+        self._refresh_deadline: float | None = None
+        # Serializes refreshes so concurrent tasks don't each hit Cognito when credentials expire
+        self._refresh_lock = asyncio.Lock()
 
-        if pool_id:
-            self.auth(pool_id)
+    @property
+    def cognito(self) -> BaseClient:
+        """Cognito identity client, created on first use to avoid boto3 setup cost until AWS is needed."""
+        if self._cognito is None:
+            self._cognito = boto3.client('cognito-identity', region_name=self.region_name, config=SESSION_CONFIG)
+        return self._cognito
 
-    def auth(self, pool_id: str) -> None:
+    async def auth(self, pool_id: str) -> None:
         """
         Authenticate with Cognito identity pool and obtain temporary credentials.
 
+        boto3 calls are blocking, so they run in a worker thread to keep the event loop responsive.
+
         :param pool_id: Cognito Identity Pool ID
         """
         self._pool_id = pool_id
-        ident_resp = self.cognito.get_id(IdentityPoolId=pool_id)
+        ident_resp = await asyncio.to_thread(self.cognito.get_id, IdentityPoolId=pool_id)
         self._identity_id = ident_resp['IdentityId']
-        self._refresh_credentials()
+        await self._refresh_credentials()
 
-    def _refresh_credentials(self) -> None:
+    async def _refresh_credentials(self) -> None:
         """Refresh temporary AWS credentials from Cognito."""
         if not self._identity_id:
             raise RuntimeError("Cannot refresh credentials without identity. Call auth() first.")
 
-        logger.debug(f"Refreshing AWS credentials for identity {self._identity_id}")
-        cred_resp = self.cognito.get_credentials_for_identity(IdentityId=self._identity_id)
+        logger.debug("Refreshing AWS credentials for identity {}", self._identity_id)
+        cred_resp = await asyncio.to_thread(self.cognito.get_credentials_for_identity, IdentityId=self._identity_id)
         self._credentials = cred_resp['Credentials']
         self._credentials_expiration = cred_resp['Credentials']['Expiration']
-        logger.debug(f"Credentials refreshed, expires at {self._credentials_expiration}")
+
+        expiration = self._credentials_expiration
+        if expiration.tzinfo is None:
+            expiration = expiration.replace(tzinfo=timezone.utc)
+        time_until_expiry = (expiration - datetime.now(timezone.utc)).total_seconds()
+        self._refresh_deadline = time.monotonic() + time_until_expiry - CREDENTIAL_REFRESH_BUFFER_SECONDS
+        logger.debug("Credentials refreshed, expires at {}", self._credentials_expiration)
 
     def is_credentials_expired(self) -> bool:
         """
@@ -62,31 +81,33 @@ class AWSClient:
 
         :return: True if credentials need refresh
         """
-        if not self._credentials_expiration:
+        if self._refresh_deadline is None:
             return True
 
-        # Refresh if within buffer period of expiration
-        now = datetime.now(timezone.utc)
-        expiration = self._credentials_expiration
-        if expiration.tzinfo is None:
-            expiration = expiration.replace(tzinfo=timezone.utc)
+        # Deadline is computed once per refresh, so this is called cheaply on every credentials access
+        return time.monotonic() >= self._refresh_deadline
 
-        time_until_expiry = (expiration - now).total_seconds()
-        return time_until_expiry < CREDENTIAL_REFRESH_BUFFER_SECONDS
+    async def refresh_if_needed(self) -> None:
+        """Authenticate or refresh credentials if expired or about to expire."""
+        if not self.is_credentials_expired():
+            return
 
-    def refresh_if_needed(self) -> None:
-        """Refresh credentials if expired or about to expire."""
-        if self.is_credentials_expired():
-            self._refresh_credentials()
+        async with self._refresh_lock:
+            # Another task may have refreshed while we waited for the lock
+            if not self.is_credentials_expired():
+                return
+            if self._identity_id is None and self._pool_id:
+                await self.auth(self._pool_id)
+            else:
+                await self._refresh_credentials()
 
-    @property
-    def credentials(self) -> dict:
+    async def get_credentials(self) -> dict:
         """
-        Get current credentials, refreshing if needed.
+        Get current credentials, authenticating or refreshing if needed.
 
         :return: AWS credentials dict with AccessKeyId, SecretKey, SessionToken
         """
-        self.refresh_if_needed()
+        await self.refresh_if_needed()
         if not self._credentials:
             raise RuntimeError("No credentials available. Call auth() first.")
         return self._credentials
@@ -1,23 +1,56 @@
 """S3 client for uploading images to Aura's bucket."""
+import asyncio
 import base64
+import functools
 import hashlib
 import uuid
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 
 import boto3
+import botocore
+from boto3.s3.transfer import TransferConfig
 
-from auraframes.aws.aws_client import AWSClient
+from auraframes.aws.aws_client import AWSClient, SESSION_CONFIG
 from auraframes.exceptions import ConfigurationError
 from auraframes.utils.settings import AWS_UPLOAD_IDENTITY_POOL_ID
 
 BUCKET_KEY = 'images.senseapp.co'
-AWS_UPLOAD_PART_SIZE = 16384
+# Files at or above this size are uploaded as concurrent multipart chunks of the same size
+AWS_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=AWS_UPLOAD_PART_SIZE,
+    multipart_chunksize=AWS_UPLOAD_PART_SIZE,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Dedicated pool so bulk uploads don't compete with other asyncio.to_thread work for the default executor
+UPLOAD_MAX_WORKERS = 16
+UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix='s3-upload')
+# Enough pooled connections for every upload worker plus a multipart transfer, so the shared client's
+# connection pool never makes concurrent uploads wait on each other
+S3_CLIENT_CONFIG = SESSION_CONFIG.merge(
+    botocore.config.Config(max_pool_connections=UPLOAD_MAX_WORKERS + TRANSFER_CONFIG.max_request_concurrency)
+)
 
 
 def get_md5(data: bytes) -> str:
-    """Calculate base64-encoded MD5 hash of data."""
+    """Calculate base64-encoded MD5 hash of data.
+
+    hashlib uses OpenSSL's MD5 and releases the GIL for large buffers, so calls from worker threads hash
+    concurrently on separate cores.
+    """
     return base64.b64encode(hashlib.md5(data).digest()).decode('utf-8')
 
 
+async def _run_upload(func: Callable, /, *args, **kwargs):
+    """Run a blocking boto3 call on the upload executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(UPLOAD_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
 class S3Client(AWSClient):
     """S3 client for uploading images to Aura's image bucket."""
 
@@ -36,29 +69,35 @@ class S3Client(AWSClient):
             )
         self._s3_client = None
         super().__init__(effective_pool_id, region_name)
+        # Serializes client creation so concurrent uploads don't each build a boto3 client
+        self._client_lock = asyncio.Lock()
 
-    def _get_s3_client(self):
+    async def _get_s3_client(self):
         """Get S3 client, recreating if credentials were refreshed."""
-        # Always check credentials and refresh if needed
-        self.refresh_if_needed()
-
-        # Recreate client if credentials changed or not created yet
-        if self._s3_client is None:
-            creds = self.credentials
-            self._s3_client = boto3.client(
-                's3',
-                aws_access_key_id=creds['AccessKeyId'],
-                aws_secret_access_key=creds['SecretKey'],
-                aws_session_token=creds['SessionToken']
-            )
-        return self._s3_client
-
-    def _refresh_credentials(self) -> None:
+        # Fast path: no locking while the client and its credentials are still good
+        if self._s3_client is not None and not self.is_credentials_expired():
+            return self._s3_client
+
+        async with self._client_lock:
+            # Refreshing credentials clears the client, so check again once the refresh is done
+            await self.refresh_if_needed()
+            if self._s3_client is None:
+                creds = await self.get_credentials()
+                self._s3_client = boto3.client(
+                    's3',
+                    aws_access_key_id=creds['AccessKeyId'],
+                    aws_secret_access_key=creds['SecretKey'],
+                    aws_session_token=creds['SessionToken'],
+                    config=S3_CLIENT_CONFIG
+                )
+            return self._s3_client
+
+    async def _refresh_credentials(self) -> None:
         """Override to invalidate S3 client when credentials refresh."""
-        super()._refresh_credentials()
+        await super()._refresh_credentials()
         self._s3_client = None  # Force recreation on next use
 
-    def upload_file(self, data: bytes, extension: str) -> tuple[str, str]:
+    async def upload_file(self, data: bytes, extension: str) -> tuple[str, str]:
         """
         Upload file data to S3.
 
@@ -67,14 +106,35 @@ class S3Client(AWSClient):
         :return: Tuple of (filename, md5_hash)
         """
         filename = f'{str(uuid.uuid4())}{extension}'
-        self._get_s3_client().put_object(Body=data, Bucket=BUCKET_KEY, Key=filename)
-        return filename, get_md5(data)
+        s3_client = await self._get_s3_client()
+        md5 = await asyncio.to_thread(get_md5, data)
+        if len(data) >= AWS_UPLOAD_PART_SIZE:
+            # Large files go through the transfer manager, which uploads parts in parallel and checksums each part
+            await _run_upload(
+                s3_client.upload_fileobj, BytesIO(data), BUCKET_KEY, filename, Config=TRANSFER_CONFIG
+            )
+        else:
+            # Sending the digest lets S3 verify the upload server-side
+            await _run_upload(
+                s3_client.put_object, Body=data, Bucket=BUCKET_KEY, Key=filename, ContentMD5=md5
+            )
+        return filename, md5
+
+    async def upload_files(self, files: Sequence[tuple[bytes, str]]) -> list[tuple[str, str]]:
+        """
+        Upload several files concurrently. Uploads run on `UPLOAD_EXECUTOR` and MD5 hashing in worker threads.
+
+        :param files: Sequence of (file data, file extension) pairs
+        :return: List of (filename, md5_hash) tuples, in the same order as `files`
+        """
+        return list(await asyncio.gather(*(self.upload_file(data, extension) for data, extension in files)))
 
-    def get_file(self, filename: str) -> dict:
+    async def get_file(self, filename: str) -> dict:
         """
         Get file metadata from S3.
 
         :param filename: S3 object key
         :return: S3 head_object response
         """
-        return self._get_s3_client().head_object(Bucket=BUCKET_KEY, Key=filename)
+        s3_client = await self._get_s3_client()
+        return await asyncio.to_thread(s3_client.head_object, Bucket=BUCKET_KEY, Key=filename)
@@ -1,9 +1,10 @@
 """SQS client for receiving frame update messages."""
+import asyncio
 from typing import Any
 
 import boto3
 
-from auraframes.aws.aws_client import AWSClient
+from auraframes.aws.aws_client import AWSClient, SESSION_CONFIG
 from auraframes.exceptions import ConfigurationError
 from auraframes.utils.settings import AWS_SQS_IDENTITY_POOL_ID
 
@@ -25,42 +26,51 @@ class SQSClient(AWSClient):
                 "AWS_SQS_IDENTITY_POOL_ID environment variable is required for SQS operations"
             )
         self._sqs_client = None
+        # Queue URLs are stable per frame, so resolve each one only once
+        self._queue_url_cache: dict[str, str] = {}
         super().__init__(effective_pool_id, region_name)
 
-    def _get_sqs_client(self):
+    async def _get_sqs_client(self):
         """Get SQS client, recreating if credentials were refreshed."""
         # Always check credentials and refresh if needed
-        self.refresh_if_needed()
+        await self.refresh_if_needed()
 
         # Recreate client if credentials changed or not created yet
         if self._sqs_client is None:
-            creds = self.credentials
+            creds = await self.get_credentials()
             self._sqs_client = boto3.client(
                 'sqs',
                 aws_access_key_id=creds['AccessKeyId'],
                 aws_secret_access_key=creds['SecretKey'],
                 aws_session_token=creds['SessionToken'],
-                region_name=self.region_name
+                region_name=self.region_name,
+                config=SESSION_CONFIG
             )
         return self._sqs_client
 
-    def _refresh_credentials(self) -> None:
+    async def _refresh_credentials(self) -> None:
         """Override to invalidate SQS client when credentials refresh."""
-        super()._refresh_credentials()
+        await super()._refresh_credentials()
         self._sqs_client = None  # Force recreation on next use
 
-    def get_queue_url(self, frame_id: str) -> str:
+    async def get_queue_url(self, frame_id: str) -> str:
         """
-        Get the SQS queue URL for a frame.
+        Get the SQS queue URL for a frame. URLs are cached per frame after the first lookup.
 
         :param frame_id: Frame ID
         :return: Queue URL
         """
-        return self._get_sqs_client().get_queue_url(
-            QueueName=f'frame-{frame_id}-client'
-        ).get('QueueUrl')
+        if queue_url := self._queue_url_cache.get(frame_id):
+            return queue_url
 
-    def receive_message(
+        sqs_client = await self._get_sqs_client()
+        response = await asyncio.to_thread(sqs_client.get_queue_url, QueueName=f'frame-{frame_id}-client')
+        queue_url = response.get('QueueUrl')
+        if queue_url:
+            self._queue_url_cache[frame_id] = queue_url
+        return queue_url
+
+    async def receive_message(
         self,
         queue_url: str,
         max_num_messages: int = 10,
@@ -74,9 +84,12 @@ class SQSClient(AWSClient):
         :param wait_time_seconds: Long polling timeout (default 20)
         :return: SQS receive_message response
         """
-        return self._get_sqs_client().receive_message(
+        sqs_client = await self._get_sqs_client()
+        return await asyncio.to_thread(
+            sqs_client.receive_message,
             QueueUrl=queue_url,
             MaxNumberOfMessages=max_num_messages,
             WaitTimeSeconds=wait_time_seconds,
-            AttributeNames=['All']
+            AttributeNames=['All'],
+            MessageAttributeNames=['All']
         )
@@ -1,12 +1,15 @@
 import logging
 from collections import deque
-from typing import Any, Literal
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal, NamedTuple
 
 import httpx
+import orjson
 from httpx import Response, Timeout
 from loguru import logger
 
-from auraframes.exceptions import APIError, NetworkError
+from auraframes.exceptions import APIError, NetworkError, TransientAPIError
 
 # Suppress verbose httpx debug logging
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -16,26 +19,36 @@ AURA_API_BASE_URL = 'https://api.pushd.com'
 AURA_API_VERSION = 'v5'
 USER_AGENT = 'Aura/4.7.790 (Android 30; Client)'
 
-SENSITIVE_HEADERS = {'x-token-auth', 'authorization', 'cookie', 'set-cookie'}
-SENSITIVE_KEYS = {'password', 'token', 'auth_token', 'secret'}
+# Keep connections warm between calls so paginated requests reuse the same TLS session
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+DEFAULT_TIMEOUT = Timeout(timeout=30.0, connect=10.0)
+
+SENSITIVE_HEADERS = frozenset({'x-token-auth', 'authorization', 'cookie', 'set-cookie'})
+SENSITIVE_KEYS = frozenset({'password', 'token', 'auth_token', 'secret'})
 
 HttpMethod = Literal['GET', 'POST', 'PUT', 'DELETE']
 
+# Status codes that indicate the request may succeed if retried later
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Naive datetimes are treated as UTC and serialized with a 'Z' suffix to match the API's format
+JSON_DUMPS_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
 
-def _sanitize_for_logging(data: dict | None, sensitive_keys: set[str] | None = None) -> dict[str, Any] | None:
+
+def _sanitize_for_logging(data: dict | None, sensitive_keys: frozenset[str] | None = None) -> dict[str, Any] | None:
     """Remove sensitive data from dict before logging."""
     if data is None:
         return None
     sensitive_keys = sensitive_keys or SENSITIVE_KEYS
-    result: dict[str, Any] = {}
-    for key, value in data.items():
-        if key.lower() in sensitive_keys:
-            result[key] = '[REDACTED]'
-        elif isinstance(value, dict):
-            result[key] = _sanitize_for_logging(value, sensitive_keys)
-        else:
-            result[key] = value
-    return result
+    # Most payloads have nothing to redact, so hand those back as-is rather than copying them
+    if not any(isinstance(value, dict) or key.lower() in sensitive_keys for key, value in data.items()):
+        return data
+    return {
+        key: '[REDACTED]' if key.lower() in sensitive_keys
+        else _sanitize_for_logging(value, sensitive_keys) if isinstance(value, dict)
+        else value
+        for key, value in data.items()
+    }
 
 
 def _sanitize_headers(headers: dict | None) -> dict | None:
@@ -45,20 +58,55 @@ def _sanitize_headers(headers: dict | None) -> dict | None:
     return {k: '[REDACTED]' if k.lower() in SENSITIVE_HEADERS else v for k, v in headers.items()}
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header (delay in seconds or an HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def _handle_response_error(response: Response) -> None:
     """Check response status and raise appropriate exception."""
     if response.status_code >= 400:
         try:
-            error_body = response.json()
+            error_body = orjson.loads(response.content)
             error_msg = error_body.get('error', response.text)
         except Exception:
             error_msg = response.text
+        if response.status_code in TRANSIENT_STATUS_CODES:
+            raise TransientAPIError(
+                f"HTTP {response.status_code}: {error_msg}",
+                retry_after=_parse_retry_after(response.headers.get('retry-after'))
+            )
         raise APIError(f"HTTP {response.status_code}: {error_msg}")
 
 
+class HistoryEntry(NamedTuple):
+    """Lightweight summary of a completed request, kept instead of the full response."""
+    method: str
+    url: str
+    status_code: int
+    elapsed: timedelta
+
+
 class Client:
 
-    def __init__(self, history_len: int = 30) -> None:
+    def __init__(self, history_len: int = 30, history_full: bool = False) -> None:
+        """
+        :param history_len: Number of recent requests to remember
+        :param history_full: Keep full `Response` objects (including bodies) in history for debugging, instead of
+            lightweight `HistoryEntry` summaries
+        """
         self.http2_client = httpx.AsyncClient(
             http2=True,
             base_url=f'{AURA_API_BASE_URL}/{AURA_API_VERSION}',
@@ -68,9 +116,11 @@ class Client:
                 'user-agent': USER_AGENT,
                 'content-type': 'application/json; charset=utf-8',
             },
-            timeout=Timeout(timeout=20.0)
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS
         )
-        self.history: deque[Response] = deque(maxlen=history_len)
+        self.history: deque[HistoryEntry | Response] = deque(maxlen=history_len)
+        self.history_full = history_full
 
     async def __aenter__(self) -> "Client":
         return self
@@ -81,7 +131,7 @@ class Client:
     async def close(self) -> None:
         await self.http2_client.aclose()
 
-    async def _request(
+    async def _send(
         self,
         method: HttpMethod,
         url: str,
@@ -89,9 +139,9 @@ class Client:
         query_params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         timeout: float | Timeout | None = None
-    ) -> dict[str, Any]:
+    ) -> Response:
         """
-        Make an HTTP request with common error handling and logging.
+        Send an HTTP request with common error handling and logging, without decoding the response body.
 
         :param method: HTTP method (GET, POST, PUT, DELETE)
         :param url: Request URL
@@ -99,20 +149,21 @@ class Client:
         :param query_params: Query parameters
         :param headers: Additional headers
         :param timeout: Optional per-request timeout (seconds or Timeout object)
-        :return: JSON response body
+        :return: The successful response
         :raises NetworkError: On connection/timeout errors
-        :raises APIError: On HTTP errors or non-JSON responses
+        :raises TransientAPIError: On rate limiting (429) or temporary server errors (5xx)
+        :raises APIError: On HTTP errors
         """
         # Filter out None values from query params
         if query_params:
             query_params = {k: v for k, v in query_params.items() if v is not None}
 
-        # Log request with sanitized data
-        logger.debug(
+        # Log request with sanitized data; lazy so sanitizing only happens when a DEBUG sink is active
+        logger.opt(lazy=True).debug(
             f'{method} request to {url}',
-            data=_sanitize_for_logging(data) if data else None,
-            query_params=query_params,
-            headers=_sanitize_headers(headers)
+            data=lambda: _sanitize_for_logging(data) if data else None,
+            query_params=lambda: query_params,
+            headers=lambda: _sanitize_headers(headers)
         )
 
         # Make the request
@@ -122,8 +173,8 @@ class Client:
                 'params': query_params,
                 'headers': headers,
             }
-            if method in ('POST', 'PUT'):
-                request_kwargs['json'] = data
+            if method in ('POST', 'PUT') and data is not None:
+                request_kwargs['content'] = orjson.dumps(data, option=JSON_DUMPS_OPTIONS)
             if timeout is not None:
                 request_kwargs['timeout'] = timeout
 
@@ -133,18 +184,54 @@ class Client:
         except httpx.RequestError as e:
             raise NetworkError(f"Network error: {e}")
 
-        # Track response history
-        self.history.append(response)
+        # Track response history; summaries only by default so response bodies aren't pinned in memory
+        if self.history_full:
+            self.history.append(response)
+        else:
+            self.history.append(
+                HistoryEntry(method, str(response.request.url), response.status_code, response.elapsed)
+            )
 
         # Check for HTTP errors
         _handle_response_error(response)
 
+        return response
+
+    async def _request(
+        self,
+        method: HttpMethod,
+        url: str,
+        data: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | Timeout | None = None
+    ) -> dict[str, Any]:
+        """
+        Make an HTTP request with common error handling and logging.
+
+        :param method: HTTP method (GET, POST, PUT, DELETE)
+        :param url: Request URL
+        :param data: JSON body data (for POST/PUT)
+        :param query_params: Query parameters
+        :param headers: Additional headers
+        :param timeout: Optional per-request timeout (seconds or Timeout object)
+        :return: JSON response body
+        :raises NetworkError: On connection/timeout errors
+        :raises TransientAPIError: On rate limiting (429) or temporary server errors (5xx)
+        :raises APIError: On HTTP errors or non-JSON responses
+        """
+        response = await self._send(method, url, data=data, query_params=query_params, headers=headers,
+                                    timeout=timeout)
+
         # Parse JSON response
         try:
-            json_body = response.json()
-            logger.debug(f'Response ({response.status_code}), body: {json_body}')
-        except Exception:
-            logger.debug(f'Response ({response.status_code}), body: {response.text}')
+            json_body = orjson.loads(response.content)
+            # Lazy so large bodies are only serialized when a DEBUG sink accepts the record
+            logger.opt(lazy=True).debug(
+                'Response ({}), body: {}', lambda: response.status_code, lambda: orjson.dumps(json_body).decode()
+            )
+        except orjson.JSONDecodeError:
+            logger.debug('Response ({}), body: {}', response.status_code, response.text)
             raise APIError(f'Non-JSON response ({response.status_code}): {response.text}')
 
         # Handle cookies
@@ -161,6 +248,23 @@ class Client:
     ) -> dict[str, Any]:
         return await self._request('GET', url, query_params=query_params, headers=headers, timeout=timeout)
 
+    async def get_bytes(
+        self,
+        url: str,
+        query_params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | Timeout | None = None
+    ) -> bytes:
+        """
+        GET a URL and return the raw response body, leaving JSON decoding to the caller.
+
+        Useful for large payloads that are validated straight from bytes (e.g. `model_validate_json`).
+        """
+        response = await self._send('GET', url, query_params=query_params, headers=headers, timeout=timeout)
+        logger.debug('Response ({}), {} bytes', response.status_code, len(response.content))
+        self._set_cookies(response)
+        return response.content
+
     async def post(
         self,
         url: str,
@@ -195,7 +299,7 @@ class Client:
 
     def _set_cookies(self, response: httpx.Response) -> None:
         if len(response.cookies):
-            logger.debug(f'Response Cookies: {response.cookies}')
+            logger.debug('Response Cookies: {}', response.cookies)
 
         for cookie_name, cookie_data in response.cookies.items():
             self.http2_client.cookies.set(cookie_name, cookie_data)
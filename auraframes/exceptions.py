@@ -16,6 +16,18 @@ class APIError(AuraError):
     pass
 
 
+class TransientAPIError(APIError):
+    """Raised when the API is rate limiting or temporarily unavailable (HTTP 429/5xx)."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        """
+        :param message: Error message
+        :param retry_after: Seconds the server asked us to wait before retrying (from `Retry-After`), if given
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class ConfigurationError(AuraError):
     """Raised when required configuration is missing."""
     pass
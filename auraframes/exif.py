@@ -1,17 +1,23 @@
 """EXIF data handling for Aura Frames images."""
+import asyncio
 import io
+import math
 import threading
 from collections import OrderedDict
-from fractions import Fraction
+from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import piexif
 import piexif.helper
 from geopy import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError, GeocoderUnavailable
+from geopy.extra.rate_limiter import RateLimiter
 from loguru import logger
 
 from auraframes.models.asset import Asset
+from auraframes.utils.geocache import GeocodeCache
 
 # Most of the exif writing is from:
 # https://gitlab.com/searchwing/development/payloads/ros-generic/-/blob/master/searchwing_common_py/scripts/ImageSaverNode.py
@@ -19,6 +25,32 @@ from auraframes.models.asset import Asset
 # Maximum cache entries to prevent unbounded memory growth
 MAX_CACHE_SIZE = 1000
 
+# Denominator used for EXIF rationals; GPS seconds are rounded to 5 decimal places so 6 digits is exact
+RATIONAL_PRECISION = 1_000_000
+
+# Minimum seconds between geocoding requests; Nominatim's usage policy allows at most one request per second
+GEOCODE_MIN_DELAY = 1.0
+
+
+# Static EXIF values shared by every written image; piexif.dump deep-copies its input so these are never mutated
+EXIF_OFFSET_TIME = b'-05:00'
+THUMBNAIL_IFD = {
+    piexif.ImageIFD.Make: "Canon",
+    piexif.ImageIFD.XResolution: (40, 1),
+    piexif.ImageIFD.YResolution: (40, 1),
+    piexif.ImageIFD.Software: "piexif"
+}
+
+
+class _GeocodingFailed(Exception):
+    """Raised by `ExifWriter._geocode` when a lookup errors, as opposed to finding no match."""
+
+
+@lru_cache(maxsize=1024)
+def _format_exif_datetime(value: datetime) -> bytes:
+    """Format a datetime as an EXIF timestamp. Cached since assets in an album often share timestamps."""
+    return value.strftime('%Y:%m:%d %H:%M:%S').encode()
+
 
 def build_gps_ifd(location_dms: tuple | None) -> dict:
     """Build GPS IFD dictionary from DMS coordinates."""
@@ -40,34 +72,45 @@ def build_gps_ifd(location_dms: tuple | None) -> dict:
 class ExifWriter:
     """Writer for EXIF metadata to images.
 
-    Includes geocoding for location names with thread-safe caching.
+    Includes geocoding for location names with thread-safe caching, optionally persisted to disk.
     """
 
     def __init__(
         self,
         user_agent: str = "AuraFrames Python Client",
-        max_cache_size: int = MAX_CACHE_SIZE
+        max_cache_size: int = MAX_CACHE_SIZE,
+        cache_path: str | None = None,
+        geocode_min_delay: float = GEOCODE_MIN_DELAY
     ):
         """
         Initialize EXIF writer.
 
         :param user_agent: User agent for Nominatim geocoder
-        :param max_cache_size: Maximum number of geocode results to cache
+        :param max_cache_size: Maximum number of geocode results to cache in memory
+        :param cache_path: Optional SQLite file for caching geocode results across runs
+        :param geocode_min_delay: Minimum seconds between geocoding requests, across all threads
         """
         self._geolocator = Nominatim(user_agent=user_agent)
-        self._cache: OrderedDict[str, tuple] = OrderedDict()
+        # Retries and errors are handled in _geocode, so the limiter only paces requests
+        self._rate_limited_geocode = RateLimiter(
+            self._geolocator.geocode, min_delay_seconds=geocode_min_delay, max_retries=0, swallow_exceptions=False
+        )
+        self._cache: OrderedDict[str, tuple | None] = OrderedDict()
         self._max_cache_size = max_cache_size
         self._cache_lock = threading.Lock()
+        self._disk_cache = GeocodeCache(cache_path) if cache_path else None
 
     def _lookup_gps(self, location_name: str, max_retries: int = 2) -> tuple | None:
         """
         Look up GPS coordinates for a location name.
 
-        Uses thread-safe LRU cache to avoid repeated geocoding requests.
+        Uses a thread-safe in-memory LRU cache, backed by the disk cache when configured,
+        to avoid repeated geocoding requests. Names the geocoder finds no match for are cached in memory too;
+        lookups that fail with an error are not cached, so they are tried again next time.
 
         :param location_name: Location name to geocode
         :param max_retries: Maximum retries on timeout (default 2)
-        :return: Tuple of (longitude_dms, latitude_dms) or None if not found
+        :return: Tuple of (longitude_dms, latitude_dms) or None if not found or on error
         """
         # Check cache first (thread-safe)
         with self._cache_lock:
@@ -76,69 +119,84 @@ class ExifWriter:
                 self._cache.move_to_end(location_name)
                 return self._cache[location_name]
 
-        # Geocode with retry on timeout
+        coordinates = self._disk_cache.get(location_name) if self._disk_cache else None
+        if coordinates is None:
+            try:
+                coordinates = self._geocode(location_name, max_retries)
+            except _GeocodingFailed:
+                return None
+            if coordinates is not None and self._disk_cache:
+                self._disk_cache.set(location_name, *coordinates)
+
+        result = None
+        if coordinates is not None:
+            longitude, latitude = coordinates
+            longitude_dms = convert_to_rational_dms(to_deg(longitude, is_longitude=True))
+            latitude_dms = convert_to_rational_dms(to_deg(latitude, is_longitude=False))
+            result = (longitude_dms, latitude_dms)
+
+        # Add to cache (thread-safe, with LRU eviction)
+        with self._cache_lock:
+            self._cache[location_name] = result
+            # Evict oldest entries if cache is full
+            while len(self._cache) > self._max_cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def _geocode(self, location_name: str, max_retries: int) -> tuple[float, float] | None:
+        """
+        Geocode a location name with Nominatim, retrying on timeout.
+
+        :param location_name: Location name to geocode
+        :param max_retries: Maximum retries on timeout
+        :return: Tuple of (longitude, latitude) or None if not found
+        :raises _GeocodingFailed: If the lookup errors or keeps timing out (already logged)
+        """
         location = None
-        last_error = None
 
         for attempt in range(max_retries + 1):
             try:
-                location = self._geolocator.geocode(location_name)
+                location = self._rate_limited_geocode(location_name)
                 break
-            except GeocoderTimedOut as e:
-                last_error = e
+            except GeocoderTimedOut:
                 if attempt < max_retries:
                     logger.debug(f"Geocoding timeout for '{location_name}', retrying...")
                     continue
                 logger.warning(f"Geocoding timed out for '{location_name}' after {max_retries + 1} attempts")
-                return None
+                raise _GeocodingFailed(location_name)
             except (GeocoderServiceError, GeocoderUnavailable) as e:
                 logger.warning(f"Geocoding service error for '{location_name}': {e}")
-                return None
+                raise _GeocodingFailed(location_name) from e
             except Exception as e:
                 logger.warning(f"Unexpected geocoding error for '{location_name}': {type(e).__name__}: {e}")
-                return None
+                raise _GeocodingFailed(location_name) from e
 
         if not location:
             return None
+        return location.longitude, location.latitude
 
-        longitude_dms = convert_to_rational_dms(to_deg(location.longitude, is_longitude=True))
-        latitude_dms = convert_to_rational_dms(to_deg(location.latitude, is_longitude=False))
-        result = (longitude_dms, latitude_dms)
-
-        # Add to cache (thread-safe, with LRU eviction)
-        with self._cache_lock:
-            self._cache[location_name] = result
-            # Evict oldest entries if cache is full
-            while len(self._cache) > self._max_cache_size:
-                self._cache.popitem(last=False)
+    async def prewarm_locations(self, location_names: Iterable[str | None]) -> None:
+        """
+        Geocode unique location names ahead of EXIF writing, so later lookups hit the cache.
 
-        return result
+        Names are resolved one at a time, paced by the geocoding rate limit.
 
-    def write_exif(
-        self,
-        image: bytes,
-        asset: Asset,
-        thumbnail: bytes | None = None,
-        set_gps_ifd: bool = True
-    ) -> io.BytesIO:
+        :param location_names: Location names to resolve (duplicates and empty names are ignored)
         """
-        Write EXIF metadata to an image.
+        for location_name in dict.fromkeys(name for name in location_names if name):
+            await asyncio.to_thread(self._lookup_gps, location_name)
 
-        :param image: Image data as bytes
-        :param asset: Asset model containing metadata
-        :param thumbnail: Optional thumbnail image bytes
-        :param set_gps_ifd: Whether to add GPS data from location name (default True)
-        :return: BytesIO containing the image with EXIF data
-        """
-        taken_datetime = asset.taken_at_dt.strftime('%Y:%m:%d %H:%M:%S').encode()
+    def _build_exif(self, asset: Asset, thumbnail: bytes | None, set_gps_ifd: bool) -> bytes:
+        """Build the serialized EXIF segment for an asset."""
+        taken_datetime = _format_exif_datetime(asset.taken_at_dt)
 
         exif_dict: dict[str, Any] = {
             "Exif": {
                 piexif.ExifIFD.DateTimeOriginal: taken_datetime,
                 piexif.ExifIFD.DateTimeDigitized: taken_datetime,
-                piexif.ExifIFD.OffsetTime: b'-05:00',
-                piexif.ExifIFD.OffsetTimeOriginal: b'-05:00',
-
+                piexif.ExifIFD.OffsetTime: EXIF_OFFSET_TIME,
+                piexif.ExifIFD.OffsetTimeOriginal: EXIF_OFFSET_TIME,
             },
             '0th': {
                 piexif.ImageIFD.DateTime: taken_datetime,
@@ -152,15 +210,28 @@ class ExifWriter:
 
         if thumbnail:
             exif_dict['thumbnail'] = thumbnail
-            exif_dict['1st'] = {
-                piexif.ImageIFD.Make: "Canon",
-                piexif.ImageIFD.XResolution: (40, 1),
-                piexif.ImageIFD.YResolution: (40, 1),
-                piexif.ImageIFD.Software: "piexif"
-            }
+            exif_dict['1st'] = THUMBNAIL_IFD
+
+        return piexif.dump(exif_dict)
+
+    def write_exif(
+        self,
+        image: bytes,
+        asset: Asset,
+        thumbnail: bytes | None = None,
+        set_gps_ifd: bool = True
+    ) -> io.BytesIO:
+        """
+        Write EXIF metadata to an image.
 
+        :param image: Image data as bytes
+        :param asset: Asset model containing metadata
+        :param thumbnail: Optional thumbnail image bytes
+        :param set_gps_ifd: Whether to add GPS data from location name (default True)
+        :return: BytesIO containing the image with EXIF data
+        """
         new_image = io.BytesIO()
-        exif_bytes = piexif.dump(exif_dict)
+        exif_bytes = self._build_exif(asset, thumbnail, set_gps_ifd)
 
         try:
             piexif.insert(exif_bytes, image, new_image)
@@ -169,16 +240,51 @@ class ExifWriter:
 
         return new_image
 
+    def save_with_exif(
+        self,
+        image: bytes,
+        asset: Asset,
+        path: str,
+        thumbnail: bytes | None = None,
+        set_gps_ifd: bool = True
+    ) -> None:
+        """
+        Write an image with EXIF metadata straight to a file, without an intermediate buffer.
+
+        If the EXIF data can't be inserted, the original image is written unchanged.
+
+        :param image: Image data as bytes
+        :param asset: Asset model containing metadata
+        :param path: Output file path
+        :param thumbnail: Optional thumbnail image bytes
+        :param set_gps_ifd: Whether to add GPS data from location name (default True)
+        """
+        exif_bytes = self._build_exif(asset, thumbnail, set_gps_ifd)
+
+        try:
+            piexif.insert(exif_bytes, image, path)
+        except (ValueError, TypeError, OSError, piexif.InvalidImageDataError) as e:
+            # piexif treats data that isn't JPEG/WebP as a file path, so unsupported formats surface as OSError
+            logger.warning(f'Failed to write EXIF to image: {e}')
+            with open(path, 'wb') as out:
+                out.write(image)
+
     def clear_cache(self) -> None:
         """Clear the geocoding cache."""
         with self._cache_lock:
             self._cache.clear()
 
+    def close(self) -> None:
+        """Close the disk cache, if one is configured."""
+        if self._disk_cache:
+            self._disk_cache.close()
+
 
 def change_to_rational(number: float) -> tuple[int, int]:
-    """Convert a number to a rational tuple (numerator, denominator)."""
-    f = Fraction(str(number))
-    return f.numerator, f.denominator
+    """Convert a number to a reduced rational tuple (numerator, denominator), to 6 decimal places."""
+    numerator = round(number * RATIONAL_PRECISION)
+    divisor = math.gcd(numerator, RATIONAL_PRECISION)
+    return numerator // divisor, RATIONAL_PRECISION // divisor
 
 
 def convert_to_rational_dms(dms: tuple[int, int, float, str]) -> tuple:
@@ -1,5 +1,5 @@
+import asyncio
 import os
-import shutil
 from datetime import datetime
 from io import BytesIO
 
@@ -8,7 +8,46 @@ import httpx
 
 from auraframes.exif import ExifWriter
 from auraframes.models.asset import Asset
-from auraframes.utils import settings
+from auraframes.utils.settings import get_settings
+
+JPEG_SIGNATURE = b'\xff\xd8\xff'
+PNG_SIGNATURE = b'\x89PNG'
+
+SHARED_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+# Original images can be large, so allow slow reads while still failing fast on unreachable hosts
+SHARED_CLIENT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def create_export_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client configured for downloading images."""
+    return httpx.AsyncClient(http2=True, limits=SHARED_CLIENT_LIMITS, timeout=SHARED_CLIENT_TIMEOUT)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the module-wide httpx client used when callers don't pass their own, creating it on first use.
+
+    Reusing one pooled HTTP/2 client across downloads avoids a TCP/TLS handshake per asset. A new client is
+    created if the previous one was closed or belongs to a different event loop.
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = create_export_client()
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared httpx client, if one was created."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
 
 
 def _get_path_safe_datetime(date_str: datetime) -> str:
@@ -25,31 +64,72 @@ async def get_thumbnail(
 
     :param asset: Asset to get thumbnail for
     :param original_image: Optional original image bytes to generate thumbnail from
-    :param client: Optional httpx client for connection reuse
+    :param client: Optional httpx client (defaults to the shared client)
     :return: Thumbnail bytes or None
     """
-    async def _fetch(http_client: httpx.AsyncClient) -> bytes | None:
-        if not asset.thumbnail_url:
-            return None
-        thumbnail_response = await http_client.get(asset.thumbnail_url)
-        thumbnail_bytes = BytesIO(thumbnail_response.content)
+    if not asset.thumbnail_url:
+        return None
+    http_client = client or get_shared_client()
+    thumbnail_response = await http_client.get(asset.thumbnail_url)
+    thumbnail = thumbnail_response.content if thumbnail_response.status_code == 200 else None
+    if thumbnail and _has_image_signature(thumbnail):
+        return thumbnail
+    # Image decoding is CPU-bound, so keep it off the event loop while other downloads are in flight
+    return await asyncio.to_thread(_verify_or_generate_thumbnail, thumbnail, original_image)
+
+
+def _has_image_signature(data: bytes) -> bool:
+    """Cheaply check for JPEG/PNG magic bytes, which covers thumbnails the proxy serves."""
+    return data.startswith(JPEG_SIGNATURE) or data.startswith(PNG_SIGNATURE)
+
+
+def _verify_or_generate_thumbnail(thumbnail: bytes | None, original_image: BytesIO | None) -> bytes | None:
+    """Return the downloaded thumbnail if PIL can verify it, otherwise generate one from the original."""
+    if thumbnail:
         try:
-            with Image.open(thumbnail_bytes) as http_thumbnail:
+            with Image.open(BytesIO(thumbnail)) as http_thumbnail:
                 http_thumbnail.verify()
+            return thumbnail
         except UnidentifiedImageError:
-            if not original_image:
-                return None
-            with Image.open(original_image) as pil_image:
-                out_bytes = BytesIO()
-                pil_image.thumbnail((100, 100))
-                pil_image.save(out_bytes, 'jpeg')
-                return out_bytes.getvalue()
-        return thumbnail_bytes.getvalue()
+            pass
+    if not original_image:
+        return None
+    with Image.open(original_image) as pil_image:
+        out_bytes = BytesIO()
+        pil_image.thumbnail((100, 100))
+        pil_image.save(out_bytes, 'jpeg')
+        return out_bytes.getvalue()
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as in_file:
+        return in_file.read()
 
-    if client:
-        return await _fetch(client)
-    async with httpx.AsyncClient() as new_client:
-        return await _fetch(new_client)
+
+def _save_image(
+    path: str,
+    image: bytes,
+    asset: Asset,
+    exif_writer: ExifWriter | None,
+    thumbnail: bytes | None
+) -> None:
+    """Write an image to disk, embedding EXIF metadata (which may geocode) when a writer is given."""
+    if exif_writer:
+        exif_writer.save_with_exif(image, asset, path, thumbnail)
+    else:
+        with open(path, 'wb') as out:
+            out.write(image)
+
+
+def get_image_path(asset: Asset, path: str) -> str:
+    """
+    Get the file path an asset's image is exported to.
+
+    :param asset: Asset to get the path for
+    :param path: Export directory
+    :return: Path of the exported image file
+    """
+    return os.path.join(path, f'{_get_path_safe_datetime(asset.taken_at_dt)}-{asset.file_name}')
 
 
 async def get_image_from_asset(
@@ -66,32 +146,71 @@ async def get_image_from_asset(
     :param path: Directory path to save the image
     :param exif_writer: Optional EXIF writer for metadata
     :param ignore_cache: Whether to re-download even if file exists
-    :param client: Optional httpx client for connection reuse
+    :param client: Optional httpx client (defaults to the shared client)
     :return: Original image bytes
     """
-    new_filename = os.path.join(path, f'{_get_path_safe_datetime(asset.taken_at_dt)}-{asset.file_name}')
+    new_filename = get_image_path(asset, path)
     if os.path.isfile(new_filename) and not ignore_cache:
-        with open(new_filename, 'rb') as in_file:
-            return in_file.read()
+        return await asyncio.to_thread(_read_file, new_filename)
+    return await _download_image(asset, new_filename, exif_writer, client)
 
-    async def _download(http_client: httpx.AsyncClient) -> bytes:
-        response = await http_client.get(
-            f'{settings.IMAGE_PROXY_BASE_URL}/{asset.user_id}/{asset.file_name}'
-        )
-        return response.content
 
-    if client:
-        original_image_bytes = await _download(client)
-    else:
-        async with httpx.AsyncClient() as new_client:
-            original_image_bytes = await _download(new_client)
+def _get_image_url(asset: Asset) -> str:
+    return f'{get_settings().image_proxy_base_url}/{asset.user_id}/{asset.file_name}'
 
-    if exif_writer:
-        thumbnail = await get_thumbnail(asset, BytesIO(original_image_bytes), client)
-        image = exif_writer.write_exif(original_image_bytes, asset, thumbnail)
-        with open(new_filename, 'wb') as out:
-            shutil.copyfileobj(image, out)
-    else:
-        with open(new_filename, 'wb') as out:
-            out.write(original_image_bytes)
+
+async def fetch_image_from_asset(
+    asset: Asset,
+    exif_writer: ExifWriter | None = None,
+    client: httpx.AsyncClient | None = None
+) -> tuple[bytes, bytes | None]:
+    """
+    Download an asset's original image, plus its thumbnail when an EXIF writer will embed one.
+
+    :param asset: Asset to download image for
+    :param exif_writer: Optional EXIF writer the image will be saved with
+    :param client: Optional httpx client (defaults to the shared client)
+    :return: Tuple of (original image bytes, thumbnail bytes or None)
+    :raises httpx.HTTPStatusError: If the image proxy returns an error status
+    """
+    http_client = client or get_shared_client()
+    response = await http_client.get(_get_image_url(asset))
+    # Never let an error page be saved, where it would later be mistaken for an exported image
+    response.raise_for_status()
+    original_image_bytes = response.content
+
+    thumbnail = await get_thumbnail(asset, BytesIO(original_image_bytes), http_client) if exif_writer else None
+    return original_image_bytes, thumbnail
+
+
+async def write_image_from_asset(
+    asset: Asset,
+    filename: str,
+    image: bytes,
+    exif_writer: ExifWriter | None = None,
+    thumbnail: bytes | None = None
+) -> None:
+    """
+    Save a downloaded image to `filename`, embedding EXIF metadata when a writer is given.
+
+    The write (and any geocoding) runs in a worker thread.
+
+    :param asset: Asset the image belongs to
+    :param filename: Path to save the image to
+    :param image: Original image bytes
+    :param exif_writer: Optional EXIF writer for metadata
+    :param thumbnail: Optional thumbnail to embed alongside the EXIF metadata
+    """
+    await asyncio.to_thread(_save_image, filename, image, asset, exif_writer, thumbnail)
+
+
+async def _download_image(
+    asset: Asset,
+    filename: str,
+    exif_writer: ExifWriter | None,
+    client: httpx.AsyncClient | None
+) -> bytes:
+    """Download an asset's original image and save it to `filename`, returning the original bytes."""
+    original_image_bytes, thumbnail = await fetch_image_from_asset(asset, exif_writer, client)
+    await write_image_from_asset(asset, filename, original_image_bytes, exif_writer, thumbnail)
     return original_image_bytes
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_validator, ValidationInfo
+from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo
 
 from auraframes.models.user import User
 from datetime import datetime
@@ -11,12 +12,21 @@ from auraframes.utils.dt import parse_aura_dt
 
 
 class AssetPadding(BaseModel):
+    # Frozen so identical paddings, which most photos share, can be interned and reused across assets
+    model_config = ConfigDict(frozen=True)
+
     top: float
     right: float
     bottom: float
     left: float
 
 
+@lru_cache(maxsize=1024)
+def _intern_padding(padding: AssetPadding) -> AssetPadding:
+    """Return the first-seen instance equal to `padding`."""
+    return padding
+
+
 class AssetSetting(BaseModel):
     added_by_id: str
     asset_id: str
@@ -31,6 +41,17 @@ class AssetSetting(BaseModel):
     updated_selected_at: str
 
 
+class AssetSettingId(BaseModel):
+    """Just the asset id of an `AssetSetting`."""
+    asset_id: str
+
+
+class AssetSettingIdsPage(BaseModel):
+    """A page from the playlist assets endpoint, keeping only each setting's asset id."""
+    asset_settings: list[AssetSettingId] = Field(default_factory=list)
+    next_page_cursor: str | None = None
+
+
 class Asset(BaseModel):
     auto_landscape_16_10_rect: str | None = None
     auto_portrait_4_5_rect: str | None = None
@@ -104,6 +125,13 @@ class Asset(BaseModel):
     width: int
     attachments: list = Field(default_factory=list)  # Captions and other attachments
 
+    @field_validator(
+        'landscape_16_10_url_padding', 'landscape_url_padding', 'portrait_4_5_url_padding', 'portrait_url_padding'
+    )
+    @classmethod
+    def intern_padding(cls, padding: AssetPadding | None) -> AssetPadding | None:
+        return _intern_padding(padding) if padding is not None else None
+
     @property
     def taken_at_dt(self) -> datetime:
         return parse_aura_dt(self.taken_at)
@@ -113,6 +141,26 @@ class Asset(BaseModel):
         return self.id is None
 
 
+class AssetPage(BaseModel):
+    """A page of assets as returned by the frame assets endpoint."""
+    assets: list[Asset] = Field(default_factory=list)
+    next_page_cursor: str | None = None
+    error: Any = None
+    message: str | None = None
+
+
+class AssetAttachments(BaseModel):
+    """Just an asset's id and attachments, for scanning asset pages without hydrating full `Asset` models."""
+    id: str | None = None
+    attachments: list[dict[str, Any]] | None = None
+
+
+class AssetAttachmentsPage(BaseModel):
+    """A page from the frame assets endpoint, keeping only each asset's attachments."""
+    assets: list[AssetAttachments] = Field(default_factory=list)
+    next_page_cursor: str | None = None
+
+
 class AssetPartialId(BaseModel):
     id: Optional[str] = None
     local_identifier: Optional[str] = None
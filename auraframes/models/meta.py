@@ -1,11 +1,14 @@
+from functools import lru_cache
+
 from pydantic import create_model, BaseModel
 
 
+@lru_cache(maxsize=None)
 def create_partial_model(model: type[BaseModel]) -> type[BaseModel]:
     """Create a version of a model with all fields Optional and defaulting to None.
 
     This is used to create "Partial" versions of models for updates where
-    only some fields may be provided.
+    only some fields may be provided. Each model's Partial is built once, since building it compiles a new schema.
     """
     field_definitions = {}
     for name, field_info in model.model_fields.items():
@@ -0,0 +1,112 @@
+"""Helpers for building models from API responses, optionally skipping validation for trusted responses."""
+import types
+from functools import lru_cache
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from auraframes.exceptions import APIError
+from auraframes.utils.settings import get_settings
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+def _nested_model(annotation: Any) -> tuple[type[BaseModel] | None, bool]:
+    """Find the model type referenced by a field annotation and whether it is a list of that model."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        for arg in get_args(annotation):
+            nested, is_list = _nested_model(arg)
+            if nested is not None:
+                return nested, is_list
+        return None, False
+    if origin is list:
+        args = get_args(annotation)
+        nested, _ = _nested_model(args[0]) if args else (None, False)
+        return nested, nested is not None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(model: type[BaseModel]) -> dict[str, tuple[type[BaseModel], bool]]:
+    """Map each of a model's fields that holds a nested model to (model type, is list), computed once per model."""
+    nested_fields = {}
+    for name, field_info in model.model_fields.items():
+        nested, is_list = _nested_model(field_info.annotation)
+        if nested is not None:
+            nested_fields[name] = (nested, is_list)
+    return nested_fields
+
+
+def construct_model(model: type[ModelT], data: dict[str, Any]) -> ModelT:
+    """Build a model from trusted data without running validation.
+
+    Unlike `BaseModel.model_construct`, nested models (and lists of models) are also constructed so attribute
+    access such as `asset.user.name` keeps working. Values are not coerced, so enum fields keep their raw value.
+    """
+    nested_fields = _nested_fields(model)
+    if not nested_fields:
+        return model.model_construct(**data)
+    values = dict(data)
+    for name, (nested, is_list) in nested_fields.items():
+        value = values.get(name)
+        if is_list and isinstance(value, list):
+            values[name] = [construct_model(nested, item) if isinstance(item, dict) else item for item in value]
+        elif isinstance(value, dict):
+            values[name] = construct_model(nested, value)
+    return model.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[ModelT]) -> TypeAdapter[list[ModelT]]:
+    """Get a cached adapter that validates a list of `model` in a single pydantic-core call."""
+    # The list type is built from a runtime class, which mypy can't express as a static type
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def parse_response(model: type[ModelT], data: dict[str, Any]) -> ModelT:
+    """Build a model from an API response, skipping validation when `AURA_TRUSTED_RESPONSES` is enabled.
+
+    :param model: Model type to build
+    :param data: JSON object from the response
+    :return: The hydrated model
+    """
+    if get_settings().trusted_responses:
+        return construct_model(model, data)
+    return model(**data)
+
+
+def parse_response_list(model: type[ModelT], items: list[dict[str, Any]]) -> list[ModelT]:
+    """Build a list of models from an API response. See `parse_response`.
+
+    :param model: Model type to build
+    :param items: JSON objects from the response
+    :return: The hydrated models
+    """
+    if get_settings().trusted_responses:
+        return [construct_model(model, item) for item in items]
+    return list_adapter(model).validate_python(items)
+
+
+def parse_response_json(model: type[ModelT], body: bytes) -> ModelT:
+    """Build a model straight from a raw JSON response body. See `parse_response`.
+
+    Validation parses the JSON in pydantic-core, skipping the intermediate Python dict.
+
+    :param model: Model type to build
+    :param body: Raw JSON response body
+    :return: The hydrated model
+    :raises APIError: If the body is not JSON or does not match the model
+    """
+    try:
+        if get_settings().trusted_responses:
+            data = orjson.loads(body)
+            if not isinstance(data, dict):
+                raise APIError(f'Invalid {model.__name__} response: expected a JSON object, got {type(data).__name__}')
+            return construct_model(model, data)
+        return model.model_validate_json(body)
+    except (orjson.JSONDecodeError, ValidationError) as e:
+        raise APIError(f'Invalid {model.__name__} response: {e}') from e
@@ -7,9 +7,11 @@ from auraframes.api.attachment_api import AttachmentApi
 from auraframes.api.frame_api import FrameApi
 from auraframes.api.playlist_api import PlaylistApi
 from auraframes.client import Client
-from auraframes.models.asset import Asset
-from auraframes.utils.dt import format_caption_date
+from auraframes.models.asset import Asset, AssetAttachmentsPage
+from auraframes.models.parse import parse_response_json
+from auraframes.utils.dt import format_caption_date_from_aura
 from auraframes.utils.pagination import paginate
+from auraframes.utils.retry import with_retry
 
 
 class CaptionService:
@@ -42,27 +44,39 @@ class CaptionService:
         :param frame_id: Frame ID
         :param asset_ids: Set of asset IDs to get attachments for
         :return: Dict mapping asset_id -> list of attachments
+        :raises APIError: If a page is not valid JSON or has an unexpected shape
         """
         attachments_map: dict[str, list] = {}
+        if not asset_ids:
+            return attachments_map
         cursor = None
 
+        # Unlike iter_pages, the next page isn't prefetched: the scan usually stops early once every requested
+        # asset is found, where a prefetched page would be a wasted request, and each page's own work is only a few
+        # set lookups, so there is little to overlap
         while True:
             params = {'limit': 200}
             if cursor:
                 params['cursor'] = cursor
 
-            response = await self._client.get(f'/frames/{frame_id}/assets.json', query_params=params)
-            assets = response.get('assets', [])
-
-            for asset in assets:
-                aid = asset.get('id')
-                if aid in asset_ids:
-                    attachments_map[aid] = asset.get('attachments', [])
-
-            cursor = response.get('next_page_cursor')
-            if not cursor or len(attachments_map) >= len(asset_ids):
+            # Validating the raw body against a slim model decodes it in one pass and skips building
+            # Python objects for the dozens of asset fields that aren't needed here
+            # No fixed delay between pages; rate limiting (HTTP 429) is handled by backing off and retrying
+            body = await with_retry(self._client.get_bytes, f'/frames/{frame_id}/assets.json', query_params=params)
+            page = parse_response_json(AssetAttachmentsPage, body)
+
+            remaining = len(asset_ids) - len(attachments_map)
+            for asset in page.assets:
+                if asset.id in asset_ids and asset.id not in attachments_map:
+                    attachments_map[asset.id] = asset.attachments or []
+                    remaining -= 1
+                    if not remaining:
+                        # Every requested asset has been seen, so the rest of the page can be skipped
+                        break
+
+            cursor = page.next_page_cursor
+            if not cursor or not remaining:
                 break
-            await asyncio.sleep(0.3)
 
         return attachments_map
 
@@ -73,7 +87,7 @@ class CaptionService:
         caption: str,
         include_date: bool = False,
         progress_callback: Callable[[str, int, int], None] | None = None,
-        max_workers: int = 10,
+        max_workers: int = 20,
         get_all_assets: Callable[[str], Awaitable[list[Asset]]] | None = None
     ) -> int:
         """
@@ -85,8 +99,9 @@ class CaptionService:
         :param caption: Caption text to apply to all photos
         :param include_date: If True, append photo date to caption, e.g. "(March 2025)"
         :param progress_callback: Optional callback(phase, current, total) for progress updates
-            phase: "fetching", "deleting", "captioning"
-        :param max_workers: Number of concurrent workers (default 10, used as semaphore limit)
+            phase: "fetching", "captioning" (each photo's old captions are deleted right before its new caption is
+            created, so "captioning" counts photos whose captions have been replaced)
+        :param max_workers: Number of concurrent workers (default 20, used as semaphore limit)
         :param get_all_assets: Optional callable to get all assets for a frame (needed for include_date)
         :return: Number of photos captioned
         """
@@ -100,18 +115,23 @@ class CaptionService:
         if include_date:
             if get_all_assets is None:
                 raise ValueError("get_all_assets callable is required when include_date is True")
-            assets = await get_all_assets(frame_id)
-            playlist_asset_ids = set(await paginate(
-                self.playlist_api.get_playlist_asset_ids,
-                playlist_id, frame_id,
-                delay=0.5,
-                progress_callback=on_fetch_progress
-            ))
+            # The playlist ids and the frame's assets are independent, so fetch them concurrently
+            async with asyncio.TaskGroup() as task_group:
+                assets_task = task_group.create_task(get_all_assets(frame_id))
+                playlist_ids_task = task_group.create_task(paginate(
+                    self.playlist_api.get_playlist_asset_ids,
+                    playlist_id, frame_id,
+                    delay=0.5,
+                    progress_callback=on_fetch_progress
+                ))
+            playlist_asset_ids = frozenset(playlist_ids_task.result())
             # Filter to only assets in this playlist and build date map
-            for asset in assets:
-                if asset.id in playlist_asset_ids:
-                    date_map[asset.id] = format_caption_date(asset.taken_at_dt)
-            asset_ids = list(date_map.keys())
+            date_map = {
+                asset.id: format_caption_date_from_aura(asset.taken_at)
+                for asset in assets_task.result()
+                if asset.id in playlist_asset_ids
+            }
+            asset_ids = list(date_map)
         else:
             asset_ids = await paginate(
                 self.playlist_api.get_playlist_asset_ids,
@@ -124,49 +144,38 @@ class CaptionService:
         # Pre-fetch all attachments for these assets
         attachments_map = await self.get_asset_attachments_map(frame_id, set(asset_ids))
 
-        # Phase 2: Delete existing captions
-        semaphore = asyncio.Semaphore(max_workers)
-        deleted = 0
+        # Format each dated caption once, outside the concurrency-limited section; photos sharing a month share a string
+        dated_captions = {date: f"{caption} ({date})" for date in set(date_map.values())}
+        captions = {asset_id: dated_captions[date] for asset_id, date in date_map.items()}
 
-        async def delete_one(asset_id: str) -> None:
-            nonlocal deleted
-            async with semaphore:
-                existing = attachments_map.get(asset_id, [])
-                for att in existing:
-                    if att.get('type') == 'caption':
-                        try:
-                            await self.attachment_api.delete_caption(att['id'])
-                        except Exception as e:
-                            logger.debug(f"Failed to delete caption {att.get('id')}: {e}")
-                deleted += 1
-                if progress_callback:
-                    progress_callback("deleting", deleted, total)
-
-        await asyncio.gather(*[delete_one(aid) for aid in asset_ids])
-
-        # Phase 3: Create new captions
+        # Phase 2: replace each asset's captions, deleting existing ones and then creating the new one
+        # back-to-back under a single semaphore slot
+        semaphore = asyncio.Semaphore(max_workers)
         captioned = 0
         failed = 0
 
-        async def caption_one(asset_id: str) -> None:
+        async def replace_one(asset_id: str) -> None:
             nonlocal captioned, failed
+            existing = [att for att in attachments_map.get(asset_id, []) if att.get('type') == 'caption']
             async with semaphore:
+                for att in existing:
+                    try:
+                        await self.attachment_api.delete_caption(att['id'])
+                    except Exception as e:
+                        logger.debug(f"Failed to delete caption {att.get('id')}: {e}")
+
                 try:
-                    # Format caption with date if requested
-                    if include_date and asset_id in date_map:
-                        full_caption = f"{caption} ({date_map[asset_id]})"
-                    else:
-                        full_caption = caption
-                    await self.attachment_api.create_caption(asset_id, frame_id, full_caption)
-                    captioned += 1
+                    await self.attachment_api.create_caption(asset_id, frame_id, captions.get(asset_id, caption))
                 except Exception as e:
                     logger.debug(f"Failed to caption asset {asset_id}: {e}")
                     failed += 1
-                    captioned += 1
+                captioned += 1
                 if progress_callback:
                     progress_callback("captioning", captioned, total)
 
-        await asyncio.gather(*[caption_one(aid) for aid in asset_ids])
+        async with asyncio.TaskGroup() as task_group:
+            for asset_id in asset_ids:
+                task_group.create_task(replace_one(asset_id))
 
         if failed > 0:
             logger.warning(f'Failed to caption {failed}/{total} photos')
@@ -1,11 +1,12 @@
 import asyncio
+import os
 from collections.abc import Callable
 
 import httpx
 from loguru import logger
 
 from auraframes.exif import ExifWriter
-from auraframes.export import get_image_from_asset
+from auraframes.export import fetch_image_from_asset, get_image_path, get_shared_client, write_image_from_asset
 from auraframes.models.asset import Asset
 
 
@@ -25,36 +26,83 @@ class ImageService:
         assets: list[Asset],
         base_path: str,
         max_workers: int = 5,
-        progress_callback: Callable[[int, int, int], None] | None = None
+        progress_callback: Callable[[int, int, int], None] | None = None,
+        client: httpx.AsyncClient | None = None
     ) -> list[Asset]:
         """
         Download images from assets concurrently.
 
+        Downloading and saving run as a pipeline: downloaded images are queued for writer tasks, so network
+        fetches continue while EXIF metadata is written. Already exported images are skipped.
+
         :param assets: List of assets to download
         :param base_path: Directory to save images
-        :param max_workers: Number of concurrent downloads (default 5)
+        :param max_workers: Number of concurrent downloads, and of concurrent writes (default 5)
         :param progress_callback: Optional callback(current, total, failed) for progress
+        :param client: Optional httpx client (defaults to the shared export client, so connections stay warm
+            across calls)
         :return: List of assets that failed to download
         """
         failed_to_retrieve: list[Asset] = []
         completed = 0
         total = len(assets)
         semaphore = asyncio.Semaphore(max_workers)
+        # Downloads are handed to writers through a bounded queue, so the next download starts while the previous
+        # image's EXIF is written. At most max_workers images are downloading or waiting to be queued, max_workers
+        # are queued and max_workers are being written
+        write_queue: asyncio.Queue[tuple[Asset, str, bytes, bytes | None] | None] = asyncio.Queue(maxsize=max_workers)
 
-        async def download_one(asset: Asset, client: httpx.AsyncClient) -> None:
+        def finish(asset: Asset, error: Exception | None = None) -> None:
             nonlocal completed
+            if error is not None:
+                logger.debug(f"Failed to download asset {asset.id}: {error}")
+                failed_to_retrieve.append(asset)
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, len(failed_to_retrieve))
+
+        async def fetch_one(asset: Asset, filename: str, client: httpx.AsyncClient) -> None:
             async with semaphore:
                 try:
-                    await get_image_from_asset(asset, base_path, self.exif_writer, client=client)
+                    image, thumbnail = await fetch_image_from_asset(asset, self.exif_writer, client)
                 except Exception as e:
-                    logger.debug(f"Failed to download asset {asset.id}: {e}")
-                    failed_to_retrieve.append(asset)
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total, len(failed_to_retrieve))
-
-        async with httpx.AsyncClient(timeout=httpx.Timeout(60.0)) as client:
-            await asyncio.gather(*[download_one(asset, client) for asset in assets])
+                    finish(asset, e)
+                    return
+                # Queue while still holding the slot, so a full queue pauses downloads instead of letting every
+                # fetcher hold its image in memory while it waits
+                await write_queue.put((asset, filename, image, thumbnail))
+
+        async def write_worker() -> None:
+            while (item := await write_queue.get()) is not None:
+                asset, filename, image, thumbnail = item
+                try:
+                    await write_image_from_asset(asset, filename, image, self.exif_writer, thumbnail)
+                except Exception as e:
+                    finish(asset, e)
+                else:
+                    finish(asset)
+
+        pending: list[tuple[Asset, str]] = []
+        for asset in assets:
+            filename = get_image_path(asset, base_path)
+            if os.path.isfile(filename):
+                finish(asset)
+            else:
+                pending.append((asset, filename))
+
+        http_client = client or get_shared_client()
+        async with asyncio.TaskGroup() as writers:
+            # Geocode each unique location alongside the downloads, so EXIF writes mostly hit the cache without
+            # holding up the first download behind the geocoding rate limit
+            writers.create_task(self.exif_writer.prewarm_locations([asset.location_name for asset, _ in pending]))
+            for _ in range(max_workers):
+                writers.create_task(write_worker())
+            async with asyncio.TaskGroup() as fetchers:
+                for asset, filename in pending:
+                    fetchers.create_task(fetch_one(asset, filename, http_client))
+            # Every download is queued; one sentinel per writer stops them once the queue drains
+            for _ in range(max_workers):
+                await write_queue.put(None)
 
         if len(failed_to_retrieve) > 0:
             logger.warning(f'Failed to retrieve {len(failed_to_retrieve)}/{total} assets.')
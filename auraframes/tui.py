@@ -1,7 +1,9 @@
 """Textual TUI for Aura Frames album captioning."""
 from __future__ import annotations
 
+import contextlib
 import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from dotenv import load_dotenv
@@ -9,7 +11,9 @@ from rich.markup import escape
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Center, Middle, Horizontal
+from textual.css.query import NoMatches
 from textual.screen import Screen
+from textual.types import NoActiveAppError
 from textual.widgets import (
     Header, Footer, OptionList, Label, Input,
     Button, Switch, ProgressBar, LoadingIndicator
@@ -30,21 +34,41 @@ if TYPE_CHECKING:
 
 load_dotenv()
 
+# Progress screen heading for each caption_album progress phase
+PHASE_LABELS = {
+    "fetching": "Fetching photos...",
+    "captioning": "Replacing captions...",
+}
+
+# Minimum seconds between progress redraws; intermediate updates in between are coalesced into the newest
+PROGRESS_FLUSH_INTERVAL = 0.05
+
+
+# User-facing messages per exception type; subclasses fall back to their nearest listed base class
+_ERROR_FORMATTERS: dict[type[Exception], Callable[[Exception], str]] = {
+    AuthenticationError: lambda e: "Login failed. Please check your email and password.",
+    NetworkError: lambda e: "Network error. Please check your internet connection.",
+    ValidationError: lambda e: f"Invalid input: {e}",
+    ConfigurationError: lambda e: f"Configuration error: {e}",
+    APIError: lambda e: f"API error: {e}",
+}
+
 
 def get_user_friendly_error(e: Exception) -> str:
     """Convert exception to user-friendly message."""
-    if isinstance(e, AuthenticationError):
-        return "Login failed. Please check your email and password."
-    elif isinstance(e, NetworkError):
-        return "Network error. Please check your internet connection."
-    elif isinstance(e, ValidationError):
-        return f"Invalid input: {e}"
-    elif isinstance(e, ConfigurationError):
-        return f"Configuration error: {e}"
-    elif isinstance(e, APIError):
-        return f"API error: {e}"
-    else:
-        return f"Error: {escape(str(e))}"
+    for cls in type(e).__mro__:
+        formatter = _ERROR_FORMATTERS.get(cls)
+        if formatter is not None:
+            return formatter(e)
+    return f"Error: {escape(str(e))}"
+
+
+def playlist_options(playlists: list[dict[str, Any]]) -> list[Option]:
+    """Build option list entries for a frame's playlists/albums."""
+    return [
+        Option(f"{playlist.get('name', 'Unknown')} ({playlist.get('num_assets', 0)} photos)", id=playlist["id"])
+        for playlist in playlists
+    ]
 
 
 class FrameSelectScreen(Screen):
@@ -72,13 +96,14 @@ class FrameSelectScreen(Screen):
         return self.app  # type: ignore[return-value]
 
     def on_mount(self) -> None:
-        option_list = self.query_one("#frame-list", OptionList)
-        for frame in self.aura_app.frames:
-            option_list.add_option(Option(f"{frame.name} ({frame.num_assets} photos)", id=frame.id))
+        # Added in one call so the list is refreshed once rather than per option
+        self.query_one("#frame-list", OptionList).add_options(
+            [Option(f"{frame.name} ({frame.num_assets} photos)", id=frame.id) for frame in self.aura_app.frames]
+        )
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         frame_id = event.option.id
-        self.aura_app.current_frame = next(f for f in self.aura_app.frames if f.id == frame_id)
+        self.aura_app.current_frame = self.aura_app.frames_by_id[frame_id]
         self.aura_app.push_screen(MainMenuScreen())
 
 
@@ -160,10 +185,7 @@ class AlbumListScreen(Screen):
         frame = self.aura_app.current_frame
         playlists = frame.playlists if frame else None
         if playlists:
-            for playlist in playlists:
-                name = playlist.get("name", "Unknown")
-                num_assets = playlist.get("num_assets", 0)
-                option_list.add_option(Option(f"{name} ({num_assets} photos)", id=playlist["id"]))
+            option_list.add_options(playlist_options(playlists))
         else:
             option_list.add_option(Option("No albums found", id="none"))
 
@@ -199,16 +221,11 @@ class AlbumSelectScreen(Screen):
         option_list = self.query_one("#album-list", OptionList)
         frame = self.aura_app.current_frame
         if frame and frame.playlists:
-            for playlist in frame.playlists:
-                name = playlist.get("name", "Unknown")
-                num_assets = playlist.get("num_assets", 0)
-                option_list.add_option(Option(f"{name} ({num_assets} photos)", id=playlist["id"]))
+            option_list.add_options(playlist_options(frame.playlists))
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
-        playlist_id = event.option.id
-        frame = self.aura_app.current_frame
-        if frame and frame.playlists:
-            playlist = next(p for p in frame.playlists if p["id"] == playlist_id)
+        playlist = self.aura_app.playlists_by_id.get(event.option.id)
+        if playlist:
             self.aura_app.selected_album = playlist
             self.aura_app.push_screen(CaptionInputScreen())
 
@@ -282,6 +299,12 @@ class ProgressScreen(Screen):
         self.start_time: float | None = None
         self.completed: bool = False
         self.total_photos: int = 0
+        self._pending_progress: tuple[str, int, int] | None = None
+        self._last_progress_flush: float = 0.0
+        # Detail suffix (" of N") is rebuilt only when the total changes, and the phase label only when the phase does
+        self._detail_total: int = -1
+        self._detail_suffix: str = ""
+        self._shown_phase: str | None = None
 
     @property
     def aura_app(self) -> AuraApp:
@@ -307,33 +330,43 @@ class ProgressScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Progress updates arrive many times a second, so look the widgets up once rather than on every update
+        self._bar = self.query_one("#progress-bar", ProgressBar)
+        self._phase_label = self.query_one("#phase-label", Label)
+        self._detail_label = self.query_one("#progress-detail", Label)
+        self._card = self.query_one(".content-card", Container)
+        self._title = self.query_one("#title", Label)
+        self._done_btn = self.query_one("#done-btn", Button)
         self.start_time = time.time()
         self.run_worker(self.run_captioning(), exclusive=True)
 
     def update_progress(self, phase: str, current: int, total: int) -> None:
         """Update progress display based on phase."""
-        try:
-            bar = self.query_one("#progress-bar", ProgressBar)
-            phase_label = self.query_one("#phase-label", Label)
-            detail_label = self.query_one("#progress-detail", Label)
-
-            if phase == "fetching":
-                phase_label.update("Fetching photos...")
-                if current > 0:
-                    detail_label.update(f"{current} found")
-                else:
-                    detail_label.update("")
-            elif phase == "deleting":
-                self.total_photos = total
-                phase_label.update("Removing old captions...")
-                bar.update(total=total, progress=current)
-                detail_label.update(f"{current} of {total}")
-            elif phase == "captioning":
-                phase_label.update("Adding captions...")
-                bar.update(total=total, progress=current)
-                detail_label.update(f"{current} of {total}")
-        except Exception:
-            pass  # Widget may not exist during shutdown
+        # Widgets may already be gone if the app is shutting down
+        with contextlib.suppress(NoMatches, NoActiveAppError):
+            # Batched so the label and bar changes are drawn in a single repaint
+            with self.app.batch_update():
+                if phase != self._shown_phase and phase in PHASE_LABELS:
+                    self._shown_phase = phase
+                    self._phase_label.update(PHASE_LABELS[phase])
+                if phase == "fetching":
+                    if current > 0:
+                        self._detail_label.update(f"{current} found")
+                    else:
+                        self._detail_label.update("")
+                elif phase == "captioning":
+                    self.total_photos = total
+                    if total != self._detail_total:
+                        self._detail_total = total
+                        self._detail_suffix = f" of {total}"
+                    self._bar.update(total=total, progress=current)
+                    self._detail_label.update(f"{current}{self._detail_suffix}")
+
+    def _flush_progress(self) -> None:
+        """Apply the newest pending progress update, if any."""
+        pending, self._pending_progress = self._pending_progress, None
+        if pending:
+            self.update_progress(*pending)
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable form."""
@@ -345,34 +378,27 @@ class ProgressScreen(Screen):
 
     def show_completion(self, count: int, error: str | None = None) -> None:
         """Show completion status."""
-        try:
-            card = self.query_one(".content-card")
-            title = self.query_one("#title", Label)
-            phase_label = self.query_one("#phase-label", Label)
-            detail_label = self.query_one("#progress-detail", Label)
-            bar = self.query_one("#progress-bar", ProgressBar)
-            done_btn = self.query_one("#done-btn", Button)
-
-            duration = time.time() - self.start_time if self.start_time else 0
-
-            # Hide progress bar
-            bar.display = False
-
-            if error:
-                card.add_class("error-card")
-                title.update("Error")
-                phase_label.update(error)
-                detail_label.update("")
-            else:
-                card.add_class("success-card")
-                title.update("Complete!")
-                phase_label.update(f"{count} photos captioned")
-                detail_label.update(f"Time: {self._format_duration(duration)}")
+        duration = time.time() - self.start_time if self.start_time else 0
+
+        # Widgets may already be gone if the app is shutting down
+        with contextlib.suppress(NoMatches, NoActiveAppError):
+            with self.app.batch_update():
+                # Hide progress bar
+                self._bar.display = False
+
+                if error:
+                    self._card.add_class("error-card")
+                    self._title.update("Error")
+                    self._phase_label.update(error)
+                    self._detail_label.update("")
+                else:
+                    self._card.add_class("success-card")
+                    self._title.update("Complete!")
+                    self._phase_label.update(f"{count} photos captioned")
+                    self._detail_label.update(f"Time: {self._format_duration(duration)}")
 
-            done_btn.disabled = False
+                self._done_btn.disabled = False
             self.completed = True
-        except Exception:
-            pass  # Widget may not exist during shutdown
 
     async def run_captioning(self) -> None:
         album = self.aura_app.selected_album
@@ -380,7 +406,13 @@ class ProgressScreen(Screen):
         aura = self.aura_app.aura
 
         def progress_callback(phase: str, current: int, total: int) -> None:
-            self.aura_app.call_later(self.update_progress, phase, current, total)
+            # Per-photo updates would queue a redraw each; keep only the newest and redraw at most every
+            # PROGRESS_FLUSH_INTERVAL, always showing the final update of a phase straight away
+            self._pending_progress = (phase, current, total)
+            now = time.monotonic()
+            if current == total or now - self._last_progress_flush >= PROGRESS_FLUSH_INTERVAL:
+                self._last_progress_flush = now
+                self.aura_app.call_later(self._flush_progress)
 
         if not album or not frame or not aura:
             self.aura_app.call_later(self.show_completion, 0, "Missing frame or album")
@@ -405,6 +437,11 @@ class ProgressScreen(Screen):
             self.go_to_menu()
 
     def go_to_menu(self) -> None:
+        # Return to the existing main menu instead of composing a new one
+        if any(isinstance(screen, MainMenuScreen) for screen in self.aura_app.screen_stack):
+            while not isinstance(self.aura_app.screen, MainMenuScreen):
+                self.aura_app.pop_screen()
+            return
         while len(self.aura_app.screen_stack) > 1:
             self.aura_app.pop_screen()
         self.aura_app.push_screen(MainMenuScreen())
@@ -413,167 +450,7 @@ class ProgressScreen(Screen):
 class AuraApp(App):
     """Main Textual app for Aura Frames."""
 
-    CSS = """
-    /* ===========================================
-       Aura Frames TUI - Stylesheet
-       =========================================== */
-
-    /* --- Layout --- */
-    #main-container {
-        width: 100%;
-        height: 1fr;
-        align: center middle;
-        padding: 1 2;
-    }
-
-    .content-card {
-        width: 80%;
-        min-width: 60;
-        max-width: 120;
-        height: auto;
-        padding: 2 3;
-        border: round $primary;
-        background: $surface;
-    }
-
-    /* --- Typography --- */
-    #title {
-        text-style: bold;
-        text-align: center;
-        margin-bottom: 2;
-        width: 100%;
-    }
-
-    #frame-name {
-        color: $text-muted;
-        text-style: italic;
-        text-align: center;
-        margin-bottom: 1;
-        width: 100%;
-    }
-
-    /* --- Loading Screen --- */
-    .loading-card {
-        width: auto;
-        min-width: 40;
-        height: auto;
-        padding: 3 5;
-        border: round $primary;
-        background: $surface;
-        align: center middle;
-    }
-
-    #loading-text {
-        text-align: center;
-        color: $text-muted;
-        margin-top: 1;
-        width: 100%;
-    }
-
-    LoadingIndicator {
-        width: 100%;
-        height: 3;
-        color: $primary;
-    }
-
-    /* --- Option Lists --- */
-    OptionList {
-        border: round $border;
-        background: $surface;
-        padding: 1;
-        height: auto;
-        min-height: 5;
-        max-height: 20;
-        margin-bottom: 1;
-        width: 100%;
-    }
-
-    OptionList:focus {
-        border: round $primary;
-    }
-
-    /* --- Progress Bar --- */
-    #progress-bar {
-        width: 100%;
-        margin: 1 0;
-    }
-
-    Bar > .bar--complete {
-        color: $success;
-    }
-
-    #phase-label {
-        text-align: center;
-        color: $text-muted;
-        margin-bottom: 1;
-        width: 100%;
-    }
-
-    #progress-detail {
-        text-align: center;
-        color: $text;
-        width: 100%;
-    }
-
-    /* --- Form Elements --- */
-    Input {
-        border: round $border;
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    Input:focus {
-        border: round $primary;
-    }
-
-    #caption-input {
-        margin-bottom: 1;
-    }
-
-    #date-toggle {
-        height: auto;
-        margin-bottom: 2;
-        align: left middle;
-        width: 100%;
-    }
-
-    #date-toggle Switch {
-        margin-right: 2;
-    }
-
-    #date-toggle Label {
-        color: $text;
-    }
-
-    /* --- Buttons --- */
-    #buttons {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-top: 2;
-    }
-
-    #buttons Button {
-        margin: 0 1;
-        min-width: 16;
-    }
-
-    /* --- Success/Error States --- */
-    .success-card {
-        border: round $success;
-        background: $success 20%;
-    }
-
-    .error-card {
-        border: round $error;
-        background: $error 20%;
-    }
-
-    /* --- Header --- */
-    Header {
-        background: $primary;
-    }
-    """
+    CSS_PATH = "tui.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
@@ -583,9 +460,21 @@ class AuraApp(App):
         super().__init__()
         self.aura: Aura | None = None
         self.frames: list[Frame] = []
-        self.current_frame: Frame | None = None
+        self.frames_by_id: dict[str, Frame] = {}
+        self.playlists_by_id: dict[str, dict[str, Any]] = {}
+        self._current_frame: Frame | None = None
         self.selected_album: dict[str, Any] | None = None
 
+    @property
+    def current_frame(self) -> Frame | None:
+        return self._current_frame
+
+    @current_frame.setter
+    def current_frame(self, frame: Frame | None) -> None:
+        self._current_frame = frame
+        # Index the frame's albums so selecting one is a dict lookup
+        self.playlists_by_id = {playlist["id"]: playlist for playlist in (frame.playlists or [])} if frame else {}
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Center(
@@ -609,6 +498,7 @@ class AuraApp(App):
             self.aura = Aura()
             await self.aura.login()
             self.frames = await self.aura.frame_api.get_frames()
+            self.frames_by_id = {frame.id: frame for frame in self.frames}
 
             if len(self.frames) > 1:
                 self.push_screen(FrameSelectScreen())
@@ -1,9 +1,23 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 
 AURA_DT_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
 
 
+# Assets are re-read (e.g. `Asset.taken_at_dt`) far more often than their timestamps change, and datetimes are
+# immutable, so parsed values are safe to share
+@lru_cache(maxsize=4096)
 def parse_aura_dt(aura_dt_str: str) -> datetime:
+    # The API sends millisecond or microsecond fractions, which fromisoformat parses far faster than strptime;
+    # anything else goes through strptime so the accepted format (and its errors) stay exactly AURA_DT_FORMAT
+    if (
+        len(aura_dt_str) in (24, 27) and aura_dt_str[-1] == 'Z' and aura_dt_str[19] == '.'
+        and aura_dt_str[4] == '-' and aura_dt_str[7] == '-' and aura_dt_str[10] == 'T'
+    ):
+        try:
+            return datetime.fromisoformat(aura_dt_str[:-1])
+        except ValueError:
+            pass
     return datetime.strptime(aura_dt_str, AURA_DT_FORMAT)
 
 
@@ -15,6 +29,27 @@ def format_dt_to_aura(dt: datetime) -> str:
     return dt.strftime(AURA_DT_FORMAT)
 
 
+# English month names for captions; indexing this avoids strftime('%B'), which is slower and follows the C locale
+MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December',
+)
+
+
 def format_caption_date(dt: datetime) -> str:
     """Format datetime for caption display, e.g. 'March 2025'"""
-    return dt.strftime('%B %Y')
+    return f'{MONTH_NAMES[dt.month - 1]} {dt.year}'
+
+
+@lru_cache(maxsize=1024)
+def _format_caption_month(year_month: str) -> str:
+    return format_caption_date(datetime.strptime(year_month, '%Y-%m'))
+
+
+def format_caption_date_from_aura(aura_dt_str: str) -> str:
+    """Format an Aura datetime string for caption display, e.g. 'March 2025'.
+
+    Only the month is shown, so just the 'YYYY-MM' prefix is parsed (once per distinct month) rather than the
+    whole timestamp.
+    """
+    return _format_caption_month(aura_dt_str[:7])
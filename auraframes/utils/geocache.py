@@ -0,0 +1,82 @@
+"""Persistent cache of geocoded location coordinates."""
+import os
+import sqlite3
+import threading
+import time
+
+from loguru import logger
+
+# Place names rarely move, so cached coordinates are kept for 30 days
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+class GeocodeCache:
+    """SQLite-backed cache mapping location names to (longitude, latitude).
+
+    Used as a second-level cache behind ExifWriter's in-memory LRU so repeated exports don't geocode
+    the same locations again across runs. Safe to share between threads.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = GEOCODE_CACHE_TTL_SECONDS):
+        """
+        Open (or create) the cache database.
+
+        :param path: Path to the SQLite database file (`~` is expanded)
+        :param ttl_seconds: Age after which cached coordinates are ignored (default 30 days)
+        """
+        self._path = os.path.expanduser(path)
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        parent_dir = os.path.dirname(self._path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS geocode ('
+            'name TEXT PRIMARY KEY, longitude REAL NOT NULL, latitude REAL NOT NULL, created_at INTEGER NOT NULL)'
+        )
+        self._connection.commit()
+
+    def get(self, name: str) -> tuple[float, float] | None:
+        """
+        Get cached coordinates for a location name.
+
+        :param name: Location name
+        :return: Tuple of (longitude, latitude), or None if missing, expired or the cache can't be read
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    'SELECT longitude, latitude, created_at FROM geocode WHERE name = ?', (name,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            # A locked or corrupt cache shouldn't fail the export; the caller falls back to a live lookup
+            logger.warning(f"Failed to read cached geocode result for '{name}': {e}")
+            return None
+        if row is None or time.time() - row[2] > self._ttl_seconds:
+            return None
+        return row[0], row[1]
+
+    def set(self, name: str, longitude: float, latitude: float) -> None:
+        """
+        Store coordinates for a location name.
+
+        :param name: Location name
+        :param longitude: Decimal longitude
+        :param latitude: Decimal latitude
+        """
+        try:
+            with self._lock:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO geocode (name, longitude, latitude, created_at) VALUES (?, ?, ?, ?)',
+                    (name, longitude, latitude, int(time.time()))
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to cache geocode result for '{name}': {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
@@ -1,10 +1,11 @@
 """File I/O utilities for the Aura Frames client."""
-import json
 import os
 from collections.abc import Sequence
 
+import orjson
 from loguru import logger
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from auraframes.exceptions import AuraError
 
@@ -44,12 +45,13 @@ def write_model(model: BaseModel | Sequence[BaseModel], path: str) -> None:
     :param path: File path to write to
     :raises IOError: If file write fails
     """
+    if isinstance(model, Sequence) and not isinstance(model, BaseModel):
+        model = list(model)
+    # Serialized in one pass by pydantic-core, without building an intermediate dict tree
+    data = to_json(model, indent=2)
     try:
-        with open(path, 'w') as out:
-            if isinstance(model, Sequence) and not isinstance(model, BaseModel):
-                json.dump([m.model_dump(mode='json') for m in model], out, indent=2)
-            else:
-                json.dump(model.model_dump(mode='json'), out, indent=2)
+        with open(path, 'wb') as out:
+            out.write(data)
         logger.debug(f"Wrote model data to {path}")
     except PermissionError as e:
         raise IOError(f"Permission denied writing to '{path}': {e}") from e
@@ -67,13 +69,13 @@ def read_model_json(path: str) -> dict | list:
     :raises ValueError: If JSON is invalid
     """
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError as e:
         raise IOError(f"File not found: '{path}'") from e
     except PermissionError as e:
         raise IOError(f"Permission denied reading '{path}': {e}") from e
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in '{path}': {e}") from e
     except OSError as e:
         raise IOError(f"Failed to read '{path}': {e}") from e
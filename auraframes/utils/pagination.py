@@ -1,65 +1,163 @@
 """Pagination utilities for async API calls."""
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, TypeVar
 
 from loguru import logger
 
-from auraframes.exceptions import NetworkError
-from auraframes.utils.retry import with_retry
+from auraframes.utils.retry import DEFAULT_RETRY_EXCEPTIONS, with_retry
 
 T = TypeVar('T')
 
+# Adaptive pacing: space page requests by this fraction of the recent mean response time, but never closer than
+# MIN_ADAPTIVE_DELAY seconds (and never further apart than the caller's delay)
+ADAPTIVE_DELAY_RTT_FRACTION = 0.25
+MIN_ADAPTIVE_DELAY = 0.05
+RTT_SAMPLE_SIZE = 5
 
-async def paginate(
+
+async def iter_pages(
     fetch_fn: Callable[..., Awaitable[tuple[list[T], str | None]]],
     *args: Any,
     delay: float = 0.5,
-    progress_callback: Callable[[int], None] | None = None,
     max_retries: int = 3,
+    adaptive: bool = True,
     **kwargs: Any
-) -> list[T]:
+) -> AsyncIterator[list[T]]:
     """
-    Generic async pagination helper with retry support.
+    Iterate over pages from a paginated API, prefetching the next page while the caller handles the current one.
 
-    Calls fetch_fn repeatedly until no more pages, collecting all results.
-    Each page fetch is retried with exponential backoff on network errors.
+    As soon as a page arrives, the request for the following page is started in the background, so network
+    latency overlaps with whatever the caller does with the page. `delay` is enforced between the start of
+    consecutive requests rather than added after each one, which keeps the same request rate towards the API.
+    With `adaptive`, the spacing shrinks to a fraction of the recently observed response time when the API is
+    answering quickly, with `delay` as the upper bound.
+    Each page fetch is retried with exponential backoff on network errors and on rate limiting or temporary
+    server errors (HTTP 429/5xx).
 
     :param fetch_fn: Async function that returns (items, next_cursor)
     :param args: Positional arguments to pass to fetch_fn
-    :param delay: Delay between pagination requests (default 0.5s)
-    :param progress_callback: Optional callback(count) called after each page
+    :param delay: Minimum time between the start of consecutive page requests (default 0.5s)
     :param max_retries: Maximum retries per page fetch (default 3)
+    :param adaptive: Scale the spacing to the measured response time, up to `delay` (default True)
     :param kwargs: Keyword arguments to pass to fetch_fn
-    :return: All items from all pages
+    :return: Async iterator yielding each page's items
     :raises NetworkError: If a page fetch fails after all retries
+    :raises TransientAPIError: If the API keeps rate limiting after all retries
     """
-    items: list[T] = []
+    loop = asyncio.get_running_loop()
+    last_request_at = loop.time()
+    rtts: deque[float] = deque(maxlen=RTT_SAMPLE_SIZE)
 
     async def fetch_page(**fetch_kwargs: Any) -> tuple[list[T], str | None]:
-        return await with_retry(
+        started_at = loop.time()
+        page = await with_retry(
             fetch_fn,
             *args,
             max_retries=max_retries,
-            retry_exceptions=(NetworkError, ConnectionError, TimeoutError),
+            retry_exceptions=DEFAULT_RETRY_EXCEPTIONS,
             **{**kwargs, **fetch_kwargs}
         )
+        rtts.append(loop.time() - started_at)
+        return page
+
+    def request_spacing() -> float:
+        if not adaptive or not rtts:
+            return delay
+        mean_rtt = sum(rtts) / len(rtts)
+        return min(delay, max(MIN_ADAPTIVE_DELAY, ADAPTIVE_DELAY_RTT_FRACTION * mean_rtt))
+
+    async def fetch_next_page(cursor: str) -> tuple[list[T], str | None]:
+        nonlocal last_request_at
+        wait = last_request_at + request_spacing() - loop.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        last_request_at = loop.time()
+        return await fetch_page(cursor=cursor)
+
+    next_page: asyncio.Task[tuple[list[T], str | None]] | None = asyncio.create_task(fetch_page())
+    try:
+        while next_page is not None:
+            result, cursor = await next_page
+            next_page = asyncio.create_task(fetch_next_page(cursor)) if cursor else None
+            yield result
+    finally:
+        # Don't leave a prefetch running if the caller stops early or a page fails
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def paginate_iter(
+    fetch_fn: Callable[..., Awaitable[tuple[list[T], str | None]]],
+    *args: Any,
+    delay: float = 0.5,
+    max_retries: int = 3,
+    adaptive: bool = True,
+    **kwargs: Any
+) -> AsyncIterator[T]:
+    """
+    Iterate over individual items from a paginated API as each page arrives.
+
+    Lets callers start working on the first page's items instead of waiting for every page; see `iter_pages`.
+
+    :param fetch_fn: Async function that returns (items, next_cursor)
+    :param args: Positional arguments to pass to fetch_fn
+    :param delay: Minimum time between the start of consecutive page requests (default 0.5s)
+    :param max_retries: Maximum retries per page fetch (default 3)
+    :param adaptive: Scale the spacing to the measured response time, up to `delay` (default True)
+    :param kwargs: Keyword arguments to pass to fetch_fn
+    :return: Async iterator yielding each item
+    :raises NetworkError: If a page fetch fails after all retries
+    :raises TransientAPIError: If the API keeps rate limiting after all retries
+    """
+    pages = iter_pages(fetch_fn, *args, delay=delay, max_retries=max_retries, adaptive=adaptive, **kwargs)
+    try:
+        async for page in pages:
+            for item in page:
+                yield item
+    finally:
+        await pages.aclose()
+
+
+async def paginate(
+    fetch_fn: Callable[..., Awaitable[tuple[list[T], str | None]]],
+    *args: Any,
+    delay: float = 0.5,
+    progress_callback: Callable[[int], None] | None = None,
+    max_retries: int = 3,
+    adaptive: bool = True,
+    **kwargs: Any
+) -> list[T]:
+    """
+    Generic async pagination helper with retry support.
+
+    Collects every page from `iter_pages` into a single list, so the next page is already being fetched while the
+    current one is processed.
+
+    :param fetch_fn: Async function that returns (items, next_cursor)
+    :param args: Positional arguments to pass to fetch_fn
+    :param delay: Minimum time between the start of consecutive page requests (default 0.5s)
+    :param progress_callback: Optional callback(count) called after each page
+    :param max_retries: Maximum retries per page fetch (default 3)
+    :param adaptive: Scale the spacing to the measured response time, up to `delay` (default True)
+    :param kwargs: Keyword arguments to pass to fetch_fn
+    :return: All items from all pages
+    :raises NetworkError: If a page fetch fails after all retries
+    :raises TransientAPIError: If the API keeps rate limiting after all retries
+    """
+    items: list[T] = []
 
     try:
-        result, cursor = await fetch_page()
-        items.extend(result)
-        if progress_callback:
-            progress_callback(len(items))
-
-        while cursor:
-            await asyncio.sleep(delay)
-            result, cursor = await fetch_page(cursor=cursor)
+        async for result in iter_pages(
+            fetch_fn, *args, delay=delay, max_retries=max_retries, adaptive=adaptive, **kwargs
+        ):
             items.extend(result)
             if progress_callback:
                 progress_callback(len(items))
 
     except Exception as e:
-        logger.error(f"Pagination failed after fetching {len(items)} items: {e}")
+        logger.error("Pagination failed after fetching {} items: {}", len(items), e)
         raise
 
     return items
@@ -1,15 +1,22 @@
 """Retry utilities with exponential backoff for async operations."""
 import asyncio
 import functools
+import random
+import weakref
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
 from loguru import logger
 
-from auraframes.exceptions import NetworkError
+from auraframes.exceptions import NetworkError, TransientAPIError
 
 T = TypeVar('T')
 
+# Exceptions that indicate a transient failure worth retrying
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    NetworkError, TransientAPIError, ConnectionError, TimeoutError
+)
+
 
 async def with_retry(
     fn: Callable[..., Awaitable[T]],
@@ -17,18 +24,28 @@ async def with_retry(
     max_retries: int = 3,
     backoff_factor: float = 1.5,
     initial_delay: float = 0.5,
-    retry_exceptions: tuple[type[Exception], ...] = (NetworkError, ConnectionError, TimeoutError),
+    max_delay: float = 30.0,
+    retry_exceptions: tuple[type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS,
+    semaphore: asyncio.Semaphore | None = None,
     **kwargs: Any
 ) -> T:
     """
     Execute an async function with retry and exponential backoff.
 
+    Each wait is drawn uniformly between zero and the current backoff delay ("full jitter"), so concurrent
+    callers that failed together don't all retry at the same moment. If the exception carries a `retry_after` hint
+    (e.g. from a 429's `Retry-After` header), that wait, capped at `max_delay`, is used instead and the backoff delay
+    is left unchanged.
+
     :param fn: Async function to execute
     :param args: Positional arguments to pass to fn
     :param max_retries: Maximum number of retry attempts (default 3)
     :param backoff_factor: Multiplier for delay between retries (default 1.5)
     :param initial_delay: Initial delay in seconds (default 0.5)
+    :param max_delay: Upper bound on the delay between retries in seconds (default 30)
     :param retry_exceptions: Tuple of exception types to retry on
+    :param semaphore: Optional semaphore shared between callers, held only while an attempt is running so a burst of
+        retries after an outage is limited to its concurrency; it is released while waiting between attempts
     :param kwargs: Keyword arguments to pass to fn
     :return: Result of fn
     :raises: The last exception if all retries fail
@@ -38,20 +55,26 @@ async def with_retry(
 
     for attempt in range(max_retries + 1):
         try:
-            return await fn(*args, **kwargs)
+            if semaphore is None:
+                return await fn(*args, **kwargs)
+            async with semaphore:
+                return await fn(*args, **kwargs)
         except retry_exceptions as e:
             last_exception = e
             if attempt < max_retries:
+                retry_after = getattr(e, 'retry_after', None)
+                # A server hint is honoured up to max_delay, so a large Retry-After can't stall the caller for hours
+                sleep_for = min(retry_after, max_delay) if retry_after is not None else random.uniform(0, delay)
+                # Formatting is deferred to loguru so it's skipped when no sink accepts warnings
                 logger.warning(
-                    f"Retry {attempt + 1}/{max_retries} for {fn.__name__} "
-                    f"after {type(e).__name__}: {e}. Waiting {delay:.1f}s..."
+                    "Retry {}/{} for {} after {}: {}. Waiting {:.1f}s...",
+                    attempt + 1, max_retries, fn.__name__, type(e).__name__, e, sleep_for
                 )
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
+                await asyncio.sleep(sleep_for)
+                if retry_after is None:
+                    delay = min(delay * backoff_factor, max_delay)
             else:
-                logger.error(
-                    f"All {max_retries} retries failed for {fn.__name__}: {e}"
-                )
+                logger.error("All {} retries failed for {}: {}", max_retries, fn.__name__, e)
 
     # Should never reach here, but satisfy type checker
     if last_exception:
@@ -63,7 +86,9 @@ def retry(
     max_retries: int = 3,
     backoff_factor: float = 1.5,
     initial_delay: float = 0.5,
-    retry_exceptions: tuple[type[Exception], ...] = (NetworkError, ConnectionError, TimeoutError),
+    max_delay: float = 30.0,
+    retry_exceptions: tuple[type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS,
+    concurrency: int | None = None,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """
     Decorator for adding retry with exponential backoff to async functions.
@@ -71,19 +96,36 @@ def retry(
     :param max_retries: Maximum number of retry attempts (default 3)
     :param backoff_factor: Multiplier for delay between retries (default 1.5)
     :param initial_delay: Initial delay in seconds (default 0.5)
+    :param max_delay: Upper bound on the delay between retries in seconds (default 30)
     :param retry_exceptions: Tuple of exception types to retry on
+    :param concurrency: Optional limit on how many calls of the decorated function may be attempting at once, per
+        event loop
     :return: Decorated function
     """
     def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        # Created on first call in each event loop rather than at decoration (usually import) time, since a
+        # semaphore can only be waited on from the loop it was first used in
+        semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
         @functools.wraps(fn)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
+            semaphore = None
+            if concurrency:
+                loop = asyncio.get_running_loop()
+                semaphore = semaphores.get(loop)
+                if semaphore is None:
+                    semaphore = semaphores[loop] = asyncio.Semaphore(concurrency)
             return await with_retry(
                 fn,
                 *args,
                 max_retries=max_retries,
                 backoff_factor=backoff_factor,
                 initial_delay=initial_delay,
+                max_delay=max_delay,
                 retry_exceptions=retry_exceptions,
+                semaphore=semaphore,
                 **kwargs
             )
         return wrapper
@@ -13,10 +13,12 @@ Optional environment variables (with defaults):
 - AURA_DEVICE_IDENTIFIER: Device identifier (default: '0000000000000000')
 - AURA_IMAGE_PROXY_URL: Image proxy base URL (default: 'https://imgproxy.pushd.com')
 - AURA_DEBUG: Enable debug logging (default: false)
+- AURA_TRUSTED_RESPONSES: Skip validation of API responses when building models (default: false)
+- AURA_GEOCODE_CACHE_PATH: SQLite file for caching geocoded locations across runs (default: none)
 - AWS_UPLOAD_IDENTITY_POOL_ID: AWS Cognito pool for S3 uploads (optional)
 - AWS_SQS_IDENTITY_POOL_ID: AWS Cognito pool for SQS (optional)
 """
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,6 +31,7 @@ class Settings(BaseSettings):
         env_file='.env',
         env_file_encoding='utf-8',
         extra='ignore',
+        frozen=True,
     )
 
     # Device emulation settings
@@ -45,6 +48,12 @@ class Settings(BaseSettings):
     # Debug settings
     debug: bool = Field(default=False, alias='AURA_DEBUG')
 
+    # Performance settings
+    trusted_responses: bool = Field(default=False, alias='AURA_TRUSTED_RESPONSES')
+
+    # Export settings
+    geocode_cache_path: str | None = Field(default=None, alias='AURA_GEOCODE_CACHE_PATH')
+
     # AWS Configuration (optional - only needed for upload functionality)
     aws_upload_identity_pool_id: str | None = Field(
         default=None,
@@ -55,6 +64,15 @@ class Settings(BaseSettings):
         alias='AWS_SQS_IDENTITY_POOL_ID'
     )
 
+    @cached_property
+    def device_payload(self) -> dict[str, str]:
+        """Device identification fields shared by login and registration requests, built once per instance."""
+        return {
+            'locale': self.locale,
+            'identifier_for_vendor': self.device_identifier,
+            'client_device_id': self.device_identifier,
+        }
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -89,7 +107,7 @@ def _get_aws_sqs_pool_id() -> str | None:
 
 
 # Legacy module-level constants for backwards compatibility
-# These are evaluated lazily via __getattr__
+# These are resolved via __getattr__ on every access, so they follow get_settings() after a cache_clear()
 _LEGACY_ATTRS = {
     'LOCALE': _get_locale,
     'AURA_APP_IDENTIFIER': _get_app_identifier,
@@ -102,6 +120,7 @@ _LEGACY_ATTRS = {
 
 def __getattr__(name: str):
     """Lazy attribute access for backwards compatibility."""
-    if name in _LEGACY_ATTRS:
-        return _LEGACY_ATTRS[name]()
+    getter = _LEGACY_ATTRS.get(name)
+    if getter is not None:
+        return getter()
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
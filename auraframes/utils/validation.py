@@ -3,8 +3,11 @@ import re
 
 from auraframes.exceptions import ValidationError
 
-# Email validation pattern
-EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+# Email validation pattern; used with fullmatch, which (unlike `$`) also rejects a trailing newline
+EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+# Longest address allowed by RFC 3696 (64-character local part + '@' + 255-character domain)
+MAX_EMAIL_LENGTH = 320
 
 # Default constraints
 DEFAULT_MIN_PASSWORD_LENGTH = 6
@@ -18,7 +21,11 @@ def validate_email(email: str) -> None:
     :param email: Email address to validate
     :raises ValidationError: If email format is invalid
     """
-    if not email or not EMAIL_PATTERN.match(email):
+    # Cheap length and '@' checks first, so obviously invalid input never reaches the regex
+    if (
+        not email or len(email) > MAX_EMAIL_LENGTH or '@' not in email
+        or EMAIL_PATTERN.fullmatch(email) is None
+    ):
         raise ValidationError("Invalid email format")
 
 
@@ -42,7 +49,7 @@ def validate_non_empty(value: str, field_name: str) -> None:
     :param field_name: Name of the field for error messages
     :raises ValidationError: If value is empty or whitespace-only
     """
-    if not value or not value.strip():
+    if not value or value.isspace():
         raise ValidationError(f"{field_name} cannot be empty")
 
 
@@ -68,10 +75,13 @@ def validate_caption(
     :param max_length: Maximum allowed length (default 140)
     :raises ValidationError: If caption is empty or too long
     """
-    if not content or not content.strip():
+    if not content:
         raise ValidationError("Caption cannot be empty")
+    # Length first so oversized captions are rejected without scanning them
     if len(content) > max_length:
         raise ValidationError(f"Caption cannot exceed {max_length} characters")
+    if content.isspace():
+        raise ValidationError("Caption cannot be empty")
 
 
 def validate_string_length(
@@ -1,5 +1,8 @@
 """Shared pytest fixtures for Aura Frames tests."""
+from io import BytesIO
+
 import pytest
+from PIL import Image
 
 
 @pytest.fixture
@@ -190,6 +193,14 @@ def sample_asset_data():
     }
 
 
+@pytest.fixture
+def jpeg_bytes():
+    """A small JPEG image."""
+    out = BytesIO()
+    Image.new('RGB', (200, 200)).save(out, 'jpeg')
+    return out.getvalue()
+
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data as returned by login API."""
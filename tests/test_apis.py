@@ -1,11 +1,18 @@
 """Tests for API classes."""
+import uuid
+from datetime import datetime
+
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from auraframes.api.frame_api import FrameApi
+from auraframes.api.activity_api import ActivityApi
+from auraframes.api.frame_api import FrameApi, ASSET_BATCH_SIZE
 from auraframes.api.playlist_api import PlaylistApi
 from auraframes.api.attachment_api import AttachmentApi
 from auraframes.api.account_api import AccountApi
+from auraframes.exceptions import APIError
+from auraframes.models.asset import AssetPartialId
 
 
 class TestFrameApi:
@@ -19,6 +26,7 @@ class TestFrameApi:
         client.post = AsyncMock()
         client.put = AsyncMock()
         client.delete = AsyncMock()
+        client.get_bytes = AsyncMock()
         return client
 
     @pytest.fixture
@@ -55,10 +63,10 @@ class TestFrameApi:
     @pytest.mark.asyncio
     async def test_get_assets_with_pagination(self, frame_api, mock_client, sample_asset_data):
         """get_assets should handle pagination cursor."""
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [sample_asset_data],
             'next_page_cursor': 'cursor-123'
-        }
+        })
 
         assets, cursor = await frame_api.get_assets('frame-123')
 
@@ -68,16 +76,130 @@ class TestFrameApi:
     @pytest.mark.asyncio
     async def test_get_assets_without_cursor(self, frame_api, mock_client, sample_asset_data):
         """get_assets should return None cursor when no more pages."""
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [sample_asset_data],
             'next_page_cursor': None
-        }
+        })
 
         assets, cursor = await frame_api.get_assets('frame-123')
 
         assert len(assets) == 1
         assert cursor is None
 
+    @pytest.mark.asyncio
+    async def test_get_assets_raises_on_error_body(self, frame_api, mock_client):
+        """get_assets should raise APIError when the body reports an error."""
+        mock_client.get_bytes.return_value = orjson.dumps({'error': True, 'message': 'Frame not found'})
+
+        with pytest.raises(APIError, match='Frame not found'):
+            await frame_api.get_assets('frame-123')
+
+    @pytest.mark.asyncio
+    async def test_get_assets_raises_api_error_on_non_json_body(self, frame_api, mock_client):
+        """get_assets should raise APIError rather than a decode error when the body is not JSON."""
+        mock_client.get_bytes.return_value = b'<html>Bad Gateway</html>'
+
+        with pytest.raises(APIError, match='Invalid AssetPage response'):
+            await frame_api.get_assets('frame-123')
+
+    @pytest.mark.asyncio
+    async def test_show_asset_sends_unique_impression_ids(self, frame_api, mock_client):
+        """show_asset should send a fresh version 4 UUID as the impression id on each call."""
+        mock_client.post.return_value = {'showing': True}
+
+        assert await frame_api.show_asset('frame-123', 'asset-1')
+        await frame_api.show_asset('frame-123', 'asset-1')
+
+        first, second = (call.kwargs['data']['impression_id'] for call in mock_client.post.call_args_list)
+        assert isinstance(first, uuid.UUID)
+        assert first.version == 4
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_show_asset_formats_goto_time(self, frame_api, mock_client):
+        """show_asset should send goto_time in the Aura format, keeping a zero microsecond fraction."""
+        mock_client.post.return_value = {'showing': True}
+
+        await frame_api.show_asset('frame-123', 'asset-1', goto_time=datetime(2025, 1, 1, 12, 0, 0))
+
+        assert mock_client.post.call_args.kwargs['data']['goto_time'] == '2025-01-01T12:00:00.000000Z'
+
+    @pytest.mark.asyncio
+    async def test_select_asset_sends_single_asset(self, frame_api, mock_client):
+        """select_asset should post a single-element assets list."""
+        mock_client.post.return_value = {'number_failed': 0}
+
+        failed = await frame_api.select_asset('frame-123', AssetPartialId(id='asset-1'))
+
+        assert failed == 0
+        mock_client.post.assert_called_once_with(
+            '/frames/frame-123/select_asset.json',
+            data={'assets': [{'asset_id': 'asset-1'}]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_select_assets_batches_requests(self, frame_api, mock_client):
+        """select_assets should chunk identifiers and sum failures across requests."""
+        mock_client.post.return_value = {'number_failed': 1}
+        partial_ids = [AssetPartialId(id=f'asset-{i}') for i in range(ASSET_BATCH_SIZE + 1)]
+
+        failed = await frame_api.select_assets('frame-123', partial_ids)
+
+        assert failed == 2
+        assert mock_client.post.call_count == 2
+        first_batch = mock_client.post.call_args_list[0].kwargs['data']['assets']
+        second_batch = mock_client.post.call_args_list[1].kwargs['data']['assets']
+        assert len(first_batch) == ASSET_BATCH_SIZE
+        assert second_batch == [{'asset_id': f'asset-{ASSET_BATCH_SIZE}'}]
+
+    @pytest.mark.asyncio
+    async def test_remove_assets_empty_list_makes_no_requests(self, frame_api, mock_client):
+        """remove_assets should not call the API when there is nothing to remove."""
+        failed = await frame_api.remove_assets('frame-123', [])
+
+        assert failed == 0
+        mock_client.post.assert_not_called()
+
+
+class TestActivityApi:
+    """Tests for ActivityApi."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock client with async methods."""
+        client = MagicMock()
+        client.get = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def activity_api(self, mock_client):
+        """Create an ActivityApi with mocked client."""
+        return ActivityApi(mock_client)
+
+    @pytest.mark.asyncio
+    async def test_get_comments_returns_comments_and_users(self, activity_api, mock_client, sample_user_data):
+        """get_comments should return comments, the new count and the commenting users."""
+        mock_client.get.return_value = {
+            'comments': [
+                {
+                    'id': 'comment-1', 'content': 'Nice!',
+                    'created_at': '2025-01-01T12:00:00.000Z', 'user_id': 'user-123',
+                },
+                {
+                    'id': 'comment-2', 'content': 'Wow',
+                    'created_at': '2025-01-01T12:01:00.000Z', 'user_id': 'user-123',
+                },
+            ],
+            'new_count': 1,
+            'users': [sample_user_data]
+        }
+
+        comments, new_count, users = await activity_api.get_comments('activity-123')
+
+        assert [comment.id for comment in comments] == ['comment-1', 'comment-2']
+        assert new_count == 1
+        assert users[0].id == 'user-123'
+
 
 class TestPlaylistApi:
     """Tests for the PlaylistApi class."""
@@ -86,7 +208,7 @@ class TestPlaylistApi:
     def mock_client(self):
         """Create a mock client with async methods."""
         client = MagicMock()
-        client.get = AsyncMock()
+        client.get_bytes = AsyncMock()
         return client
 
     @pytest.fixture
@@ -97,14 +219,14 @@ class TestPlaylistApi:
     @pytest.mark.asyncio
     async def test_get_playlist_asset_ids_returns_ids(self, playlist_api, mock_client):
         """get_playlist_asset_ids should return list of asset IDs."""
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'asset_settings': [
-                {'asset_id': 'asset-1'},
-                {'asset_id': 'asset-2'},
-                {'asset_id': 'asset-3'},
+                {'asset_id': 'asset-1', 'hidden': False},
+                {'asset_id': 'asset-2', 'hidden': False},
+                {'asset_id': 'asset-3', 'hidden': True},
             ],
             'next_page_cursor': None
-        }
+        })
 
         asset_ids, cursor = await playlist_api.get_playlist_asset_ids('playlist-123', 'frame-123')
 
@@ -114,10 +236,10 @@ class TestPlaylistApi:
     @pytest.mark.asyncio
     async def test_get_playlist_asset_ids_with_pagination(self, playlist_api, mock_client):
         """get_playlist_asset_ids should handle pagination."""
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'asset_settings': [{'asset_id': 'asset-1'}],
             'next_page_cursor': 'next-cursor'
-        }
+        })
 
         asset_ids, cursor = await playlist_api.get_playlist_asset_ids(
             'playlist-123', 'frame-123', cursor='prev-cursor'
@@ -125,9 +247,17 @@ class TestPlaylistApi:
 
         assert cursor == 'next-cursor'
         # Verify cursor was passed to API
-        call_kwargs = mock_client.get.call_args.kwargs
+        call_kwargs = mock_client.get_bytes.call_args.kwargs
         assert call_kwargs['query_params']['cursor'] == 'prev-cursor'
 
+    @pytest.mark.asyncio
+    async def test_get_playlist_asset_ids_raises_api_error_on_non_json_body(self, playlist_api, mock_client):
+        """get_playlist_asset_ids should raise APIError rather than a validation error on a non-JSON body."""
+        mock_client.get_bytes.return_value = b'<html>Bad Gateway</html>'
+
+        with pytest.raises(APIError, match='Invalid AssetSettingIdsPage response'):
+            await playlist_api.get_playlist_asset_ids('playlist-123', 'frame-123')
+
 
 class TestAttachmentApi:
     """Tests for the AttachmentApi class."""
@@ -225,3 +355,22 @@ class TestAccountApi:
         login_payload = call_args[1]
         assert login_payload['user']['email'] == 'test@example.com'
         assert login_payload['user']['password'] == 'password123'
+
+    @pytest.mark.asyncio
+    async def test_login_sends_device_identifiers(self, account_api, mock_client, sample_user_data):
+        """login should send the configured device identification fields."""
+        from auraframes.utils.settings import get_settings
+
+        mock_client.post.return_value = {
+            'error': False,
+            'result': {'current_user': sample_user_data}
+        }
+
+        await account_api.login('test@example.com', 'password123')
+
+        settings = get_settings()
+        login_payload = mock_client.post.call_args.args[1]
+        assert login_payload['app_identifier'] == settings.app_identifier
+        assert login_payload['locale'] == settings.locale
+        assert login_payload['identifier_for_vendor'] == settings.device_identifier
+        assert login_payload['client_device_id'] == settings.device_identifier
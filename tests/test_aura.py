@@ -18,9 +18,9 @@ class TestAuraCaptionAlbum:
             aura.attachment_api = MagicMock()
             aura.attachment_api.create_caption = AsyncMock()
             aura.attachment_api.delete_caption = AsyncMock()
-            # Mock _client.get for get_asset_attachments_map
+            # Mock _client.get_bytes for get_asset_attachments_map
             aura._client = MagicMock()
-            aura._client.get = AsyncMock(return_value={'assets': [], 'next_page_cursor': None})
+            aura._client.get_bytes = AsyncMock(return_value=b'{"assets": [], "next_page_cursor": null}')
             # Update caption_service to use the mocked APIs
             aura.caption_service.playlist_api = aura.playlist_api
             aura.caption_service.attachment_api = aura.attachment_api
@@ -69,10 +69,9 @@ class TestAuraCaptionAlbum:
             progress_callback=progress_callback
         )
 
-        # Should have calls for fetching, deleting (2), and captioning (2)
+        # Should have calls for fetching and captioning (2)
         phases = [call[0] for call in progress_calls]
         assert 'fetching' in phases
-        assert 'deleting' in phases
         assert 'captioning' in phases
         # Final captioning call should show 2/2
         captioning_calls = [c for c in progress_calls if c[0] == 'captioning']
@@ -162,6 +161,43 @@ class TestAuraGetAllAssets:
         assert assets[1].id == 'asset-2'
 
 
+class TestAuraDumpFrame:
+    """Tests for the dump_frame method."""
+
+    @pytest.fixture
+    def mock_aura(self, sample_frame_data, sample_asset_data):
+        """Create an Aura instance with mocked frame endpoints."""
+        with patch('auraframes.aura.Client'):
+            from auraframes.aura import Aura
+            from auraframes.models.asset import Asset
+            from auraframes.models.frame import Frame
+
+            aura = Aura()
+            aura.frame_api = MagicMock()
+            aura.frame_api.get_frame = AsyncMock(return_value=(Frame(**sample_frame_data), 1))
+            aura.frame_api.get_activities = AsyncMock(return_value=([], None))
+            aura.frame_api.get_assets = AsyncMock(return_value=([Asset(**sample_asset_data)], None))
+            yield aura
+
+    @pytest.mark.asyncio
+    async def test_dump_frame_writes_exports(self, mock_aura, sample_frame_data, tmp_path):
+        """dump_frame should write frame, activities and assets JSON."""
+        await mock_aura.dump_frame('frame-123', str(tmp_path), download_images=False)
+
+        frame_dir = tmp_path / f"{sample_frame_data['name']}-{sample_frame_data['id']}"
+        assert (frame_dir / 'frame.json').exists()
+        assert (frame_dir / 'activities.json').exists()
+        assert (frame_dir / 'assets.json').exists()
+
+    @pytest.mark.asyncio
+    async def test_dump_frame_skips_activities(self, mock_aura, tmp_path):
+        """dump_frame should not fetch activities when disabled."""
+        await mock_aura.dump_frame('frame-123', str(tmp_path), download_images=False, download_activities=False)
+
+        mock_aura.frame_api.get_activities.assert_not_called()
+        assert not list(tmp_path.rglob('activities.json'))
+
+
 class TestAuraLogin:
     """Tests for the login method."""
 
@@ -206,3 +242,56 @@ class TestAuraLogin:
         result = await mock_aura.login('test@example.com', 'password')
 
         assert result is mock_aura
+
+
+class TestAuraClose:
+    """Tests for Aura.close."""
+
+    @pytest.mark.asyncio
+    async def test_close_closes_geocode_cache(self):
+        """close should release the EXIF writer's geocode cache along with the HTTP clients."""
+        with patch('auraframes.aura.Client') as client_cls:
+            from auraframes.aura import Aura
+
+            client_cls.return_value.close = AsyncMock()
+            aura = Aura()
+            aura.exif_writer = MagicMock()
+
+            await aura.close()
+
+        client_cls.return_value.close.assert_awaited_once()
+        aura.exif_writer.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_other_instances_export_client_open(self):
+        """Closing one Aura should not close the download client another Aura is exporting with."""
+        with patch('auraframes.aura.Client') as client_cls:
+            from auraframes.aura import Aura
+
+            client_cls.return_value.close = AsyncMock()
+            first, second = Aura(), Aura()
+            first_client, second_client = first._get_export_client(), second._get_export_client()
+
+            try:
+                await first.close()
+
+                assert first_client.is_closed
+                assert not second_client.is_closed
+            finally:
+                await second.close()
+
+    @pytest.mark.asyncio
+    async def test_downloads_use_instance_export_client(self):
+        """Image downloads should go through the instance's own client."""
+        with patch('auraframes.aura.Client') as client_cls:
+            from auraframes.aura import Aura
+
+            client_cls.return_value.close = AsyncMock()
+            aura = Aura()
+            aura.image_service.download_images = AsyncMock(return_value=[])
+
+            try:
+                await aura.download_images_from_assets([], '/base/path')
+                assert aura.image_service.download_images.call_args.kwargs['client'] is aura._get_export_client()
+            finally:
+                await aura.close()
@@ -0,0 +1,147 @@
+"""Tests for AWS Cognito credential handling."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from auraframes.aws.aws_client import AWSClient
+
+
+@pytest.fixture
+def mock_cognito():
+    """Create a mock Cognito client returning credentials valid for one hour."""
+    cognito = MagicMock()
+    cognito.get_id.return_value = {'IdentityId': 'identity-123'}
+    cognito.get_credentials_for_identity.return_value = {
+        'Credentials': {
+            'AccessKeyId': 'access-key',
+            'SecretKey': 'secret-key',
+            'SessionToken': 'session-token',
+            'Expiration': datetime.now(timezone.utc) + timedelta(hours=1),
+        }
+    }
+    return cognito
+
+
+class TestAWSClient:
+    """Tests for AWSClient."""
+
+    def test_init_does_not_authenticate(self, mock_cognito):
+        """Creating a client should not call Cognito until credentials are needed."""
+        client = AWSClient('pool-123')
+        client._cognito = mock_cognito
+
+        mock_cognito.get_id.assert_not_called()
+        assert client.is_credentials_expired()
+
+    @pytest.mark.asyncio
+    async def test_get_credentials_authenticates_lazily(self, mock_cognito):
+        """First credentials access should authenticate with the configured pool."""
+        client = AWSClient('pool-123')
+        client._cognito = mock_cognito
+
+        credentials = await client.get_credentials()
+
+        assert credentials['AccessKeyId'] == 'access-key'
+        mock_cognito.get_id.assert_called_once_with(IdentityPoolId='pool-123')
+        assert not client.is_credentials_expired()
+
+    @pytest.mark.asyncio
+    async def test_credentials_within_buffer_are_expired(self, mock_cognito):
+        """Credentials expiring inside the refresh buffer should be refreshed."""
+        mock_cognito.get_credentials_for_identity.return_value['Credentials']['Expiration'] = (
+            datetime.now(timezone.utc) + timedelta(minutes=1)
+        )
+        client = AWSClient('pool-123')
+        client._cognito = mock_cognito
+
+        await client.get_credentials()
+
+        assert client.is_credentials_expired()
+
+    @pytest.mark.asyncio
+    async def test_get_credentials_without_pool_raises(self):
+        """Accessing credentials without a pool or auth() should raise."""
+        client = AWSClient()
+
+        with pytest.raises(RuntimeError, match='Call auth\\(\\) first'):
+            await client.get_credentials()
+
+
+class TestS3Client:
+    """Tests for S3Client uploads."""
+
+    @pytest.fixture
+    def s3_client(self, mock_cognito):
+        """Create an S3Client with mocked Cognito and S3 clients."""
+        from auraframes.aws.s3_client import S3Client
+
+        with patch('auraframes.aws.s3_client.boto3') as mock_boto3:
+            client = S3Client('pool-123')
+            client._cognito = mock_cognito
+            client.mock_s3 = mock_boto3.client.return_value
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_upload_files_returns_md5_per_file(self, s3_client):
+        """upload_files should upload each file and return its filename and base64 MD5."""
+        from auraframes.aws.s3_client import get_md5
+
+        results = await s3_client.upload_files([(b'first', '.jpg'), (b'second', '.png')])
+
+        assert [md5 for _, md5 in results] == [get_md5(b'first'), get_md5(b'second')]
+        assert s3_client.mock_s3.put_object.call_count == 2
+        assert results[0][0].endswith('.jpg')
+        assert results[1][0].endswith('.png')
+
+    @pytest.mark.asyncio
+    async def test_upload_file_sends_content_md5(self, s3_client):
+        """upload_file should send the returned MD5 as ContentMD5 so S3 can verify the body."""
+        filename, md5 = await s3_client.upload_file(b'image-bytes', '.jpg')
+
+        put_kwargs = s3_client.mock_s3.put_object.call_args.kwargs
+        assert put_kwargs['ContentMD5'] == md5
+        assert put_kwargs['Key'] == filename
+
+    @pytest.mark.asyncio
+    async def test_upload_file_uses_multipart_for_large_files(self, s3_client):
+        """Files at or above the part size should be uploaded through the transfer manager."""
+        from auraframes.aws.s3_client import AWS_UPLOAD_PART_SIZE, TRANSFER_CONFIG
+
+        await s3_client.upload_file(b'x' * AWS_UPLOAD_PART_SIZE, '.jpg')
+
+        s3_client.mock_s3.put_object.assert_not_called()
+        assert s3_client.mock_s3.upload_fileobj.call_args.kwargs['Config'] is TRANSFER_CONFIG
+
+    @pytest.mark.asyncio
+    async def test_concurrent_uploads_share_one_client(self, s3_client):
+        """Concurrent uploads should create the boto3 S3 client only once."""
+        await s3_client.upload_files([(b'a', '.jpg'), (b'b', '.jpg'), (b'c', '.jpg')])
+
+        from auraframes.aws import s3_client as s3_module
+        assert s3_module.boto3.client.call_count == 1
+
+
+class TestSQSClient:
+    """Tests for SQSClient."""
+
+    @pytest.fixture
+    def sqs_client(self, mock_cognito):
+        """Create an SQSClient with mocked Cognito and SQS clients."""
+        from auraframes.aws.sqs_client import SQSClient
+
+        with patch('auraframes.aws.sqs_client.boto3') as mock_boto3:
+            client = SQSClient('pool-123')
+            client._cognito = mock_cognito
+            client.mock_sqs = mock_boto3.client.return_value
+            client.mock_sqs.get_queue_url.return_value = {'QueueUrl': 'https://sqs/frame-123-client'}
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_get_queue_url_is_cached(self, sqs_client):
+        """Queue URLs should only be looked up once per frame."""
+        first = await sqs_client.get_queue_url('frame-123')
+        second = await sqs_client.get_queue_url('frame-123')
+
+        assert first == second == 'https://sqs/frame-123-client'
+        sqs_client.mock_sqs.get_queue_url.assert_called_once_with(QueueName='frame-frame-123-client')
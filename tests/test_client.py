@@ -1,9 +1,14 @@
 """Tests for the HTTP client."""
+import json
+import uuid
+from datetime import datetime, timezone
+
 import pytest
 import respx
 from httpx import Response
 
-from auraframes.client import Client, AURA_API_BASE_URL, AURA_API_VERSION
+from auraframes.client import Client, HistoryEntry, AURA_API_BASE_URL, AURA_API_VERSION
+from auraframes.exceptions import APIError, TransientAPIError
 
 
 BASE_URL = f'{AURA_API_BASE_URL}/{AURA_API_VERSION}'
@@ -62,6 +67,25 @@ class TestClient:
         request = route.calls.last.request
         assert b'test@test.com' in request.content
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_post_serializes_uuid_and_datetime(self):
+        """POST bodies should serialize UUIDs and datetimes natively."""
+        route = respx.post(f'{BASE_URL}/goto.json').mock(
+            return_value=Response(200, json={'showing': True})
+        )
+        impression_id = uuid.uuid4()
+
+        client = Client()
+        await client.post('/goto.json', data={
+            'impression_id': impression_id,
+            'goto_time': datetime(2025, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc),
+        })
+
+        body = json.loads(route.calls.last.request.content)
+        assert body['impression_id'] == str(impression_id)
+        assert body['goto_time'] == '2025-01-01T12:00:00.500000Z'
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_add_default_headers(self):
@@ -98,6 +122,32 @@ class TestClient:
         assert 'frame_id=frame-123' in str(request.url)
         assert 'limit=100' in str(request.url)
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_history_records_summaries(self):
+        """History should keep lightweight summaries rather than full responses by default."""
+        respx.get(f'{BASE_URL}/frames.json').mock(return_value=Response(200, json={'frames': []}))
+
+        client = Client()
+        await client.get('/frames.json')
+
+        entry = client.history[-1]
+        assert isinstance(entry, HistoryEntry)
+        assert entry.method == 'GET'
+        assert entry.url == f'{BASE_URL}/frames.json'
+        assert entry.status_code == 200
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_history_full_keeps_responses(self):
+        """history_full should keep the full response objects."""
+        respx.get(f'{BASE_URL}/frames.json').mock(return_value=Response(200, json={'frames': []}))
+
+        client = Client(history_full=True)
+        await client.get('/frames.json')
+
+        assert isinstance(client.history[-1], Response)
+
 
 class TestClientErrorHandling:
     """Tests for client error handling."""
@@ -116,3 +166,90 @@ class TestClientErrorHandling:
             await client.post('/test.json', data={})
 
         assert 'Non-JSON response' in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_rate_limit_raises_transient_error(self):
+        """HTTP 429 responses should raise a retryable TransientAPIError."""
+        respx.get(f'{BASE_URL}/frames.json').mock(
+            return_value=Response(429, json={'error': 'Too many requests'})
+        )
+
+        client = Client()
+
+        with pytest.raises(TransientAPIError, match='Too many requests'):
+            await client.get('/frames.json')
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_rate_limit_carries_retry_after(self):
+        """The Retry-After header should be exposed on the TransientAPIError."""
+        respx.get(f'{BASE_URL}/frames.json').mock(
+            return_value=Response(429, json={'error': 'Too many requests'}, headers={'Retry-After': '30'})
+        )
+
+        client = Client()
+
+        with pytest.raises(TransientAPIError) as exc_info:
+            await client.get('/frames.json')
+
+        assert exc_info.value.retry_after == 30.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_client_error_raises_api_error(self):
+        """HTTP 4xx responses other than 429 should not be treated as transient."""
+        respx.get(f'{BASE_URL}/frames.json').mock(
+            return_value=Response(404, json={'error': 'Not found'})
+        )
+
+        client = Client()
+
+        with pytest.raises(APIError) as exc_info:
+            await client.get('/frames.json')
+
+        assert not isinstance(exc_info.value, TransientAPIError)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_bytes_returns_raw_body(self):
+        """get_bytes should return the undecoded response body."""
+        respx.get(f'{BASE_URL}/frames/frame-123/assets.json').mock(
+            return_value=Response(200, content=b'{"assets": []}')
+        )
+
+        client = Client()
+        body = await client.get_bytes('/frames/frame-123/assets.json')
+
+        assert body == b'{"assets": []}'
+
+
+class TestSanitizeForLogging:
+    """Tests for redacting sensitive request data before logging."""
+
+    def test_redacts_nested_sensitive_keys(self):
+        """Sensitive keys should be redacted at any depth, case-insensitively."""
+        from auraframes.client import _sanitize_for_logging
+
+        sanitized = _sanitize_for_logging({
+            'user': {'email': 'test@example.com', 'Password': 'hunter2'},
+            'locale': 'en-US',
+        })
+
+        assert sanitized == {
+            'user': {'email': 'test@example.com', 'Password': '[REDACTED]'},
+            'locale': 'en-US',
+        }
+
+    def test_returns_original_when_nothing_to_redact(self):
+        """Flat payloads without sensitive keys should not be copied."""
+        from auraframes.client import _sanitize_for_logging
+
+        data = {'email': 'test@example.com', 'locale': 'en-US'}
+        assert _sanitize_for_logging(data) is data
+
+    def test_none_passthrough(self):
+        """None should be returned unchanged."""
+        from auraframes.client import _sanitize_for_logging
+
+        assert _sanitize_for_logging(None) is None
@@ -0,0 +1,134 @@
+"""Tests for EXIF writing helpers."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from auraframes.exif import ExifWriter
+
+
+class TestPrewarmLocations:
+    """Tests for ExifWriter.prewarm_locations."""
+
+    @pytest.fixture
+    def geocode(self):
+        """Patch the Nominatim geocoder so no requests are made."""
+        with patch('auraframes.exif.Nominatim') as nominatim:
+            nominatim.return_value.geocode.return_value = MagicMock(longitude=2.35, latitude=48.85)
+            yield nominatim.return_value.geocode
+
+    @pytest.mark.asyncio
+    async def test_geocodes_each_unique_location_once(self, geocode):
+        """Duplicate and empty names should not trigger extra geocoding requests."""
+        exif_writer = ExifWriter(geocode_min_delay=0)
+
+        await exif_writer.prewarm_locations(['Paris', 'Paris', '', None, 'London'])
+
+        assert geocode.call_count == 2
+        assert exif_writer._lookup_gps('Paris') is not None
+        assert geocode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_locations_are_not_geocoded_again(self, geocode):
+        """A name that fails to geocode should be cached rather than requested on every lookup."""
+        geocode.return_value = None
+        exif_writer = ExifWriter(geocode_min_delay=0)
+
+        await exif_writer.prewarm_locations(['Nowhere'])
+
+        assert exif_writer._lookup_gps('Nowhere') is None
+        assert geocode.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_timed_out_locations_are_geocoded_again(self, geocode):
+        """A lookup that errors should not be cached, so the name is retried on the next lookup."""
+        from geopy.exc import GeocoderTimedOut
+
+        location = geocode.return_value
+        geocode.side_effect = GeocoderTimedOut('timed out')
+        exif_writer = ExifWriter(geocode_min_delay=0)
+
+        await exif_writer.prewarm_locations(['Paris'])
+        geocode.side_effect = None
+        geocode.return_value = location
+
+        assert exif_writer._lookup_gps('Paris') is not None
+        # Three timed-out attempts (max_retries=2) and then one successful lookup
+        assert geocode.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_geocoding_is_rate_limited(self, geocode):
+        """Requests should be spaced by the minimum delay, one at a time."""
+        exif_writer = ExifWriter()
+        now = 0.0
+        waits = []
+
+        def fake_sleep(seconds):
+            nonlocal now
+            waits.append(seconds)
+            now += seconds
+
+        with (
+            patch('geopy.extra.rate_limiter.default_timer', side_effect=lambda: now),
+            patch('geopy.extra.rate_limiter.sleep', side_effect=fake_sleep),
+        ):
+            await exif_writer.prewarm_locations(['Paris', 'London', 'Berlin'])
+
+        assert geocode.call_count == 3
+        assert waits == [1.0, 1.0]
+
+
+class TestChangeToRational:
+    """Tests for change_to_rational."""
+
+    @pytest.mark.parametrize('number, expected', [
+        (0, (0, 1)),
+        (48, (48, 1)),
+        (12.5, (25, 2)),
+        (33.12345, (662469, 20000)),
+        (0.00001, (1, 100000)),
+    ])
+    def test_converts_to_reduced_rational(self, number, expected):
+        """Numbers should convert to reduced (numerator, denominator) tuples."""
+        from auraframes.exif import change_to_rational
+
+        assert change_to_rational(number) == expected
+
+
+class TestWriteExif:
+    """Tests for ExifWriter.write_exif."""
+
+    def test_writes_taken_at_and_thumbnail(self, jpeg_bytes, sample_asset_data):
+        """Written EXIF should include the asset timestamp and thumbnail IFD."""
+        import piexif
+
+        from auraframes.exif import THUMBNAIL_IFD
+        from auraframes.models.asset import Asset
+
+        asset = Asset(**sample_asset_data)
+        image = ExifWriter().write_exif(jpeg_bytes, asset, thumbnail=jpeg_bytes, set_gps_ifd=False)
+
+        exif = piexif.load(image.getvalue())
+        assert exif['Exif'][piexif.ExifIFD.DateTimeOriginal] == b'2025:01:01 12:00:00'
+        assert exif['1st'][piexif.ImageIFD.Make] == b'Canon'
+        assert piexif.ImageIFD.JPEGInterchangeFormat not in THUMBNAIL_IFD
+
+    def test_save_with_exif_writes_file(self, jpeg_bytes, sample_asset_data, tmp_path):
+        """save_with_exif should write the image with EXIF directly to the given path."""
+        import piexif
+
+        from auraframes.models.asset import Asset
+
+        path = tmp_path / 'image.jpg'
+        ExifWriter().save_with_exif(jpeg_bytes, Asset(**sample_asset_data), str(path), set_gps_ifd=False)
+
+        exif = piexif.load(str(path))
+        assert exif['0th'][piexif.ImageIFD.DateTime] == b'2025:01:01 12:00:00'
+
+    def test_save_with_exif_keeps_original_on_failure(self, sample_asset_data, tmp_path):
+        """Images piexif can't handle should be written unchanged."""
+        from auraframes.models.asset import Asset
+
+        path = tmp_path / 'image.gif'
+        ExifWriter().save_with_exif(b'GIF89a-not-a-jpeg', Asset(**sample_asset_data), str(path), set_gps_ifd=False)
+
+        assert path.read_bytes() == b'GIF89a-not-a-jpeg'
@@ -0,0 +1,122 @@
+"""Tests for export helpers."""
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from auraframes.export import (
+    close_shared_client,
+    get_image_from_asset,
+    get_shared_client,
+    get_thumbnail,
+)
+from auraframes.models.asset import Asset
+from auraframes.utils.settings import get_settings
+
+
+class TestSharedClient:
+    """Tests for the shared export HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_reused(self):
+        """Repeated calls should return the same pooled client."""
+        try:
+            assert get_shared_client() is get_shared_client()
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_recreated_after_close(self):
+        """Closing the shared client should make the next call create a fresh one."""
+        first = get_shared_client()
+        await close_shared_client()
+
+        second = get_shared_client()
+        try:
+            assert second is not first
+            assert not second.is_closed
+        finally:
+            await close_shared_client()
+
+
+class TestGetImageFromAsset:
+    """Tests for get_image_from_asset."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_downloads_and_writes_image(self, sample_asset_data, tmp_path):
+        """The downloaded image should be written to disk and returned."""
+        asset = Asset(**sample_asset_data)
+        respx.get(f'{get_settings().image_proxy_base_url}/{asset.user_id}/{asset.file_name}').mock(
+            return_value=Response(200, content=b'image-bytes')
+        )
+
+        try:
+            image = await get_image_from_asset(asset, str(tmp_path))
+        finally:
+            await close_shared_client()
+
+        assert image == b'image-bytes'
+        written = list(tmp_path.iterdir())
+        assert len(written) == 1
+        assert written[0].read_bytes() == b'image-bytes'
+
+    @pytest.mark.asyncio
+    async def test_returns_cached_file(self, sample_asset_data, tmp_path):
+        """An existing export should be read from disk without downloading."""
+        asset = Asset(**sample_asset_data)
+        (tmp_path / f"{asset.taken_at_dt.strftime('%Y%m%dT%H%M%S')}-{asset.file_name}").write_bytes(b'cached')
+
+        assert await get_image_from_asset(asset, str(tmp_path)) == b'cached'
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_error_response_is_not_saved(self, sample_asset_data, tmp_path):
+        """An error page from the image proxy should raise instead of being saved as the export."""
+        asset = Asset(**sample_asset_data)
+        respx.get(f'{get_settings().image_proxy_base_url}/{asset.user_id}/{asset.file_name}').mock(
+            return_value=Response(404, content=b'<html>Not Found</html>')
+        )
+
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await get_image_from_asset(asset, str(tmp_path))
+        finally:
+            await close_shared_client()
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestGetThumbnail:
+    """Tests for get_thumbnail."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_returns_downloaded_jpeg(self, sample_asset_data, jpeg_bytes):
+        """A JPEG thumbnail should be returned as downloaded."""
+        asset = Asset(**{**sample_asset_data, 'thumbnail_url': 'https://thumbs.example/asset-123.jpg'})
+        respx.get(asset.thumbnail_url).mock(return_value=Response(200, content=jpeg_bytes))
+
+        try:
+            assert await get_thumbnail(asset) == jpeg_bytes
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_generates_thumbnail_on_error_response(self, sample_asset_data, jpeg_bytes):
+        """A failed thumbnail download should fall back to resizing the original image."""
+        from io import BytesIO
+
+        from PIL import Image
+
+        asset = Asset(**{**sample_asset_data, 'thumbnail_url': 'https://thumbs.example/asset-123.jpg'})
+        respx.get(asset.thumbnail_url).mock(return_value=Response(404, content=b'<html>Not found</html>'))
+
+        try:
+            thumbnail = await get_thumbnail(asset, BytesIO(jpeg_bytes))
+        finally:
+            await close_shared_client()
+
+        with Image.open(BytesIO(thumbnail)) as image:
+            assert image.size == (100, 100)
@@ -91,3 +91,87 @@ class TestFramePartialModel:
         frame = FramePartial()
 
         assert frame is not None
+
+    def test_partial_model_is_cached(self):
+        """Creating a Partial for the same model should reuse the existing class."""
+        from auraframes.models.frame import Frame, FramePartial
+        from auraframes.models.meta import create_partial_model
+
+        assert create_partial_model(Frame) is FramePartial
+
+
+class TestAssetModel:
+    """Tests for the Asset model."""
+
+    def test_identical_paddings_are_shared(self, sample_asset_data):
+        """Equal paddings should resolve to one shared instance across fields and assets."""
+        from auraframes.models.asset import Asset
+
+        padding = {'top': 0.0, 'right': 0.1, 'bottom': 0.0, 'left': 0.1}
+        first = Asset(**{**sample_asset_data, 'landscape_url_padding': padding, 'portrait_url_padding': padding})
+        second = Asset(**{**sample_asset_data, 'landscape_url_padding': dict(padding)})
+
+        assert first.landscape_url_padding is first.portrait_url_padding
+        assert first.landscape_url_padding is second.landscape_url_padding
+
+
+class TestParseResponse:
+    """Tests for building models from API responses."""
+
+    def test_validates_by_default(self, sample_attachment_data):
+        """Responses should be validated unless trusted responses are enabled."""
+        from auraframes.models.parse import parse_response
+
+        del sample_attachment_data['id']
+
+        with pytest.raises(ValidationError):
+            parse_response(Attachment, sample_attachment_data)
+
+    def test_trusted_responses_skip_validation(self, monkeypatch, sample_asset_data):
+        """Trusted responses should be constructed without validation, including nested models."""
+        from auraframes.models.asset import Asset
+        from auraframes.models.parse import parse_response_list
+        from auraframes.models.user import User
+        from auraframes.utils.settings import get_settings
+
+        monkeypatch.setenv('AURA_TRUSTED_RESPONSES', 'true')
+        get_settings.cache_clear()
+        try:
+            assets = parse_response_list(Asset, [sample_asset_data])
+        finally:
+            get_settings.cache_clear()
+
+        assert assets[0].id == 'asset-123'
+        assert isinstance(assets[0].user, User)
+        assert assets[0].user.name == sample_asset_data['user']['name']
+
+    @pytest.mark.parametrize('body', [b'null', b'"error"', b'[]'])
+    def test_trusted_json_must_be_an_object(self, monkeypatch, body):
+        """A trusted body that isn't a JSON object should raise APIError instead of building an empty model."""
+        from auraframes.exceptions import APIError
+        from auraframes.models.asset import AssetPage
+        from auraframes.models.parse import parse_response_json
+        from auraframes.utils.settings import get_settings
+
+        monkeypatch.setenv('AURA_TRUSTED_RESPONSES', 'true')
+        get_settings.cache_clear()
+        try:
+            with pytest.raises(APIError, match='expected a JSON object'):
+                parse_response_json(AssetPage, body)
+        finally:
+            get_settings.cache_clear()
+
+    def test_list_adapter_is_cached(self):
+        """List adapters should be built once per model."""
+        from auraframes.models.parse import list_adapter
+
+        assert list_adapter(Attachment) is list_adapter(Attachment)
+
+    def test_parse_response_list_validates(self, sample_attachment_data):
+        """Lists should be validated into model instances."""
+        from auraframes.models.parse import parse_response_list
+
+        attachments = parse_response_list(Attachment, [sample_attachment_data, sample_attachment_data])
+
+        assert len(attachments) == 2
+        assert all(isinstance(attachment, Attachment) for attachment in attachments)
@@ -1,7 +1,7 @@
 """Tests for CaptionService."""
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from auraframes.services.caption_service import CaptionService
@@ -65,14 +65,14 @@ class TestGetAssetAttachmentsMap:
     @pytest.mark.asyncio
     async def test_fetches_attachments_for_assets(self, caption_service, mock_client):
         """Should return attachments for specified asset IDs."""
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [
                 {'id': 'asset1', 'attachments': [{'id': 'att1', 'type': 'caption'}]},
                 {'id': 'asset2', 'attachments': []},
                 {'id': 'asset3', 'attachments': [{'id': 'att2', 'type': 'caption'}]},
             ],
             'next_page_cursor': None
-        }
+        })
 
         result = await caption_service.get_asset_attachments_map(
             'frame123',
@@ -89,15 +89,15 @@ class TestGetAssetAttachmentsMap:
     @pytest.mark.asyncio
     async def test_handles_pagination(self, caption_service, mock_client):
         """Should paginate through all assets."""
-        mock_client.get.side_effect = [
-            {
+        mock_client.get_bytes.side_effect = [
+            orjson.dumps({
                 'assets': [{'id': 'asset1', 'attachments': []}],
                 'next_page_cursor': 'cursor2'
-            },
-            {
+            }),
+            orjson.dumps({
                 'assets': [{'id': 'asset2', 'attachments': []}],
                 'next_page_cursor': None
-            },
+            }),
         ]
 
         result = await caption_service.get_asset_attachments_map(
@@ -107,7 +107,70 @@ class TestGetAssetAttachmentsMap:
 
         assert 'asset1' in result
         assert 'asset2' in result
-        assert mock_client.get.call_count == 2
+        assert mock_client.get_bytes.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ignores_unused_asset_fields(self, caption_service, mock_client):
+        """Only ids and attachments should be read; null attachments become an empty list."""
+        mock_client.get_bytes.return_value = orjson.dumps({
+            'assets': [{'id': 'asset1', 'file_name': 'a.jpg', 'user': {'id': 'u1'}, 'attachments': None}],
+            'next_page_cursor': None
+        })
+
+        result = await caption_service.get_asset_attachments_map('frame123', {'asset1'})
+
+        assert result == {'asset1': []}
+
+    @pytest.mark.asyncio
+    async def test_stops_once_all_assets_found(self, caption_service, mock_client):
+        """Should not fetch further pages once every requested asset has been seen."""
+        mock_client.get_bytes.return_value = orjson.dumps({
+            'assets': [{'id': 'asset1', 'attachments': []}, {'id': 'asset2', 'attachments': []}],
+            'next_page_cursor': 'cursor2'
+        })
+
+        result = await caption_service.get_asset_attachments_map('frame123', {'asset1'})
+
+        assert result == {'asset1': []}
+        assert mock_client.get_bytes.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_page(self, caption_service, mock_client):
+        """A rate-limited page fetch should be retried rather than failing the scan."""
+        from auraframes.exceptions import TransientAPIError
+
+        mock_client.get_bytes.side_effect = [
+            TransientAPIError('HTTP 429: Too many requests'),
+            orjson.dumps({'assets': [{'id': 'asset1', 'attachments': []}], 'next_page_cursor': None}),
+        ]
+
+        with patch('auraframes.utils.retry.asyncio.sleep', new=AsyncMock()):
+            result = await caption_service.get_asset_attachments_map('frame123', {'asset1'})
+
+        assert result == {'asset1': []}
+        assert mock_client.get_bytes.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_assets_without_id(self, caption_service, mock_client):
+        """An asset missing its id should be skipped rather than failing the whole page."""
+        mock_client.get_bytes.return_value = orjson.dumps({
+            'assets': [{'attachments': [{'id': 'orphan'}]}, {'id': 'asset1', 'attachments': []}],
+            'next_page_cursor': None
+        })
+
+        result = await caption_service.get_asset_attachments_map('frame123', {'asset1'})
+
+        assert result == {'asset1': []}
+
+    @pytest.mark.asyncio
+    async def test_raises_api_error_on_non_json_body(self, caption_service, mock_client):
+        """A non-JSON page should raise APIError rather than a validation error."""
+        from auraframes.exceptions import APIError
+
+        mock_client.get_bytes.return_value = b'<html>Bad Gateway</html>'
+
+        with pytest.raises(APIError, match='Invalid AssetAttachmentsPage response'):
+            await caption_service.get_asset_attachments_map('frame123', {'asset1'})
 
 
 class TestCaptionAlbum:
@@ -118,13 +181,13 @@ class TestCaptionAlbum:
         """Should create captions for all assets in playlist."""
         # Setup mocks
         mock_playlist_api.get_playlist_asset_ids.return_value = (['asset1', 'asset2'], None)
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [
                 {'id': 'asset1', 'attachments': []},
                 {'id': 'asset2', 'attachments': []},
             ],
             'next_page_cursor': None
-        }
+        })
 
         result = await caption_service.caption_album(
             'frame123',
@@ -139,7 +202,7 @@ class TestCaptionAlbum:
     async def test_deletes_existing_captions(self, caption_service, mock_client, mock_playlist_api, mock_attachment_api):
         """Should delete existing captions before creating new ones."""
         mock_playlist_api.get_playlist_asset_ids.return_value = (['asset1'], None)
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [
                 {
                     'id': 'asset1',
@@ -149,7 +212,7 @@ class TestCaptionAlbum:
                 },
             ],
             'next_page_cursor': None
-        }
+        })
 
         await caption_service.caption_album('frame123', 'playlist456', 'New Caption')
 
@@ -162,18 +225,18 @@ class TestCaptionAlbum:
     async def test_progress_callback_phases(self, caption_service, mock_client, mock_playlist_api, mock_attachment_api):
         """Should call progress callback with correct phases."""
         mock_playlist_api.get_playlist_asset_ids.return_value = (['asset1', 'asset2'], None)
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [
                 {'id': 'asset1', 'attachments': []},
                 {'id': 'asset2', 'attachments': []},
             ],
             'next_page_cursor': None
-        }
+        })
 
-        phases_called = []
+        progress_calls = []
 
         def on_progress(phase, current, total):
-            phases_called.append(phase)
+            progress_calls.append((phase, current, total))
 
         await caption_service.caption_album(
             'frame123',
@@ -182,24 +245,26 @@ class TestCaptionAlbum:
             progress_callback=on_progress
         )
 
-        # Should have all three phases
-        assert 'fetching' in phases_called
-        assert 'deleting' in phases_called
-        assert 'captioning' in phases_called
+        # Fetching is followed by a single captioning phase whose progress only moves forward
+        phases_called = [phase for phase, _, _ in progress_calls]
+        assert phases_called[0] == 'fetching'
+        first_captioning = phases_called.index('captioning')
+        assert set(phases_called[first_captioning:]) == {'captioning'}
+        assert [call[1:] for call in progress_calls[first_captioning:]] == [(1, 2), (2, 2)]
 
     @pytest.mark.asyncio
     async def test_include_date_appends_date(self, caption_service, mock_client, mock_playlist_api, mock_attachment_api):
         """Should append date to caption when include_date is True."""
-        # Create mock asset with taken_at_dt property
+        # Create mock asset with an Aura-formatted taken_at
         mock_asset = MagicMock()
         mock_asset.id = 'asset1'
-        mock_asset.taken_at_dt = datetime(2024, 3, 15)
+        mock_asset.taken_at = '2024-03-15T00:00:00.000000Z'
 
         mock_playlist_api.get_playlist_asset_ids.return_value = (['asset1'], None)
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [{'id': 'asset1', 'attachments': []}],
             'next_page_cursor': None
-        }
+        })
 
         async def mock_get_all_assets(frame_id):
             return [mock_asset]
@@ -234,14 +299,14 @@ class TestCaptionAlbum:
     ):
         """Should continue captioning even if some fail."""
         mock_playlist_api.get_playlist_asset_ids.return_value = (['asset1', 'asset2', 'asset3'], None)
-        mock_client.get.return_value = {
+        mock_client.get_bytes.return_value = orjson.dumps({
             'assets': [
                 {'id': 'asset1', 'attachments': []},
                 {'id': 'asset2', 'attachments': []},
                 {'id': 'asset3', 'attachments': []},
             ],
             'next_page_cursor': None
-        }
+        })
 
         # Make asset2 fail
         async def create_caption_side_effect(asset_id, frame_id, caption):
@@ -1,14 +1,27 @@
 """Tests for ImageService."""
+from datetime import datetime
+from typing import NamedTuple
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from auraframes.services.image_service import ImageService
 
 
+class FakeAsset(NamedTuple):
+    """Stand-in for Asset carrying only the fields ImageService reads."""
+    id: str
+    file_name: str = "test.jpg"
+    taken_at_dt: datetime = datetime(2024, 3, 15, 10, 30)
+    location_name: str | None = None
+
+
 @pytest.fixture
 def mock_exif_writer():
     """Create a mock ExifWriter."""
-    return MagicMock()
+    exif_writer = MagicMock()
+    exif_writer.prewarm_locations = AsyncMock()
+    return exif_writer
 
 
 @pytest.fixture
@@ -20,7 +33,7 @@ def image_service(mock_exif_writer):
 @pytest.fixture
 def sample_asset():
     """Create a sample asset for testing."""
-    return MagicMock(id="asset123", file_name="test.jpg")
+    return FakeAsset(id="asset123", file_name="test.jpg")
 
 
 class TestImageServiceInit:
@@ -40,47 +53,78 @@ class TestImageServiceInit:
 class TestDownloadImages:
     """Tests for download_images method."""
 
+    @pytest.fixture
+    def mock_fetch(self):
+        """Patch image fetching to return fake image bytes without a thumbnail."""
+        with patch(
+            'auraframes.services.image_service.fetch_image_from_asset',
+            new_callable=AsyncMock,
+            return_value=(b'image', None)
+        ) as mock_fetch:
+            yield mock_fetch
+
+    @pytest.fixture
+    def mock_write(self):
+        """Patch image writing so nothing touches the filesystem."""
+        with patch('auraframes.services.image_service.write_image_from_asset', new_callable=AsyncMock) as mock_write:
+            yield mock_write
+
     @pytest.mark.asyncio
-    async def test_downloads_all_assets(self, image_service):
-        """Should attempt to download all assets."""
-        assets = [MagicMock(id=f"asset{i}") for i in range(3)]
+    async def test_downloads_all_assets(self, image_service, mock_fetch, mock_write):
+        """Should download and write every asset."""
+        assets = [FakeAsset(f"asset{i}") for i in range(3)]
 
-        with patch('auraframes.services.image_service.get_image_from_asset', new_callable=AsyncMock) as mock_download:
-            failed = await image_service.download_images(assets, "/base/path", max_workers=2)
+        failed = await image_service.download_images(assets, "/base/path", max_workers=2)
 
-            assert len(failed) == 0
-            assert mock_download.call_count == 3
+        assert len(failed) == 0
+        assert mock_fetch.call_count == 3
+        assert mock_write.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_returns_failed_assets(self, image_service):
-        """Should return list of failed assets."""
-        assets = [MagicMock(id=f"asset{i}") for i in range(3)]
+    async def test_returns_failed_assets(self, image_service, mock_fetch, mock_write):
+        """Should return list of assets that failed to download or write."""
+        assets = [FakeAsset(f"asset{i}") for i in range(3)]
 
-        async def fail_on_second(asset, *args, **kwargs):
+        async def fail_download(asset, *args, **kwargs):
             if asset.id == "asset1":
                 raise Exception("Download failed")
+            return b'image', None
+
+        async def fail_write(asset, *args, **kwargs):
+            if asset.id == "asset2":
+                raise OSError("Disk full")
 
-        with patch('auraframes.services.image_service.get_image_from_asset', side_effect=fail_on_second):
-            failed = await image_service.download_images(assets, "/base/path")
+        mock_fetch.side_effect = fail_download
+        mock_write.side_effect = fail_write
 
-            assert len(failed) == 1
-            assert failed[0].id == "asset1"
+        failed = await image_service.download_images(assets, "/base/path")
+
+        assert sorted(asset.id for asset in failed) == ["asset1", "asset2"]
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_exports(self, image_service, mock_fetch, mock_write, sample_asset):
+        """Already exported images should count as complete without downloading."""
+        with patch('auraframes.services.image_service.os.path.isfile', return_value=True):
+            failed = await image_service.download_images([sample_asset], "/base/path")
+
+        assert failed == []
+        mock_fetch.assert_not_called()
+        mock_write.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_calls_progress_callback(self, image_service):
+    async def test_calls_progress_callback(self, image_service, mock_fetch, mock_write):
         """Should call progress callback with correct values."""
-        assets = [MagicMock(id=f"asset{i}") for i in range(3)]
+        assets = [FakeAsset(f"asset{i}") for i in range(3)]
         progress_calls = []
 
         def on_progress(completed, total, failed):
             progress_calls.append((completed, total, failed))
 
-        with patch('auraframes.services.image_service.get_image_from_asset', new_callable=AsyncMock):
-            await image_service.download_images(
-                assets, "/base/path",
-                max_workers=1,
-                progress_callback=on_progress
-            )
+        await image_service.download_images(
+            assets, "/base/path",
+            max_workers=1,
+            progress_callback=on_progress
+        )
 
         # Should have been called 3 times (once per asset)
         assert len(progress_calls) == 3
@@ -90,32 +134,161 @@ class TestDownloadImages:
         assert progress_calls[-1][0] == 3
 
     @pytest.mark.asyncio
-    async def test_limits_concurrency(self, image_service):
-        """Should respect max_workers limit."""
+    async def test_limits_concurrency(self, image_service, mock_fetch, mock_write):
+        """Should respect max_workers limit for downloads."""
         import asyncio
         concurrent_count = 0
         max_concurrent = 0
+        # Each group of three fetches is released together, which only happens if three run at once
+        barrier = asyncio.Barrier(3)
 
         async def track_concurrent(asset, *args, **kwargs):
             nonlocal concurrent_count, max_concurrent
             concurrent_count += 1
             max_concurrent = max(max_concurrent, concurrent_count)
-            await asyncio.sleep(0.01)
+            await barrier.wait()
             concurrent_count -= 1
+            return b'image', None
 
-        assets = [MagicMock(id=f"asset{i}") for i in range(10)]
+        mock_fetch.side_effect = track_concurrent
+        assets = [FakeAsset(f"asset{i}") for i in range(9)]
 
-        with patch('auraframes.services.image_service.get_image_from_asset', side_effect=track_concurrent):
+        async with asyncio.timeout(5):
             await image_service.download_images(assets, "/base/path", max_workers=3)
 
-        # Should never exceed max_workers
-        assert max_concurrent <= 3
+        # Should reach but never exceed max_workers
+        assert max_concurrent == 3
+        assert mock_write.call_count == 9
+
+    @pytest.mark.asyncio
+    async def test_downloads_overlap_writes(self, image_service, mock_fetch, mock_write):
+        """A slow write should not stop the next download from starting."""
+        import asyncio
+        write_started = asyncio.Event()
+        writing = False
+        fetched_during_write = False
+
+        async def slow_write(*args, **kwargs):
+            nonlocal writing
+            writing = True
+            write_started.set()
+            await asyncio.sleep(0.02)
+            writing = False
+
+        async def fetch(asset, *args, **kwargs):
+            nonlocal fetched_during_write
+            if asset.id == "asset1":
+                await write_started.wait()
+                fetched_during_write = writing
+            return b'image', None
+
+        mock_fetch.side_effect = fetch
+        mock_write.side_effect = slow_write
+        assets = [FakeAsset(f"asset{i}") for i in range(2)]
+
+        await image_service.download_images(assets, "/base/path", max_workers=1)
+
+        assert fetched_during_write
+
+    @pytest.mark.asyncio
+    async def test_slow_writes_bound_images_in_memory(self, image_service, mock_fetch, mock_write):
+        """Fetchers should wait for writers rather than holding every downloaded image at once."""
+        import asyncio
+        held = 0
+        max_held = 0
+
+        async def fetch(*args, **kwargs):
+            nonlocal held, max_held
+            held += 1
+            max_held = max(max_held, held)
+            return b'image', None
+
+        async def slow_write(*args, **kwargs):
+            nonlocal held
+            await asyncio.sleep(0)
+            held -= 1
+
+        mock_fetch.side_effect = fetch
+        mock_write.side_effect = slow_write
+        assets = [FakeAsset(f"asset{i}") for i in range(50)]
+
+        await image_service.download_images(assets, "/base/path", max_workers=2)
+
+        # Downloading or waiting to queue, queued, and being written: max_workers each
+        assert max_held <= 3 * 2
+        assert mock_write.call_count == 50
+
+    @pytest.mark.asyncio
+    async def test_prewarm_runs_alongside_downloads(self, image_service, mock_exif_writer, mock_fetch, mock_write):
+        """Downloads should start while asset locations are still being geocoded."""
+        import asyncio
+        fetch_started = asyncio.Event()
+        prewarm_names = []
+
+        async def slow_prewarm(location_names):
+            prewarm_names.extend(location_names)
+            # Only finishes once a download has started, so this hangs if downloads wait for the prewarm
+            await fetch_started.wait()
+
+        async def fetch(*args, **kwargs):
+            fetch_started.set()
+            return b'image', None
+
+        mock_exif_writer.prewarm_locations.side_effect = slow_prewarm
+        mock_fetch.side_effect = fetch
+        assets = [FakeAsset(f"asset{i}", location_name=name) for i, name in enumerate(["Paris", "Paris", None])]
+
+        async with asyncio.timeout(5):
+            await image_service.download_images(assets, "/tmp/test")
+
+        assert prewarm_names == ["Paris", "Paris", None]
+        assert mock_write.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_does_not_prewarm_exported_assets(self, image_service, mock_exif_writer, mock_fetch, mock_write):
+        """Locations of already exported images should not be geocoded."""
+        assets = [FakeAsset("exported", location_name="Paris"), FakeAsset("missing", location_name="London")]
+
+        def is_exported(path):
+            return "exported" in path
+
+        with (
+            patch('auraframes.services.image_service.get_image_path', side_effect=lambda asset, _: asset.id),
+            patch('auraframes.services.image_service.os.path.isfile', side_effect=is_exported),
+        ):
+            await image_service.download_images(assets, "/base/path")
+
+        location_names = mock_exif_writer.prewarm_locations.call_args.args[0]
+        assert list(location_names) == ["London"]
+        assert mock_fetch.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_empty_assets_list(self, image_service):
+    async def test_empty_assets_list(self, image_service, mock_fetch, mock_write):
         """Should handle empty assets list."""
-        with patch('auraframes.services.image_service.get_image_from_asset', new_callable=AsyncMock) as mock_download:
-            failed = await image_service.download_images([], "/base/path")
+        failed = await image_service.download_images([], "/base/path")
+
+        assert failed == []
+        mock_fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reuses_shared_client_across_calls(self, image_service, sample_asset, mock_fetch, mock_write):
+        """Separate calls should download through the same pooled client."""
+        from auraframes.export import close_shared_client
+
+        try:
+            await image_service.download_images([sample_asset], "/base/path")
+            await image_service.download_images([sample_asset], "/base/path")
+        finally:
+            await close_shared_client()
+
+        first_client, second_client = (call.args[2] for call in mock_fetch.call_args_list)
+        assert first_client is second_client
+
+    @pytest.mark.asyncio
+    async def test_uses_provided_client(self, image_service, sample_asset, mock_fetch, mock_write):
+        """A caller-provided client should be used for downloads."""
+        client = MagicMock()
+
+        await image_service.download_images([sample_asset], "/base/path", client=client)
 
-            assert failed == []
-            mock_download.assert_not_called()
+        assert mock_fetch.call_args.args[2] is client
@@ -8,6 +8,7 @@ from auraframes.utils.dt import (
     get_utc_now,
     format_dt_to_aura,
     format_caption_date,
+    format_caption_date_from_aura,
     AURA_DT_FORMAT,
 )
 
@@ -37,15 +38,35 @@ class TestParseAuraDt:
         assert result.minute == 0
         assert result.second == 0
 
-    def test_parse_invalid_format(self):
-        """Should raise ValueError for invalid format."""
+    @pytest.mark.parametrize("dt_str", [
+        "2024-03-15T10:30:45.123456Z",
+        "2024-03-15T10:30:45.123Z",
+        "2024-03-15T10:30:45.1Z",
+        "2024-12-31T23:59:59.999999Z",
+    ])
+    def test_parse_matches_strptime(self, dt_str):
+        """Should give the same naive datetime as parsing with AURA_DT_FORMAT."""
+        assert parse_aura_dt(dt_str) == datetime.strptime(dt_str, AURA_DT_FORMAT)
+        assert parse_aura_dt(dt_str).tzinfo is None
+
+    @pytest.mark.parametrize("dt_str", [
+        "2024-03-15",
+        "not a date",
+        "2024-03-15T10:30:45Z",
+        "2024-03-15T10:30:45.123+00:00",
+        "2024-W11-5T10:30:45.123Z",
+        "2024-02-30T10:30:45.123Z",
+    ])
+    def test_parse_invalid(self, dt_str):
+        """Should raise ValueError for strings not in the Aura format."""
         with pytest.raises(ValueError):
-            parse_aura_dt("2024-03-15")
+            parse_aura_dt(dt_str)
 
-    def test_parse_invalid_string(self):
-        """Should raise ValueError for invalid string."""
-        with pytest.raises(ValueError):
-            parse_aura_dt("not a date")
+    def test_parse_is_cached(self):
+        """Repeated parses of the same string should return the cached datetime."""
+        dt_str = "2024-03-15T10:30:45.123456Z"
+
+        assert parse_aura_dt(dt_str) is parse_aura_dt(dt_str)
 
 
 class TestGetUtcNow:
@@ -57,13 +78,18 @@ class TestGetUtcNow:
 
         assert result.tzinfo == timezone.utc
 
-    def test_returns_recent_time(self):
-        """Should return approximately current time."""
-        before = datetime.now(timezone.utc)
-        result = get_utc_now()
-        after = datetime.now(timezone.utc)
+    def test_returns_current_time(self, monkeypatch):
+        """Should return the current time in UTC."""
+        fixed = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
 
-        assert before <= result <= after
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return fixed.astimezone(tz) if tz else fixed.replace(tzinfo=None)
+
+        monkeypatch.setattr('auraframes.utils.dt.datetime', FrozenDatetime)
+
+        assert get_utc_now() == fixed
 
 
 class TestFormatDtToAura:
@@ -95,23 +121,33 @@ class TestFormatDtToAura:
 class TestFormatCaptionDate:
     """Tests for format_caption_date function."""
 
-    def test_format_date(self):
+    @pytest.mark.parametrize("dt, expected", [
+        (datetime(2024, 3, 15, 10, 30, 45), "March 2024"),
+        (datetime(2025, 1, 1), "January 2025"),
+        (datetime(2023, 12, 31), "December 2023"),
+    ])
+    def test_format_date(self, dt, expected):
         """Should format datetime to month year string."""
-        dt = datetime(2024, 3, 15, 10, 30, 45)
-        result = format_caption_date(dt)
+        assert format_caption_date(dt) == expected
 
-        assert result == "March 2024"
+    def test_matches_strftime_for_every_month(self):
+        """Should give the same month names as strftime in the default C locale."""
+        for month in range(1, 13):
+            dt = datetime(2024, month, 1)
+            assert format_caption_date(dt) == dt.strftime('%B %Y')
 
-    def test_format_january(self):
-        """Should format January correctly."""
-        dt = datetime(2025, 1, 1)
-        result = format_caption_date(dt)
 
-        assert result == "January 2025"
+class TestFormatCaptionDateFromAura:
+    """Tests for format_caption_date_from_aura function."""
 
-    def test_format_december(self):
-        """Should format December correctly."""
-        dt = datetime(2023, 12, 31)
-        result = format_caption_date(dt)
+    def test_matches_parsed_format(self):
+        """Should match formatting the fully parsed datetime."""
+        dt_str = "2025-03-15T10:30:45.123456Z"
 
-        assert result == "December 2023"
+        assert format_caption_date_from_aura(dt_str) == format_caption_date(parse_aura_dt(dt_str))
+        assert format_caption_date_from_aura(dt_str) == "March 2025"
+
+    def test_invalid_string_raises(self):
+        """Should raise ValueError when the string doesn't start with a year and month."""
+        with pytest.raises(ValueError):
+            format_caption_date_from_aura("not a date")
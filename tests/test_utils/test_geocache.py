@@ -0,0 +1,59 @@
+"""Tests for the persistent geocode cache."""
+from unittest.mock import MagicMock, patch
+
+from auraframes.exif import ExifWriter
+from auraframes.utils.geocache import GeocodeCache
+
+
+class TestGeocodeCache:
+    """Tests for GeocodeCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored coordinates should be returned by get."""
+        cache = GeocodeCache(str(tmp_path / 'geocache.sqlite'))
+        cache.set('Paris', 2.35, 48.85)
+
+        assert cache.get('Paris') == (2.35, 48.85)
+        assert cache.get('London') is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Coordinates should survive reopening the database."""
+        path = str(tmp_path / 'geocache.sqlite')
+        GeocodeCache(path).set('Paris', 2.35, 48.85)
+
+        assert GeocodeCache(path).get('Paris') == (2.35, 48.85)
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Entries older than the TTL should be treated as missing."""
+        cache = GeocodeCache(str(tmp_path / 'geocache.sqlite'), ttl_seconds=-1)
+        cache.set('Paris', 2.35, 48.85)
+
+        assert cache.get('Paris') is None
+
+    def test_read_errors_are_treated_as_missing(self, tmp_path):
+        """A database error on read should fall back to a cache miss instead of raising."""
+        cache = GeocodeCache(str(tmp_path / 'geocache.sqlite'))
+        cache.set('Paris', 2.35, 48.85)
+        cache.close()
+
+        assert cache.get('Paris') is None
+
+
+class TestExifWriterDiskCache:
+    """Tests for ExifWriter using the disk cache as a second-level cache."""
+
+    def test_warm_disk_cache_skips_geocoding(self, tmp_path):
+        """A new writer should reuse coordinates geocoded by a previous one."""
+        path = str(tmp_path / 'geocache.sqlite')
+
+        with patch('auraframes.exif.Nominatim') as nominatim:
+            geocode = nominatim.return_value.geocode
+            geocode.return_value = MagicMock(longitude=2.35, latitude=48.85)
+            expected = ExifWriter(cache_path=path, geocode_min_delay=0)._lookup_gps('Paris')
+            geocode.reset_mock()
+
+            second = ExifWriter(cache_path=path, geocode_min_delay=0)
+
+            assert expected is not None
+            assert second._lookup_gps('Paris') == expected
+            geocode.assert_not_called()
@@ -1,10 +1,39 @@
 """Tests for pagination utilities."""
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
 
-from auraframes.exceptions import NetworkError
-from auraframes.utils.pagination import paginate
+from auraframes.exceptions import NetworkError, TransientAPIError
+from auraframes.utils.pagination import MIN_ADAPTIVE_DELAY, iter_pages, paginate, paginate_iter
+
+_real_sleep = asyncio.sleep
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make pagination delays and retry backoff return immediately."""
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
 
+class FakeClock:
+    """Virtual time for pacing tests: sleeps advance the loop clock instantly and are recorded."""
 
+    def __init__(self, monkeypatch):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+        monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: self.now)
+        monkeypatch.setattr(asyncio, "sleep", self.sleep)
+
+    async def sleep(self, seconds, result=None):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        # Still yield to the loop, so other tasks run as they would during a real sleep
+        await _real_sleep(0)
+        return result
+
+
+@pytest.mark.usefixtures("no_sleep")
 class TestPaginate:
     """Tests for paginate function."""
 
@@ -105,6 +134,22 @@ class TestPaginate:
         assert result == [1, 2, 3]
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_retries_on_transient_api_error(self):
+        """Should back off and retry when the API rate limits."""
+        call_count = 0
+
+        async def fetch_fn(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise TransientAPIError("HTTP 429: Too many requests")
+            return [1], None
+
+        result = await paginate(fetch_fn, max_retries=3)
+        assert result == [1]
+        assert call_count == 2
+
     @pytest.mark.asyncio
     async def test_raises_after_max_retries(self):
         """Should raise after max retries exhausted."""
@@ -124,3 +169,137 @@ class TestPaginate:
 
         result = await paginate(fetch_dicts, delay=0.01)
         assert result == [{"id": 1}, {"id": 2}]
+
+
+class TestIterPages:
+    """Tests for iter_pages function."""
+
+    @pytest.mark.asyncio
+    async def test_yields_pages(self):
+        """Should yield each page's items in order."""
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            if cursor is None:
+                return [1, 2], "page2"
+            return [3], None
+
+        pages = [page async for page in iter_pages(fetch_fn, delay=0)]
+        assert pages == [[1, 2], [3]]
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page(self):
+        """Should start fetching the next page before the caller finishes with the current one."""
+        requested = []
+
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            requested.append(cursor)
+            if cursor is None:
+                return [1], "page2"
+            return [2], None
+
+        async for page in iter_pages(fetch_fn, delay=0):
+            if page == [1]:
+                await asyncio.sleep(0.01)
+                assert requested == [None, "page2"]
+
+    @pytest.mark.asyncio
+    async def test_delay_overlaps_processing(self, monkeypatch):
+        """Time spent processing a page should count towards the delay before the next request."""
+        clock = FakeClock(monkeypatch)
+        request_times = []
+
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            request_times.append(clock.now)
+            if cursor is None:
+                return [1], "page2"
+            return [2], None
+
+        async for _ in iter_pages(fetch_fn, delay=0.05, adaptive=False):
+            await asyncio.sleep(0.02)
+
+        # Processing the first page (0.02s) leaves only 0.03s of the delay to wait before the next request
+        assert clock.sleeps == [0.02, pytest.approx(0.03), 0.02]
+        assert request_times == [0.0, pytest.approx(0.05)]
+
+    @pytest.mark.asyncio
+    async def test_adaptive_delay_follows_response_time(self, monkeypatch):
+        """With fast responses, pages should be requested at the adaptive floor rather than the fixed delay."""
+        clock = FakeClock(monkeypatch)
+
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            page = 0 if cursor is None else int(cursor)
+            return [page], str(page + 1) if page < 3 else None
+
+        pages = [page async for page in iter_pages(fetch_fn, delay=1.0)]
+
+        assert pages == [[0], [1], [2], [3]]
+        assert clock.sleeps == pytest.approx([MIN_ADAPTIVE_DELAY] * 3)
+
+    @pytest.mark.asyncio
+    async def test_fixed_delay_without_adaptive(self, monkeypatch):
+        """Without adaptive pacing, every request after the first should wait the full delay."""
+        clock = FakeClock(monkeypatch)
+
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            page = 0 if cursor is None else int(cursor)
+            return [page], str(page + 1) if page < 3 else None
+
+        pages = [page async for page in iter_pages(fetch_fn, delay=1.0, adaptive=False)]
+
+        assert pages == [[0], [1], [2], [3]]
+        assert clock.sleeps == pytest.approx([1.0] * 3)
+
+    @pytest.mark.asyncio
+    async def test_cancels_prefetch_when_stopped_early(self):
+        """Should cancel the in-flight prefetch if the caller stops iterating."""
+        started = asyncio.Event()
+        cancelled = False
+
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            nonlocal cancelled
+            if cursor is None:
+                return [1], "page2"
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return [2], None
+
+        pages = iter_pages(fetch_fn, delay=0)
+        async for _ in pages:
+            await started.wait()
+            break
+        await pages.aclose()
+        await asyncio.sleep(0)
+        assert cancelled
+
+
+class TestPaginateIter:
+    """Tests for paginate_iter function."""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_across_pages(self):
+        """Should yield every item from every page in order."""
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            if cursor is None:
+                return [1, 2], "page2"
+            return [3], None
+
+        assert [item async for item in paginate_iter(fetch_fn, delay=0)] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_yields_before_last_page(self):
+        """First-page items should be available before later pages are fetched."""
+        release = asyncio.Event()
+
+        async def fetch_fn(*args, cursor=None, **kwargs):
+            if cursor is None:
+                return [1], "page2"
+            await release.wait()
+            return [2], None
+
+        items = paginate_iter(fetch_fn, delay=0)
+        assert await anext(items) == 1
+        release.set()
+        assert [item async for item in items] == [2]
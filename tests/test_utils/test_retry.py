@@ -1,9 +1,21 @@
 """Tests for retry utilities."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
-from auraframes.exceptions import NetworkError
+from auraframes.exceptions import NetworkError, TransientAPIError
 from auraframes.utils.retry import with_retry, retry
 
+# Kept for tests that need real suspension points; asyncio.sleep itself is stubbed out below
+_real_sleep = asyncio.sleep
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Make retry backoff return immediately so tests only exercise the retry control flow."""
+    monkeypatch.setattr("auraframes.utils.retry.asyncio.sleep", AsyncMock())
+
 
 class TestWithRetry:
     """Tests for with_retry function."""
@@ -128,6 +140,81 @@ class TestWithRetry:
         result = await with_retry(add, 1, 2, c=3, max_retries=1)
         assert result == 6
 
+    @pytest.mark.asyncio
+    async def test_jittered_delay_capped_at_max_delay(self):
+        """Waits should be jittered below the backoff delay, which never exceeds max_delay."""
+        async def always_fail():
+            raise NetworkError("Connection failed")
+
+        with patch("auraframes.utils.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+                patch("auraframes.utils.retry.random.uniform", side_effect=lambda low, high: high) as mock_uniform:
+            with pytest.raises(NetworkError):
+                await with_retry(always_fail, max_retries=4, initial_delay=1.0, backoff_factor=2.0, max_delay=3.0)
+
+        assert [c.args for c in mock_uniform.call_args_list] == [(0, 1.0), (0, 2.0), (0, 3.0), (0, 3.0)]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 3.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_uses_retry_after_hint(self):
+        """A retry_after hint on the exception should replace the computed backoff."""
+        call_count = 0
+
+        async def rate_limited_then_succeed():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise TransientAPIError("HTTP 429: Too many requests", retry_after=7.0)
+            return "success"
+
+        with patch("auraframes.utils.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await with_retry(rate_limited_then_succeed, max_retries=3, initial_delay=0.01)
+
+        assert result == "success"
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_retry_after_hint_is_capped_at_max_delay(self):
+        """A very long retry_after hint should not wait longer than max_delay."""
+        call_count = 0
+
+        async def rate_limited_then_succeed():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise TransientAPIError("HTTP 429: Too many requests", retry_after=3600.0)
+            return "success"
+
+        with patch("auraframes.utils.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await with_retry(rate_limited_then_succeed, max_delay=30.0)
+
+        assert result == "success"
+        mock_sleep.assert_awaited_once_with(30.0)
+
+    @pytest.mark.asyncio
+    async def test_semaphore_limits_concurrent_attempts(self):
+        """Attempts sharing a semaphore should not run more than its limit at once."""
+        semaphore = asyncio.Semaphore(2)
+        running = 0
+        peak = 0
+        call_count = 0
+
+        async def flaky():
+            nonlocal running, peak, call_count
+            running += 1
+            peak = max(peak, running)
+            call_count += 1
+            await _real_sleep(0.01)
+            running -= 1
+            if call_count <= 5:
+                raise NetworkError("Connection failed")
+            return "success"
+
+        results = await asyncio.gather(*(
+            with_retry(flaky, max_retries=3, initial_delay=0.01, semaphore=semaphore) for _ in range(5)
+        ))
+        assert results == ["success"] * 5
+        assert peak == 2
+
 
 class TestRetryDecorator:
     """Tests for retry decorator."""
@@ -184,3 +271,33 @@ class TestRetryDecorator:
         result = await fail_then_succeed()
         assert result == "success"
         assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_decorator_concurrency(self):
+        """Decorator concurrency should be shared by all calls of the function."""
+        running = 0
+        peak = 0
+
+        @retry(max_retries=1, concurrency=3)
+        async def call():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await _real_sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(call() for _ in range(10)))
+        assert peak == 3
+
+    def test_decorator_concurrency_across_event_loops(self):
+        """A decorated function should be usable from more than one event loop."""
+        @retry(max_retries=1, concurrency=1)
+        async def call():
+            await _real_sleep(0)
+
+        async def contend():
+            # Two calls at once make the second wait on the semaphore, tying it to this loop
+            await asyncio.gather(call(), call())
+
+        asyncio.run(contend())
+        asyncio.run(contend())
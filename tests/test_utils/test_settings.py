@@ -0,0 +1,21 @@
+"""Tests for settings."""
+from auraframes.utils import settings
+from auraframes.utils.settings import get_settings
+
+
+class TestLegacyConstants:
+    """Tests for the legacy module-level settings constants."""
+
+    def test_follows_reloaded_settings(self, monkeypatch):
+        """Legacy constants should reflect settings reloaded with get_settings.cache_clear()."""
+        monkeypatch.setenv('AURA_LOCALE', 'en-US')
+        get_settings.cache_clear()
+        try:
+            assert settings.LOCALE == 'en-US'
+
+            monkeypatch.setenv('AURA_LOCALE', 'fr-FR')
+            get_settings.cache_clear()
+
+            assert settings.LOCALE == 'fr-FR'
+        finally:
+            get_settings.cache_clear()
@@ -21,25 +21,18 @@ class TestValidateEmail:
         validate_email("test.user@domain.org")
         validate_email("a@b.co")
 
-    def test_invalid_email_no_at(self):
-        """Email without @ should raise ValidationError."""
+    @pytest.mark.parametrize("email", [
+        pytest.param("userexample.com", id="no-at"),
+        pytest.param("user@", id="no-domain"),
+        pytest.param("", id="empty"),
+        pytest.param("user @example.com", id="with-spaces"),
+        pytest.param("user@example.com\n", id="trailing-newline"),
+        pytest.param("a" * 310 + "@example.com", id="too-long"),
+    ])
+    def test_invalid_email(self, email):
+        """Malformed emails should raise ValidationError."""
         with pytest.raises(ValidationError, match="Invalid email format"):
-            validate_email("userexample.com")
-
-    def test_invalid_email_no_domain(self):
-        """Email without domain should raise ValidationError."""
-        with pytest.raises(ValidationError, match="Invalid email format"):
-            validate_email("user@")
-
-    def test_invalid_email_empty(self):
-        """Empty email should raise ValidationError."""
-        with pytest.raises(ValidationError, match="Invalid email format"):
-            validate_email("")
-
-    def test_invalid_email_with_spaces(self):
-        """Email with spaces should raise ValidationError."""
-        with pytest.raises(ValidationError, match="Invalid email format"):
-            validate_email("user @example.com")
+            validate_email(email)
 
 
 class TestValidatePassword: